@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:23
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0003_alter_chartofaccount_account'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='historicalaccounts',
+            name='balance',
+        ),
+    ]
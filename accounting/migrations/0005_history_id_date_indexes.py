@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0004_remove_historicalaccounts_balance'),
+        ('master', '0002_history_id_date_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='historicalaccounts',
+            index=models.Index(fields=['id', 'history_date'], name='accounting__id_e94b6b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalactors',
+            index=models.Index(fields=['id', 'history_date'], name='accounting__id_552910_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalbankaccount',
+            index=models.Index(fields=['id', 'history_date'], name='accounting__id_a61260_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalcashtransfer',
+            index=models.Index(fields=['id', 'history_date'], name='accounting__id_c7baf9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalchartofaccount',
+            index=models.Index(fields=['id', 'history_date'], name='accounting__id_4e8f68_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalchequeregister',
+            index=models.Index(fields=['id', 'history_date'], name='accounting__id_78bb8d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicaljournalvoucher',
+            index=models.Index(fields=['id', 'history_date'], name='accounting__id_13c4fb_idx'),
+        ),
+    ]
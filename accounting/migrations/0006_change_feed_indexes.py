@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:44
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0005_history_id_date_indexes'),
+        ('master', '0002_history_id_date_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='accounts',
+            index=models.Index(fields=['branch', 'updated', 'id'], name='accounting__branch__02caf0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='actors',
+            index=models.Index(fields=['branch', 'updated', 'id'], name='accounting__branch__c10582_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bankaccount',
+            index=models.Index(fields=['branch', 'updated', 'id'], name='accounting__branch__76c0b3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cashtransfer',
+            index=models.Index(fields=['branch', 'updated', 'id'], name='accounting__branch__1aaf9e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='chartofaccount',
+            index=models.Index(fields=['branch', 'updated', 'id'], name='accounting__branch__24d1b5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='chequeregister',
+            index=models.Index(fields=['branch', 'updated', 'id'], name='accounting__branch__66989f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='journalvoucher',
+            index=models.Index(fields=['branch', 'updated', 'id'], name='accounting__branch__356746_idx'),
+        ),
+    ]
@@ -29,7 +29,10 @@ class Accounts(BranchScopedStampedOwnedActive):
     account_class = models.CharField(max_length=200)  # 'coa', 'bank', 'actor'
     balance = models.DecimalField(max_digits=18, decimal_places=2, default=0)
 
-    class Meta:
+    # Balance is a running total driven by postings; the postings carry the audit trail.
+    history_excluded_fields = ("balance",)
+
+    class Meta(BranchScopedStampedOwnedActive.Meta):
         constraints = [
             models.UniqueConstraint(fields=["branch", "code"], name="uniq_accounts_code_per_branch"),
         ]
@@ -71,7 +74,7 @@ class ChartofAccount(BranchScopedStampedOwnedActive):
     is_group = models.BooleanField(default=False)
     is_system = models.BooleanField(default=False)
 
-    class Meta:
+    class Meta(BranchScopedStampedOwnedActive.Meta):
         constraints = [
             models.UniqueConstraint(fields=["branch", "code"], name="uniq_coa_code_per_branch"),
         ]
@@ -109,7 +112,7 @@ class BankAccount(BranchScopedStampedOwnedActive):
     )
     description = models.TextField(null=True, blank=True)
 
-    class Meta:
+    class Meta(BranchScopedStampedOwnedActive.Meta):
         constraints = [
             models.UniqueConstraint(fields=["branch", "code"], name="uniq_bankaccount_code_per_branch"),
         ]
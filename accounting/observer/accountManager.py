@@ -3,6 +3,9 @@ from __future__ import annotations
 import re
 from django.db import transaction
 
+from core.utils.instrumentation import timed_function
+from core.utils.userSession import get_current_user
+
 _NUM_RE = re.compile(r"(\d+)$")
 
 
@@ -10,13 +13,16 @@ def _clean(s):
     return (s or "").strip()
 
 
-def _next_accounts_prefixed_code(Accounts, *, branch_id, prefix: str, width: int = 5) -> str:
+def allocate_accounts_prefixed_codes(
+    Accounts, *, branch_id, prefix: str, count: int, width: int = 5, using: str = "default"
+) -> list[str]:
     """
-    Creates next Accounts.code like AT00001 (for actor accounts).
+    Reserves `count` consecutive Accounts.code values after the highest one with
+    `prefix` (e.g. AT00001..AT00050). One locked scan, however many codes.
     """
-    with transaction.atomic():
+    with transaction.atomic(using=using):
         qs = (
-            Accounts.objects.select_for_update()
+            Accounts.objects.using(using).select_for_update()
             .filter(branch_id=branch_id, code__startswith=prefix)
             .exclude(code__isnull=True)
             .exclude(code="")
@@ -31,10 +37,18 @@ def _next_accounts_prefixed_code(Accounts, *, branch_id, prefix: str, width: int
                     n = int(m.group(1)) + 1
                 except Exception:
                     n = 1
-        return f"{prefix}{str(n).zfill(width)}"
+        return [f"{prefix}{str(n + i).zfill(width)}" for i in range(count)]
+
+
+def _next_accounts_prefixed_code(Accounts, *, branch_id, prefix: str, width: int = 5) -> str:
+    """
+    Creates next Accounts.code like AT00001 (for actor accounts).
+    """
+    return allocate_accounts_prefixed_codes(Accounts, branch_id=branch_id, prefix=prefix, count=1, width=width)[0]
 
 
 @transaction.atomic
+@timed_function("observer.sync_accounts.coa")
 def sync_accounts_for_coa(coa_instance) -> None:
     """
     Ensure ChartofAccount.account => Accounts(code=coa.code, name=coa.name, class='coa', balance=0 on create only)
@@ -50,7 +64,7 @@ def sync_accounts_for_coa(coa_instance) -> None:
 
     desired_class = "coa"
     active = getattr(coa_instance, "active", True)
-    user_add = getattr(coa_instance, "user_add", None)
+    user_add_id = getattr(coa_instance, "user_add_id", None) or get_current_user()
 
     linked = getattr(coa_instance, "account", None)
 
@@ -97,13 +111,14 @@ def sync_accounts_for_coa(coa_instance) -> None:
         name=name,
         account_class=desired_class,
         balance=0,
-        user_add=user_add,
+        user_add_id=user_add_id,
         active=active,
     )
     coa_instance.account = acc
 
 
 @transaction.atomic
+@timed_function("observer.sync_accounts.bank_account")
 def sync_accounts_for_bank_account(bank_instance) -> None:
     """
     Ensure BankAccount.main_account => Accounts(code=bank.code, name=bank.display_name, class='bank', balance=0 on create only)
@@ -119,7 +134,7 @@ def sync_accounts_for_bank_account(bank_instance) -> None:
 
     desired_class = "bank"
     active = getattr(bank_instance, "active", True)
-    user_add = getattr(bank_instance, "user_add", None)
+    user_add_id = getattr(bank_instance, "user_add_id", None) or get_current_user()
 
     linked = getattr(bank_instance, "main_account", None)
 
@@ -166,13 +181,14 @@ def sync_accounts_for_bank_account(bank_instance) -> None:
         name=name,
         account_class=desired_class,
         balance=0,
-        user_add=user_add,
+        user_add_id=user_add_id,
         active=active,
     )
     bank_instance.main_account = acc
 
 
 @transaction.atomic
+@timed_function("observer.sync_accounts.actor")
 def sync_accounts_for_actor(actor_instance) -> None:
     """
     Ensure Actors.account => Accounts(code=AT00001..., name=actor.name, class='actor', balance=0 on create only)
@@ -187,7 +203,7 @@ def sync_accounts_for_actor(actor_instance) -> None:
 
     desired_class = "actor"
     active = getattr(actor_instance, "active", True)
-    user_add = getattr(actor_instance, "user_add", None)
+    user_add_id = getattr(actor_instance, "user_add_id", None) or get_current_user()
 
     linked = getattr(actor_instance, "account", None)
 
@@ -218,7 +234,7 @@ def sync_accounts_for_actor(actor_instance) -> None:
         name=name,
         account_class=desired_class,
         balance=0,
-        user_add=user_add,
+        user_add_id=user_add_id,
         active=active,
     )
     actor_instance.account = acc
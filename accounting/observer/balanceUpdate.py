@@ -4,6 +4,9 @@ from decimal import Decimal
 from typing import Dict
 from django.db import transaction
 from django.db.models import F
+from django.utils import timezone
+
+from core.utils.instrumentation import timed_function
 
 
 def _d(v) -> Decimal:
@@ -29,9 +32,11 @@ def _apply_deltas(account_deltas: Dict[str, Decimal]) -> None:
     ids = list(account_deltas.keys())
     with transaction.atomic():
         list(Accounts.objects.select_for_update().filter(id__in=ids).values_list("id", flat=True))
+        # update() skips auto_now; stamp `updated` so the change feed serves the new balance.
+        now = timezone.now()
         for acc_id, delta in account_deltas.items():
             if delta:
-                Accounts.objects.filter(id=acc_id).update(balance=F("balance") + delta)
+                Accounts.objects.filter(id=acc_id).update(balance=F("balance") + delta, updated=now)
 
 
 # ---------------------- CashTransfer ----------------------
@@ -67,6 +72,7 @@ def _cashtransfer_deltas(ct_id) -> Dict[str, Decimal]:
     return deltas
 
 
+@timed_function("posting.cash_transfer")
 def handle_cashtransfer_posting(instance, old_instance=None) -> None:
     old_posted = _is_posted(old_instance) if old_instance else False
     new_posted = _is_posted(instance)
@@ -98,6 +104,7 @@ def _journalvoucher_deltas(jv_id) -> Dict[str, Decimal]:
     return deltas
 
 
+@timed_function("posting.journal_voucher")
 def handle_journalvoucher_posting(instance, old_instance=None) -> None:
     old_posted = _is_posted(old_instance) if old_instance else False
     new_posted = _is_posted(instance)
@@ -185,6 +192,7 @@ def _chequeregister_deltas(cr_id, old_instance=None) -> Dict[str, Decimal]:
     return {bank_main_id: -amt, other_acc_id: +amt}
 
 
+@timed_function("posting.cheque_register")
 def handle_chequeregister_posting(instance, old_instance=None) -> None:
     old_posted = _is_cheque_posted(old_instance) if old_instance else False
     new_posted = _is_cheque_posted(instance)
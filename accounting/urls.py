@@ -2,7 +2,9 @@ from django.urls import include, path
 from rest_framework_bulk.routes import BulkRouter
 
 from accounting.views import (
+    AccountsAsyncListView,
     AccountsViewSet,
+    AccountingActorAsyncListView,
     AccountingActorViewSet,
     BankAccountViewSet,
     CashTransferItemViewSet,
@@ -25,5 +27,7 @@ router.register(r"journal-vouchers", JournalVoucherViewSet, basename="journal-vo
 router.register(r"journal-voucher-items", JournalVoucherItemViewSet, basename="journal-voucher-item")
 
 urlpatterns = [
+    path("async/accounts/", AccountsAsyncListView.as_view(), name="accounts-async-list"),
+    path("async/actors/", AccountingActorAsyncListView.as_view(), name="accounting-actor-async-list"),
     path("", include(router.urls)),
 ]
@@ -35,6 +35,7 @@ from accounting.serializers import (
     JournalVoucherSerializer,
 )
 from core.utils.BaseModelViewSet import BaseModelViewSet
+from core.utils.asyncViews import AsyncListView
 
 
 class AccountsViewSet(BaseModelViewSet):
@@ -116,3 +117,21 @@ class JournalVoucherItemViewSet(BaseModelViewSet):
     filterset_class = JournalVoucherItemFilter
     search_fields = ["line_note"]
     ordering_fields = ["created", "dr_amount", "cr_amount"]
+
+
+class AccountsAsyncListView(AsyncListView):
+    queryset = Accounts.objects.all()
+    serializer_class = AccountsSerializer
+    filter_fields = ["branch", "account_class", "active", "code"]
+    search_fields = ["name", "code"]
+    ordering_fields = ["name", "code", "created"]
+    ordering = ["code"]
+
+
+class AccountingActorAsyncListView(AsyncListView):
+    queryset = Actors.objects.all()
+    serializer_class = AccountingActorSerializer
+    filter_fields = ["branch", "active"]
+    search_fields = ["name"]
+    ordering_fields = ["name", "created"]
+    ordering = ["name"]
@@ -0,0 +1,273 @@
+"""
+Bulk actor import.
+
+Saving a party row one at a time runs the whole observer chain per row
+(MainActor upsert, accounting Actors get_or_create, ledger Accounts with a
+locked AT-code scan). bulk_import_actors does the same work for N rows with
+a fixed number of statements per batch: party rows, Customer person/company
+rows, MainActor rows, ledger Accounts (AT codes reserved in one scan) and
+accounting Actors, all through bulk_create, with history rows written in bulk.
+
+The per-row signals do not fire, so everything they maintain is built here.
+Each MainActor is linked to its own accounting actor, adopting an unlinked
+one with the same name when it exists, as the signals do.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+
+from actors.models import (
+    BookingAgency,
+    Carrier,
+    Customer,
+    CustomerCompany,
+    CustomerPerson,
+    CustomsAgent,
+    Department,
+    Designation,
+    Employee,
+    MainActor,
+    Vendor,
+)
+from actors.utils import actor_directory_fields, name_fields
+from core.utils.historyPolicy import bulk_create_with_history
+
+# model -> (MainActor link field, actor type); mirrors actors.signals.ACTOR_SIGNAL_MAP.
+BULK_ACTOR_MODELS = {
+    BookingAgency: ("booking_agency", MainActor.ActorType.BOOKING_AGENCY),
+    Carrier: ("carrier", MainActor.ActorType.CARRIER),
+    CustomsAgent: ("customs_agent", MainActor.ActorType.CUSTOMS_AGENT),
+    Vendor: ("vendor", MainActor.ActorType.VENDOR),
+    Customer: ("customer", MainActor.ActorType.CUSTOMER),
+    Department: ("department", MainActor.ActorType.DEPARTMENT),
+    Designation: ("designation", MainActor.ActorType.DESIGNATION),
+    Employee: ("employee", MainActor.ActorType.EMPLOYEE),
+}
+
+# Nested one-to-one rows accepted on Customer imports.
+CUSTOMER_DETAIL_MODELS = {"person": CustomerPerson, "company": CustomerCompany}
+
+# Set on the import, never taken from the rows.
+_MANAGED_FIELDS = {"id", "branch", "user_add", "created", "updated"}
+
+
+@dataclass
+class BulkImportResult:
+    created: int = 0
+    main_actors: int = 0
+    accounting_actors: int = 0
+    accounts: int = 0
+    reused_accounting_actors: int = 0
+    ids: list = field(default_factory=list)
+
+
+def _field_map(model, exclude=()):
+    """
+    Accepted row keys -> field: concrete fields by name, and FKs by attname too.
+    """
+    mapping = {}
+    for f in model._meta.concrete_fields:
+        if f.name in _MANAGED_FIELDS or f.name in exclude:
+            continue
+        mapping[f.name] = f
+        if f.is_relation:
+            mapping[f.attname] = f
+    return mapping
+
+
+def _build(model, row: dict, exclude=()):
+    """
+    Unsaved instance from `row` plus its field errors (no queries; FKs are checked in bulk later).
+    """
+    fields = _field_map(model, exclude)
+    errors = {}
+    values = {}
+    for key, value in row.items():
+        f = fields.get(key)
+        if f is None:
+            errors[key] = ["Unknown field."]
+            continue
+        value = value.pk if isinstance(value, models.Model) else value
+        if f.is_relation and value is not None:
+            try:
+                value = f.target_field.to_python(value)
+            except ValidationError as e:
+                errors[f.name] = e.messages
+                continue
+        values[f.attname] = value
+
+    instance = model(**values)
+    if isinstance(instance, Employee):
+        instance.copy_present_address()  # Employee.save() does this per row.
+    skip = [f.name for f in model._meta.concrete_fields if f.is_relation or f.name in _MANAGED_FIELDS or f.name in exclude]
+    try:
+        instance.clean_fields(exclude=skip)
+    except ValidationError as e:
+        errors.update(e.message_dict)
+    for f in model._meta.concrete_fields:
+        if f.is_relation and f.name not in _MANAGED_FIELDS and f.name not in exclude:
+            if getattr(instance, f.attname) is None and not f.null:
+                errors.setdefault(f.name, []).append("This field is required.")
+    return instance, errors
+
+
+def _check_foreign_keys(model, instances, errors, using):
+    """
+    One existence query per FK column for the whole batch.
+    """
+    for f in model._meta.concrete_fields:
+        if not f.is_relation or f.name in _MANAGED_FIELDS:
+            continue
+        wanted = {getattr(obj, f.attname) for obj in instances} - {None}
+        if not wanted:
+            continue
+        related = f.related_model._default_manager.using(using)
+        found = {str(pk) for pk in related.filter(pk__in=wanted).values_list("pk", flat=True)}
+        for index, obj in enumerate(instances):
+            value = getattr(obj, f.attname)
+            if value is not None and str(value) not in found:
+                errors.setdefault(f"{index}.{f.name}", []).append(f"Unknown {f.related_model._meta.verbose_name}: {value}.")
+
+
+def _check_unique_constraints(model, instances, errors, using):
+    """
+    Reports rows clashing on a unique constraint, with each other or with stored
+    rows, before anything is written: one query per constraint.
+    """
+    for constraint in model._meta.constraints:
+        if not isinstance(constraint, models.UniqueConstraint) or not constraint.fields or constraint.condition is not None:
+            continue
+        attnames = [model._meta.get_field(name).attname for name in constraint.fields]
+        # Errors go on the first non-branch column, e.g. "3.name".
+        label = next((name for name in constraint.fields if name != "branch"), constraint.fields[0])
+        position = constraint.fields.index(label)
+        keys = [tuple(getattr(obj, attname) for attname in attnames) for obj in instances]
+        wanted = {key[position] for key in keys if None not in key}
+        if not wanted:
+            continue
+        stored = model._default_manager.using(using).filter(**{f"{attnames[position]}__in": wanted})
+        existing = set(stored.values_list(*attnames))
+        seen = set()
+        for index, key in enumerate(keys):
+            if None in key:
+                continue  # NULLs never collide.
+            if key in existing:
+                errors.setdefault(f"{index}.{label}", []).append(f"A {model._meta.verbose_name} with this {label} already exists.")
+            elif key in seen:
+                errors.setdefault(f"{index}.{label}", []).append(f"Duplicates an earlier row's {label}.")
+            seen.add(key)
+
+
+def _display_name(instance, details):
+    if isinstance(instance, Customer):
+        detail = details.get(instance.pk)
+        if isinstance(detail, CustomerPerson):
+            return detail.full_name
+        if isinstance(detail, CustomerCompany):
+            return detail.company_name
+    return str(instance)
+
+
+def bulk_import_actors(model, rows, *, branch, batch_size=1000, using="default") -> BulkImportResult:
+    """
+    Creates `rows` (dicts of model field values) as `model` in `branch`, with their
+    MainActor, accounting Actors and ledger Accounts. Validates everything first;
+    raises ValidationError({"<row index>.<field>": messages}) and writes nothing
+    if any row is bad.
+    """
+    from accounting.models import Accounts, Actors as AccountingActor
+    from accounting.observer.accountManager import allocate_accounts_prefixed_codes
+
+    if model not in BULK_ACTOR_MODELS:
+        raise ValueError(f"{model._meta.label} does not support bulk import.")
+    link_field, actor_type = BULK_ACTOR_MODELS[model]
+
+    rows = list(rows)
+    instances, details, errors = [], {}, {}
+    for index, row in enumerate(rows):
+        row = dict(row)
+        nested = {key: row.pop(key) for key in CUSTOMER_DETAIL_MODELS if model is Customer and key in row}
+        instance, row_errors = _build(model, row)
+        if len(nested) > 1:
+            row_errors["company"] = ["Give either person or company, not both."]
+            nested = {}
+        instance.branch = branch
+        for key, detail_row in nested.items():
+            detail, detail_errors = _build(CUSTOMER_DETAIL_MODELS[key], detail_row or {}, exclude=("customer",))
+            detail.customer = instance
+            details[instance.pk] = detail
+            row_errors.update({f"{key}.{name}": messages for name, messages in detail_errors.items()})
+        errors.update({f"{index}.{name}": messages for name, messages in row_errors.items()})
+        instances.append(instance)
+
+    _check_foreign_keys(model, instances, errors, using)
+    _check_unique_constraints(model, instances, errors, using)
+    if errors:
+        raise ValidationError(errors)
+
+    result = BulkImportResult()
+    with transaction.atomic(using=using):
+        for start in range(0, len(instances), batch_size):
+            batch = instances[start:start + batch_size]
+            bulk_create_with_history(batch, model, batch_size=batch_size)
+            for detail_model in CUSTOMER_DETAIL_MODELS.values():
+                batch_details = [details[obj.pk] for obj in batch if isinstance(details.get(obj.pk), detail_model)]
+                if batch_details:
+                    detail_model.objects.using(using).bulk_create(batch_details, batch_size=batch_size)
+
+            names = {obj.pk: _display_name(obj, details) for obj in batch}
+
+            # Adopt unlinked accounting actors with the same name (as _sync_accounting_actor
+            # does), one per MainActor; everything else gets a new actor and ledger account.
+            reusable = {}
+            for actor in (
+                AccountingActor.objects.using(using)
+                .filter(branch=branch, name__in=set(names.values()), main_actor__isnull=True)
+                .order_by("created")
+            ):
+                reusable.setdefault(actor.name, []).append(actor)
+            linked = {}
+            for obj in batch:
+                candidates = reusable.get(names[obj.pk])
+                if candidates:
+                    linked[obj.pk] = candidates.pop(0)
+            reused = len(linked)
+
+            new_pks = [obj.pk for obj in batch if obj.pk not in linked and names[obj.pk]]
+            codes = allocate_accounts_prefixed_codes(
+                Accounts, branch_id=branch.pk, prefix="AT", count=len(new_pks), using=using
+            )
+            accounts = [
+                Accounts(branch=branch, code=code, name=names[pk], account_class="actor", balance=0)
+                for code, pk in zip(codes, new_pks)
+            ]
+            bulk_create_with_history(accounts, Accounts, batch_size=batch_size)
+            accounting_actors = [AccountingActor(branch=branch, name=acc.name, account=acc) for acc in accounts]
+            bulk_create_with_history(accounting_actors, AccountingActor, batch_size=batch_size)
+            linked.update(zip(new_pks, accounting_actors))
+
+            main_actors = [
+                MainActor(
+                    branch=branch,
+                    actor_type=actor_type,
+                    display_name=names[obj.pk],
+                    **name_fields(names[obj.pk]),
+                    accounting_actor=linked.get(obj.pk),
+                    **actor_directory_fields(obj, detail=details.get(obj.pk), lookup_detail=False),
+                    **{link_field: obj},
+                )
+                for obj in batch
+            ]
+            bulk_create_with_history(main_actors, MainActor, batch_size=batch_size)
+
+            result.created += len(batch)
+            result.main_actors += len(main_actors)
+            result.accounts += len(accounts)
+            result.accounting_actors += len(accounting_actors)
+            result.reused_accounting_actors += reused
+            result.ids += [obj.pk for obj in batch]
+    return result
@@ -0,0 +1,168 @@
+"""
+Actor deduplication.
+
+Candidate pairs come from blocking, not an all-pairs comparison. Actors are
+grouped per (branch, actor_type) on indexed MainActor columns:
+- dedup_key: the name without case, punctuation or legal-form words, so
+  "ACME Ltd", "Acme Limited" and "ACME LTD." share one;
+- a dedup_key prefix, for near-miss spellings;
+- tax_ref, email and phone.
+Each block key is found with one GROUP BY per column. Only actors sharing a
+block are compared. Blocks larger than max_block_size (a shared switchboard
+number, a generic prefix) carry no signal and are skipped.
+
+Pairs are scored on name similarity, raised by matching contact details; a
+shared tax reference alone is conclusive.
+
+merge_actors() folds a duplicate party into a survivor: every FK to the party
+(Sales.customer, VendorBills.vendor, ...) and to its accounting actor
+(ChequeRegister.contact, ...) is repointed in bulk, ledger balances are
+combined, and the duplicate is deleted.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from itertools import combinations
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import Substr
+from django.utils import timezone
+
+from actors.exposure import refresh_exposure
+from actors.models import MainActor
+from actors.utils import merge_accounting_actors
+from core.utils.mergeRecords import repoint_references
+
+BLOCKING_COLUMNS = ("dedup_key", "name_prefix", "tax_ref", "email", "phone")
+NAME_PREFIX_LENGTH = 6
+CONTACT_BONUS = {"email": 0.15, "phone": 0.15}
+_COLUMNS = ("pk", "branch_id", "actor_type", "display_name", "dedup_key", "phone", "email", "tax_ref", "created")
+
+
+@dataclass
+class DuplicateCandidate:
+    survivor_id: object  # the older actor
+    duplicate_id: object
+    actor_type: str
+    branch_id: object
+    score: float
+    reasons: list = field(default_factory=list)
+
+
+def _keyed(queryset, column):
+    """
+    Actors with a non-empty `column`; "name_prefix" is the first NAME_PREFIX_LENGTH characters of dedup_key.
+    """
+    if column == "name_prefix":
+        return queryset.exclude(dedup_key="").annotate(name_prefix=Substr("dedup_key", 1, NAME_PREFIX_LENGTH))
+    return queryset.exclude(**{column: ""})
+
+
+def _blocks(queryset, max_block_size):
+    """
+    Yields lists of MainActor ids sharing a blocking key; two queries per column.
+    """
+    for column in BLOCKING_COLUMNS:
+        keyed = _keyed(queryset, column)
+        keys = set(
+            keyed.values("branch_id", "actor_type", column)
+            .annotate(members=Count("pk"))
+            .filter(members__gt=1, members__lte=max_block_size)
+            .values_list("branch_id", "actor_type", column)
+            .order_by()
+        )
+        if not keys:
+            continue
+        grouped = defaultdict(list)
+        members = keyed.filter(**{f"{column}__in": {value for _, _, value in keys}})
+        for pk, branch_id, actor_type, value in members.values_list("pk", "branch_id", "actor_type", column).order_by():
+            if (branch_id, actor_type, value) in keys:
+                grouped[(branch_id, actor_type, value)].append(pk)
+        yield from grouped.values()
+
+
+def score_pair(first: dict, second: dict) -> tuple[float, list]:
+    """
+    Similarity of two actor rows (MainActor values) in [0, 1] and the evidence for it.
+    """
+    if first["tax_ref"] and first["tax_ref"] == second["tax_ref"]:
+        return 1.0, ["tax_ref"]
+
+    reasons = []
+    if first["dedup_key"] and first["dedup_key"] == second["dedup_key"]:
+        score = 1.0
+        reasons.append("name")
+    else:
+        score = SequenceMatcher(None, first["dedup_key"], second["dedup_key"]).ratio()
+        reasons.append(f"name~{score:.2f}")
+    for column, bonus in CONTACT_BONUS.items():
+        if first[column] and first[column] == second[column]:
+            score += bonus
+            reasons.append(column)
+    return min(score, 1.0), reasons
+
+
+def find_duplicate_candidates(queryset=None, *, min_score=0.85, max_block_size=50) -> list[DuplicateCandidate]:
+    """
+    Likely duplicate pairs among active actors in `queryset` (default: all),
+    best first. A pair found by several blocks is scored once.
+    """
+    queryset = (queryset if queryset is not None else MainActor.objects.all()).filter(active=True)
+
+    pairs = set()
+    for ids in _blocks(queryset, max_block_size):
+        pairs.update(tuple(sorted(pair, key=str)) for pair in combinations(ids, 2))
+    if not pairs:
+        return []
+
+    wanted = {pk for pair in pairs for pk in pair}
+    rows = {row["pk"]: row for row in MainActor.objects.filter(pk__in=wanted).values(*_COLUMNS)}
+
+    candidates = []
+    for first_id, second_id in pairs:
+        first, second = sorted((rows[first_id], rows[second_id]), key=lambda row: (row["created"], str(row["pk"])))
+        score, reasons = score_pair(first, second)
+        if score >= min_score:
+            candidates.append(DuplicateCandidate(
+                survivor_id=first["pk"], duplicate_id=second["pk"], actor_type=first["actor_type"],
+                branch_id=first["branch_id"], score=round(score, 3), reasons=reasons,
+            ))
+    candidates.sort(key=lambda c: (-c.score, str(c.survivor_id), str(c.duplicate_id)))
+    return candidates
+
+
+@transaction.atomic
+def merge_actors(survivor: MainActor, duplicate: MainActor) -> MainActor:
+    """
+    Moves everything that references `duplicate` (its party record, the
+    MainActor and its accounting actor) onto `survivor`, then deletes the
+    duplicate party, which cascades to its MainActor.
+    """
+    if survivor.pk == duplicate.pk:
+        raise ValidationError("Cannot merge an actor into itself.")
+    if (survivor.actor_type, survivor.branch_id) != (duplicate.actor_type, duplicate.branch_id):
+        raise ValidationError("Only actors of the same type and branch can be merged.")
+    survivor_party, duplicate_party = survivor.linked_object(), duplicate.linked_object()
+    if survivor_party is None or duplicate_party is None:
+        raise ValidationError("Both actors need a linked record.")
+
+    repoint_references(type(duplicate_party), [duplicate_party.pk], survivor_party.pk)
+    repoint_references(MainActor, [duplicate.pk], survivor.pk)
+
+    if duplicate.accounting_actor_id:
+        if survivor.accounting_actor_id:
+            merge_accounting_actors(survivor.accounting_actor, [duplicate.accounting_actor])
+        else:
+            now = timezone.now()
+            MainActor.objects.filter(pk=duplicate.pk).update(accounting_actor=None, updated=now)
+            MainActor.objects.filter(pk=survivor.pk).update(accounting_actor=duplicate.accounting_actor_id, updated=now)
+            survivor.accounting_actor_id = duplicate.accounting_actor_id
+
+    duplicate_party.delete()
+    refresh_exposure(type(survivor_party), survivor_party.pk)
+    return survivor
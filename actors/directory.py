@@ -0,0 +1,135 @@
+"""
+Actor directory: one ranked search over every party type, served from the
+denormalized MainActor columns (search_name, phone, email, tax_ref) that the
+actor signals keep in sync.
+
+Matching is a substring match on the lowercased search_name plus exact
+matches on phone digits, email and tax reference. On Postgres the
+pg_trgm GIN index from actors/0006 serves the substring match; elsewhere the
+(branch, search_name) index covers prefix matches.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+
+from django.db.models import Case, Count, IntegerField, Q, Value, When
+from django.utils import timezone
+
+from actors.models import MainActor
+from actors.utils import actor_directory_fields, name_fields, normalize_phone, normalize_search_name
+
+DIRECTORY_COLUMNS = ["search_name", "dedup_key", "phone", "email", "tax_ref"]
+
+LINK_FIELDS = [
+    "booking_agency", "carrier", "customs_agent", "vendor", "customer", "department", "designation", "employee",
+]
+
+
+# Per actor type: the MainActor link and the party columns shown in listings.
+PARTY_SUMMARY_FIELDS = {
+    MainActor.ActorType.BOOKING_AGENCY: ("booking_agency", ("name", "country", "transportation_mode", "active")),
+    MainActor.ActorType.CARRIER: ("carrier", ("name", "country", "transportation_mode", "active")),
+    MainActor.ActorType.CUSTOMS_AGENT: ("customs_agent", ("name", "country", "active")),
+    MainActor.ActorType.VENDOR: ("vendor", ("name", "country", "category_id", "active")),
+    MainActor.ActorType.CUSTOMER: ("customer", ("customer_type", "country", "city", "is_shipper", "is_consignee", "active")),
+    MainActor.ActorType.DEPARTMENT: ("department", ("name", "active")),
+    MainActor.ActorType.DESIGNATION: ("designation", ("name", "active")),
+    MainActor.ActorType.EMPLOYEE: ("employee", ("first_name", "last_name", "department_id", "active")),
+}
+
+
+def party_summaries(actors) -> dict:
+    """
+    {MainActor pk: linked party summary} for `actors`, with one values() query
+    per actor type present instead of loading each one-to-one link.
+    """
+    wanted = defaultdict(dict)  # actor type -> {party pk: MainActor pk}
+    for actor in actors:
+        link = PARTY_SUMMARY_FIELDS.get(actor.actor_type, (None,))[0]
+        party_id = getattr(actor, f"{link}_id", None) if link else None
+        if party_id is not None:
+            wanted[actor.actor_type][party_id] = actor.pk
+
+    summaries = {}
+    for actor_type, by_party in wanted.items():
+        link, fields = PARTY_SUMMARY_FIELDS[actor_type]
+        party_model = MainActor._meta.get_field(link).related_model
+        for row in party_model._base_manager.filter(pk__in=by_party).values("pk", *fields):
+            summaries[by_party[row.pop("pk")]] = row
+    return summaries
+
+
+def actor_type_facets(queryset) -> dict:
+    """
+    {actor_type: count} in one GROUP BY over the (branch, actor_type) index.
+    """
+    counts = dict(queryset.order_by().values_list("actor_type").annotate(count=Count("pk")))
+    return {actor_type: counts.get(actor_type, 0) for actor_type in MainActor.ActorType.values}
+
+
+def search_directory(queryset, q, *, actor_types=None, limit=20):
+    """
+    Returns up to `limit` dict rows from `queryset` ranked: exact name / phone / email /
+    tax ref, then name prefix, then word prefix, then anywhere in the name.
+    """
+    term = normalize_search_name(q)
+    if not term:
+        return []
+
+    exact = Q(search_name=term) | Q(email=term) | Q(tax_ref=term.upper())
+    digits = normalize_phone(q)
+    if len(digits) >= 5:
+        # Stored numbers carry no country code; also try the typed number minus a leading prefix.
+        exact |= Q(phone__in=[digits[i:] for i in range(0, max(1, len(digits) - 6))])
+
+    queryset = queryset.filter(active=True).filter(exact | Q(search_name__contains=term))
+    if actor_types:
+        queryset = queryset.filter(actor_type__in=actor_types)
+
+    rank = Case(
+        When(exact, then=Value(0)),
+        When(search_name__startswith=term, then=Value(1)),
+        When(search_name__contains=f" {term}", then=Value(2)),
+        default=Value(3),
+        output_field=IntegerField(),
+    )
+    rows = (
+        queryset.annotate(rank=rank)
+        .order_by("rank", "search_name")
+        .values("id", "actor_type", "display_name", "phone", "email", "tax_ref", "branch_id", "rank",
+                *[f"{name}_id" for name in LINK_FIELDS])[:limit]
+    )
+
+    results = []
+    for row in rows:
+        record_id = next((row.pop(f"{name}_id") for name in LINK_FIELDS if row.get(f"{name}_id")), None)
+        for name in LINK_FIELDS:
+            row.pop(f"{name}_id", None)
+        row["record_id"] = record_id
+        results.append(row)
+    return results
+
+
+def rebuild_directory(queryset=None, batch_size=1000) -> int:
+    """
+    Recomputes the directory columns from the linked records (backfill, or after raw loads).
+    """
+    queryset = queryset if queryset is not None else MainActor.objects.all()
+    queryset = queryset.select_related(*LINK_FIELDS, "customer__person", "customer__company").order_by("pk")
+
+    updated, batch = 0, []
+    for actor in queryset.iterator(chunk_size=batch_size):
+        linked = actor.linked_object()
+        if linked is None:
+            continue
+        for key, value in {**name_fields(actor.display_name), **actor_directory_fields(linked)}.items():
+            setattr(actor, key, value)
+        actor.updated = timezone.now()
+        batch.append(actor)
+        if len(batch) >= batch_size:
+            updated += MainActor.objects.bulk_update(batch, [*DIRECTORY_COLUMNS, "updated"])
+            batch = []
+    if batch:
+        updated += MainActor.objects.bulk_update(batch, [*DIRECTORY_COLUMNS, "updated"])
+    return updated
@@ -0,0 +1,283 @@
+"""
+Credit exposure per actor.
+
+Document models that open receivables or payables register themselves with
+register_exposure_source() (sales.Sales, purchase.VendorBills). Saving or
+deleting a source row schedules one refresh of its party's ActorExposure row
+on commit, coalesced per party (core.utils.onCommit): a single aggregate over
+that party's open documents. Payments reach it through the document they
+settle. check_credit() then reads one joined row (the exposure and the
+party's limits) instead of summing open documents per invoice.
+
+Overdue amounts age with the calendar, so refresh_actor_exposure rebuilds
+every row in one grouped query per source; run it daily.
+
+Moving a document to another party refreshes both: the previous party id is
+read in pre_save.
+
+The sources are registered by the sales and purchase apps. Without them
+nothing feeds ActorExposure, so /api/actors/credit-check/ answers 503
+(exposure_tracked() is False) rather than reporting a zero balance.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Count, Min, Q, Sum
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.utils import timezone
+
+from actors.models import ActorExposure, MainActor
+from core.utils.onCommit import coalesce_on_commit
+
+D0 = Decimal("0.00")
+
+
+@dataclass(frozen=True)
+class ExposureSource:
+    model: type
+    actor_field: str  # FK to the party ("customer", "vendor")
+    amount_field: str  # open amount ("balance_due", "remaining_amount")
+    date_field: str
+    due_field: str | None
+    open_filter: Q
+
+    @property
+    def party_model(self):
+        return self.model._meta.get_field(self.actor_field).related_model
+
+
+_SOURCES: list[ExposureSource] = []
+
+
+def register_exposure_source(model, *, actor_field, amount_field, date_field, due_field=None, open_filter=None) -> None:
+    """
+    Counts `model` rows matching `open_filter` with a positive `amount_field`
+    towards their party's exposure. Call from the owning app's ready().
+    """
+    if any(source.model is model for source in _SOURCES):
+        return
+    _SOURCES.append(ExposureSource(model, actor_field, amount_field, date_field, due_field, open_filter or Q()))
+    uid = f"actors_exposure_{model._meta.label_lower}"
+    pre_save.connect(_remember_party, sender=model, weak=False, dispatch_uid=f"{uid}_pre")
+    post_save.connect(_source_changed, sender=model, weak=False, dispatch_uid=uid)
+    post_delete.connect(_source_changed, sender=model, weak=False, dispatch_uid=f"{uid}_delete")
+
+
+def exposure_tracked() -> bool:
+    """
+    Whether any installed app feeds ActorExposure.
+    """
+    return bool(_SOURCES)
+
+
+def _source_for(model) -> ExposureSource | None:
+    return next((source for source in _SOURCES if source.model is model), None)
+
+
+def _remember_party(sender, instance, update_fields=None, **kwargs):
+    # Keeps the party the row points to before this save, so a moved document refreshes it too.
+    source = _source_for(sender)
+    if source is None or instance._state.adding or instance.pk is None:
+        return
+    if update_fields is not None and not {source.actor_field, f"{source.actor_field}_id"} & set(update_fields):
+        return
+    instance._exposure_previous_party_id = (
+        sender._base_manager.filter(pk=instance.pk).values_list(f"{source.actor_field}_id", flat=True).first()
+    )
+
+
+def _source_changed(sender, instance, **kwargs):
+    schedule_exposure_refresh(instance)
+    previous = instance.__dict__.pop("_exposure_previous_party_id", None)
+    source = _source_for(sender)
+    if previous is not None and source is not None and previous != getattr(instance, f"{source.actor_field}_id"):
+        _schedule_party_refresh(source.party_model, previous)
+
+
+def _party_link(party_model) -> str:
+    """
+    MainActor one-to-one field pointing at `party_model`.
+    """
+    for f in MainActor._meta.concrete_fields:
+        if f.one_to_one and f.related_model is party_model:
+            return f.name
+    raise LookupError(f"MainActor has no link to {party_model._meta.label}.")
+
+
+def schedule_exposure_refresh(instance) -> None:
+    """
+    Refreshes the exposure of `instance`'s party on commit. For source rows
+    written with queryset.update(), which sends no post_save.
+    """
+    for source in _SOURCES:
+        if isinstance(instance, source.model):
+            party_id = getattr(instance, f"{source.actor_field}_id")
+            if party_id is not None:
+                _schedule_party_refresh(source.party_model, party_id)
+
+
+def _schedule_party_refresh(party_model, party_id) -> None:
+    coalesce_on_commit(
+        ("actors.exposure", party_model._meta.label_lower, party_id),
+        lambda: refresh_exposure(party_model, party_id),
+    )
+
+
+def _open_rows(source, today):
+    amount = source.amount_field
+    aggregates = {
+        "open_balance": Sum(amount),
+        "open_items": Count("pk"),
+        "oldest_open_date": Min(source.date_field),
+    }
+    if source.due_field:
+        aggregates["oldest_due_date"] = Min(source.due_field)
+        aggregates["overdue_amount"] = Sum(amount, filter=Q(**{f"{source.due_field}__lt": today}))
+    queryset = source.model._base_manager.filter(source.open_filter, **{f"{amount}__gt": 0})
+    return queryset, aggregates
+
+
+def _merge(totals: dict, row: dict) -> None:
+    totals["open_balance"] += row.get("open_balance") or D0
+    totals["open_items"] += row.get("open_items") or 0
+    totals["overdue_amount"] += row.get("overdue_amount") or D0
+    for key in ("oldest_open_date", "oldest_due_date"):
+        if row.get(key) and (totals[key] is None or row[key] < totals[key]):
+            totals[key] = row[key]
+
+
+def _empty_totals() -> dict:
+    return {"open_balance": D0, "open_items": 0, "overdue_amount": D0, "oldest_open_date": None, "oldest_due_date": None}
+
+
+def refresh_exposure(party_model, party_id, today=None) -> ActorExposure | None:
+    """
+    Recomputes one party's exposure: one aggregate per source for that party.
+    """
+    sources = [source for source in _SOURCES if source.party_model is party_model]
+    if not sources:
+        return None
+    main_actor_id = MainActor.objects.filter(**{_party_link(party_model): party_id}).values_list("pk", flat=True).first()
+    if main_actor_id is None:
+        return None
+
+    today = today or timezone.localdate()
+    totals = _empty_totals()
+    for source in sources:
+        queryset, aggregates = _open_rows(source, today)
+        _merge(totals, queryset.filter(**{f"{source.actor_field}_id": party_id}).aggregate(**aggregates))
+
+    exposure, _ = ActorExposure.objects.update_or_create(main_actor_id=main_actor_id, defaults=totals)
+    return exposure
+
+
+def rebuild_exposure(today=None) -> int:
+    """
+    Rebuilds every exposure row with one grouped aggregate per source.
+    """
+    today = today or timezone.localdate()
+    by_party = {}
+    for source in _SOURCES:
+        queryset, aggregates = _open_rows(source, today)
+        party_field = f"{source.actor_field}_id"
+        for row in queryset.values(party_field).annotate(**aggregates).order_by():
+            totals = by_party.setdefault((source.party_model, row.pop(party_field)), _empty_totals())
+            _merge(totals, row)
+
+    rows = []
+    for party_model in {party_model for party_model, _ in by_party}:
+        link = _party_link(party_model)
+        ids = [party_id for model, party_id in by_party if model is party_model]
+        for party_id, main_actor_id in MainActor.objects.filter(**{f"{link}__in": ids}).values_list(link, "pk"):
+            rows.append(ActorExposure(main_actor_id=main_actor_id, **by_party[(party_model, party_id)]))
+
+    with transaction.atomic():
+        ActorExposure.objects.all().delete()
+        ActorExposure.objects.bulk_create(rows, batch_size=1000)
+    return len(rows)
+
+
+@dataclass
+class CreditCheck:
+    main_actor_id: object
+    branch_id: object
+    amount: Decimal
+    amount_limit: Decimal
+    days_limit: int
+    open_balance: Decimal = D0
+    overdue_amount: Decimal = D0
+    oldest_open_date: date | None = None
+    days_outstanding: int = 0
+    reasons: list = field(default_factory=list)
+
+    @property
+    def allowed(self) -> bool:
+        return not self.reasons
+
+    @property
+    def available(self) -> Decimal | None:
+        # A limit of 0 means no limit.
+        return self.amount_limit - self.open_balance if self.amount_limit else None
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "allowed": self.allowed, "available": self.available}
+
+
+_PARTY_LINKS = ("booking_agency", "carrier", "customs_agent", "vendor", "customer", "department", "designation", "employee")
+
+
+def check_credit(main_actor=None, *, party=None, amount=D0, today=None) -> CreditCheck | None:
+    """
+    Credit position of a MainActor (instance or pk) or of a party record, plus
+    whether `amount` more fits: one query. Limits come from the party
+    (Customer.credit_limit, PartyBase.amount_limit and days_limit; 0 = none).
+    """
+    queryset = MainActor.objects.select_related("exposure", *_PARTY_LINKS)
+    if party is not None:
+        actor = queryset.filter(**{_party_link(type(party)): party.pk}).first()
+    else:
+        actor = queryset.filter(pk=getattr(main_actor, "pk", main_actor)).first()
+    if actor is None:
+        return None
+
+    linked = actor.linked_object()
+    amount = Decimal(amount or 0)
+    check = CreditCheck(
+        main_actor_id=actor.pk,
+        branch_id=actor.branch_id,
+        amount=amount,
+        amount_limit=Decimal(getattr(linked, "credit_limit", None) or getattr(linked, "amount_limit", None) or 0),
+        days_limit=getattr(linked, "days_limit", 0) or 0,
+    )
+    exposure = getattr(actor, "exposure", None)
+    if exposure is not None:
+        check.open_balance = exposure.open_balance
+        check.overdue_amount = exposure.overdue_amount
+        check.oldest_open_date = exposure.oldest_open_date
+        if exposure.oldest_open_date:
+            check.days_outstanding = ((today or timezone.localdate()) - exposure.oldest_open_date).days
+
+    if check.amount_limit and check.open_balance + amount > check.amount_limit:
+        check.reasons.append(
+            f"Open balance {check.open_balance} plus {amount} exceeds the credit limit of {check.amount_limit}."
+        )
+    if check.days_limit and check.days_outstanding > check.days_limit:
+        check.reasons.append(
+            f"Oldest open item is {check.days_outstanding} days old; the limit is {check.days_limit} days."
+        )
+    return check
+
+
+def ensure_credit_available(party, amount=D0) -> None:
+    """
+    Raises ValidationError({"credit": reasons}) when `party` cannot take `amount` more.
+    """
+    check = check_credit(party=party, amount=amount)
+    if check is not None and not check.allowed:
+        raise ValidationError({"credit": check.reasons})
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from actors.dedup import find_duplicate_candidates
+from actors.models import MainActor
+
+
+class Command(BaseCommand):
+    help = "List likely duplicate actors (tab-separated: score, survivor id, duplicate id, names, evidence)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--branch", help="Only this branch id.")
+        parser.add_argument("--type", dest="actor_types", action="append", help="Actor type; repeatable.")
+        parser.add_argument("--min-score", type=float, default=0.85)
+        parser.add_argument("--max-block-size", type=int, default=50)
+
+    def handle(self, *args, **options):
+        queryset = MainActor.objects.all()
+        if options["branch"]:
+            queryset = queryset.filter(branch_id=options["branch"])
+        if options["actor_types"]:
+            queryset = queryset.filter(actor_type__in=options["actor_types"])
+
+        candidates = find_duplicate_candidates(
+            queryset, min_score=options["min_score"], max_block_size=options["max_block_size"]
+        )
+        names = dict(
+            MainActor.objects.filter(
+                pk__in={c.survivor_id for c in candidates} | {c.duplicate_id for c in candidates}
+            ).values_list("pk", "display_name")
+        )
+        for c in candidates:
+            self.stdout.write("\t".join([
+                f"{c.score:.3f}", str(c.survivor_id), str(c.duplicate_id),
+                names[c.survivor_id] or "", names[c.duplicate_id] or "", ",".join(c.reasons),
+            ]))
+        self.stderr.write(f"{len(candidates)} candidate pairs.")
@@ -0,0 +1,94 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from accounting.models import Actors as AccountingActor
+from actors.models import MainActor
+from actors.utils import _sync_accounting_actor, merge_accounting_actors
+
+
+class Command(BaseCommand):
+    help = (
+        "Link MainActors to their accounting Actors. Before the link existed, renaming a party "
+        "left its old accounting actor behind and created a new one; every unlinked accounting "
+        "actor carrying one of the MainActor's past display names is merged into one survivor "
+        "(references repointed, ledger balances added up)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing.")
+        parser.add_argument("--branch", help="Only this branch id.")
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        queryset = MainActor.objects.filter(accounting_actor__isnull=True).exclude(display_name="")
+        if options["branch"]:
+            queryset = queryset.filter(branch_id=options["branch"])
+        pks = list(queryset.order_by("created", "pk").values_list("pk", flat=True))
+
+        totals = defaultdict(int)
+        batch_size = options["batch_size"]
+        for start in range(0, len(pks), batch_size):
+            with transaction.atomic():
+                self._link_batch(pks[start:start + batch_size], options["dry_run"], totals)
+                if options["dry_run"]:
+                    transaction.set_rollback(True)
+
+        prefix = "[dry run] " if options["dry_run"] else ""
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix}Linked {totals['linked']} actors, merged {totals['merged']} duplicates, "
+            f"created {totals['created']} new accounting actors."
+        ))
+
+    def _link_batch(self, pks, dry_run, totals):
+        main_actors = list(MainActor.objects.filter(pk__in=pks).order_by("created", "pk"))
+
+        # Every name each MainActor has carried, from its history rows.
+        names = defaultdict(set)
+        for ma in main_actors:
+            names[ma.pk].add(ma.display_name)
+        history = MainActor.history.model.objects.filter(id__in=pks).exclude(display_name="")
+        for pk, name in history.values_list("id", "display_name").distinct():
+            names[pk].add(name)
+
+        candidates = defaultdict(list)  # (branch_id, name) -> unlinked accounting actors, oldest first
+        all_names = set().union(*names.values())
+        branch_ids = {ma.branch_id for ma in main_actors}
+        for actor in (
+            AccountingActor.objects.select_related("account")
+            .filter(branch_id__in=branch_ids, name__in=all_names, main_actor__isnull=True)
+            .order_by("created", "pk")
+        ):
+            candidates[(actor.branch_id, actor.name)].append(actor)
+
+        linked, unmatched = [], []
+        for ma in main_actors:
+            found = []
+            for name in names[ma.pk]:
+                # Pop, so a name shared by several MainActors links to only the first of them.
+                found.extend(candidates.pop((ma.branch_id, name), []))
+            if not found:
+                unmatched.append(ma)
+                continue
+            found.sort(key=lambda actor: (actor.name != ma.display_name, actor.created, str(actor.pk)))
+            survivor, duplicates = found[0], found[1:]
+            if not dry_run:
+                if duplicates:
+                    merge_accounting_actors(survivor, duplicates)
+                if survivor.name != ma.display_name:
+                    # Actors.save() renames the ledger account too.
+                    survivor.name = ma.display_name
+                    survivor.save(update_fields=["name", "updated"])
+            totals["merged"] += len(duplicates)
+            ma.accounting_actor = survivor
+            ma.updated = timezone.now()
+            linked.append(ma)
+
+        if not dry_run:
+            MainActor.objects.bulk_update(linked, ["accounting_actor", "updated"])
+            for ma in unmatched:
+                _sync_accounting_actor(ma)
+        totals["linked"] += len(linked) + len(unmatched)
+        totals["created"] += len(unmatched)
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.core.exceptions import ValidationError
+
+from actors.dedup import merge_actors
+from actors.models import MainActor
+
+
+class Command(BaseCommand):
+    help = "Merge duplicate actors into a survivor (MainActor ids), repointing every reference to them."
+
+    def add_arguments(self, parser):
+        parser.add_argument("survivor")
+        parser.add_argument("duplicates", nargs="+")
+
+    def handle(self, *args, **options):
+        actors = MainActor.objects.select_related("accounting_actor").in_bulk([options["survivor"], *options["duplicates"]])
+        survivor = actors.get(MainActor._meta.pk.to_python(options["survivor"]))
+        if survivor is None:
+            raise CommandError(f"Unknown actor {options['survivor']}.")
+        for raw in options["duplicates"]:
+            duplicate = actors.get(MainActor._meta.pk.to_python(raw))
+            if duplicate is None:
+                raise CommandError(f"Unknown actor {raw}.")
+            try:
+                merge_actors(survivor, duplicate)
+            except ValidationError as e:
+                raise CommandError("; ".join(e.messages))
+            self.stdout.write(f"Merged {duplicate.display_name} ({duplicate.pk}) into {survivor.display_name}.")
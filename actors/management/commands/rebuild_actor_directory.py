@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from actors.directory import rebuild_directory
+from actors.models import MainActor
+
+
+class Command(BaseCommand):
+    help = "Recompute MainActor directory columns (search_name, dedup_key, phone, email, tax_ref) from the linked records."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--branch", help="Only this branch id.")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        queryset = MainActor.objects.all()
+        if options["branch"]:
+            queryset = queryset.filter(branch_id=options["branch"])
+        updated = rebuild_directory(queryset, batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {updated} directory rows."))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from actors.exposure import rebuild_exposure
+
+
+class Command(BaseCommand):
+    help = "Rebuild ActorExposure from open invoices and bills (re-ages overdue amounts; run daily)."
+
+    def handle(self, *args, **options):
+        rows = rebuild_exposure()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt exposure for {rows} actors."))
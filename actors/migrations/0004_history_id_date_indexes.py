@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('actors', '0003_remove_bookingagency_agency_remove_carrier_agency_and_more'),
+        ('master', '0002_history_id_date_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='historicalbookingagency',
+            index=models.Index(fields=['id', 'history_date'], name='actors_hist_id_5d129e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalcarrier',
+            index=models.Index(fields=['id', 'history_date'], name='actors_hist_id_f5089e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalcustomer',
+            index=models.Index(fields=['id', 'history_date'], name='actors_hist_id_18fda6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalcustomsagent',
+            index=models.Index(fields=['id', 'history_date'], name='actors_hist_id_d28fef_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicaldepartment',
+            index=models.Index(fields=['id', 'history_date'], name='actors_hist_id_8bf0ef_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicaldesignation',
+            index=models.Index(fields=['id', 'history_date'], name='actors_hist_id_4b616b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalemployee',
+            index=models.Index(fields=['id', 'history_date'], name='actors_hist_id_932646_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalmainactor',
+            index=models.Index(fields=['id', 'history_date'], name='actors_hist_id_1cbb18_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalsupplier',
+            index=models.Index(fields=['id', 'history_date'], name='actors_hist_id_eecc51_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalvendor',
+            index=models.Index(fields=['id', 'history_date'], name='actors_hist_id_313c07_idx'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:44
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('actors', '0004_history_id_date_indexes'),
+        ('master', '0002_history_id_date_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bookingagency',
+            index=models.Index(fields=['branch', 'updated', 'id'], name='actors_book_branch__0ba4de_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='carrier',
+            index=models.Index(fields=['branch', 'updated', 'id'], name='actors_carr_branch__e01d51_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customer',
+            index=models.Index(fields=['branch', 'updated', 'id'], name='actors_cust_branch__b7dbef_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customsagent',
+            index=models.Index(fields=['branch', 'updated', 'id'], name='actors_cust_branch__c9304f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='department',
+            index=models.Index(fields=['branch', 'updated', 'id'], name='actors_depa_branch__2921e7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='designation',
+            index=models.Index(fields=['branch', 'updated', 'id'], name='actors_desi_branch__17012a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(fields=['branch', 'updated', 'id'], name='actors_empl_branch__0d0b28_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mainactor',
+            index=models.Index(fields=['branch', 'updated', 'id'], name='actors_main_branch__fa1e88_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='supplier',
+            index=models.Index(fields=['branch', 'updated', 'id'], name='actors_supp_branch__4e46cf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vendor',
+            index=models.Index(fields=['branch', 'updated', 'id'], name='actors_vend_branch__d48532_idx'),
+        ),
+    ]
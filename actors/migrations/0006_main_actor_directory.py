@@ -0,0 +1,107 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+TRIGRAM_INDEX = "actors_mainactor_search_name_trgm"
+LINK_FIELDS = [
+    "booking_agency", "carrier", "customs_agent", "vendor", "customer", "department", "designation", "employee",
+]
+BATCH_SIZE = 1000
+
+
+def backfill_directory(apps, schema_editor):
+    # Existing actors would otherwise drop out of search until rebuild_actor_directory runs.
+    from actors.utils import actor_directory_fields, name_fields
+
+    MainActor = apps.get_model("actors", "MainActor")
+    db = schema_editor.connection.alias
+    queryset = (
+        MainActor.objects.using(db)
+        .select_related(*LINK_FIELDS, "customer__person", "customer__company")
+        .order_by("pk")
+    )
+
+    batch = []
+    for actor in queryset.iterator(chunk_size=BATCH_SIZE):
+        linked = next((getattr(actor, name) for name in LINK_FIELDS if getattr(actor, f"{name}_id")), None)
+        if linked is None:
+            continue
+        detail = None
+        if actor.customer_id:
+            detail = getattr(linked, "person", None) or getattr(linked, "company", None)
+        actor.search_name = name_fields(actor.display_name)["search_name"]
+        for key, value in actor_directory_fields(linked, detail, lookup_detail=False).items():
+            setattr(actor, key, value)
+        batch.append(actor)
+        if len(batch) >= BATCH_SIZE:
+            MainActor.objects.using(db).bulk_update(batch, ["search_name", "phone", "email", "tax_ref"])
+            batch = []
+    if batch:
+        MainActor.objects.using(db).bulk_update(batch, ["search_name", "phone", "email", "tax_ref"])
+
+
+def create_trigram_index(apps, schema_editor):
+    # Postgres only: lets LIKE '%q%' on search_name use an index (see actors.directory).
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {TRIGRAM_INDEX} ON actors_mainactor USING gin (search_name gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {TRIGRAM_INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('actors', '0005_change_feed_indexes'),
+        ('master', '0002_history_id_date_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mainactor',
+            name='email',
+            field=models.CharField(blank=True, default='', max_length=254),
+        ),
+        migrations.AddField(
+            model_name='mainactor',
+            name='phone',
+            field=models.CharField(blank=True, default='', max_length=30),
+        ),
+        migrations.AddField(
+            model_name='mainactor',
+            name='search_name',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='mainactor',
+            name='tax_ref',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name='mainactor',
+            index=models.Index(fields=['branch', 'search_name'], name='actors_main_branch__1d0830_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mainactor',
+            index=models.Index(fields=['phone'], name='actors_main_phone_156ba6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mainactor',
+            index=models.Index(fields=['email'], name='actors_main_email_d86953_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mainactor',
+            index=models.Index(fields=['tax_ref'], name='actors_main_tax_ref_994d63_idx'),
+        ),
+        migrations.RunPython(backfill_directory, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0006_change_feed_indexes'),
+        ('actors', '0006_main_actor_directory'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='historicalmainactor',
+            name='accounting_actor',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='accounting.actors'),
+        ),
+        migrations.AddField(
+            model_name='mainactor',
+            name='accounting_actor',
+            field=models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='main_actor', to='accounting.actors'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('actors', '0007_mainactor_accounting_actor'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActorExposure',
+            fields=[
+                ('main_actor', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='exposure', serialize=False, to='actors.mainactor')),
+                ('open_balance', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('open_items', models.PositiveIntegerField(default=0)),
+                ('oldest_open_date', models.DateField(blank=True, null=True)),
+                ('oldest_due_date', models.DateField(blank=True, null=True)),
+                ('overdue_amount', models.DecimalField(decimal_places=2, default=0, max_digits=18)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def backfill_dedup_key(apps, schema_editor):
+    # find_duplicate_candidates matches names on this column; fill it for existing actors.
+    from actors.utils import name_fields
+
+    MainActor = apps.get_model("actors", "MainActor")
+    db = schema_editor.connection.alias
+
+    batch = []
+    for actor in MainActor.objects.using(db).only("pk", "display_name").order_by("pk").iterator(chunk_size=BATCH_SIZE):
+        actor.dedup_key = name_fields(actor.display_name)["dedup_key"]
+        batch.append(actor)
+        if len(batch) >= BATCH_SIZE:
+            MainActor.objects.using(db).bulk_update(batch, ["dedup_key"])
+            batch = []
+    if batch:
+        MainActor.objects.using(db).bulk_update(batch, ["dedup_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0006_change_feed_indexes'),
+        ('actors', '0008_actor_exposure'),
+        ('master', '0002_history_id_date_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mainactor',
+            name='dedup_key',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name='mainactor',
+            index=models.Index(fields=['branch', 'actor_type', 'dedup_key'], name='actors_main_branch__8b2457_idx'),
+        ),
+        migrations.RunPython(backfill_dedup_key, migrations.RunPython.noop),
+    ]
@@ -22,7 +22,7 @@ class PartyBase(BranchScopedStampedOwnedActive):
     amount_limit = models.DecimalField(max_digits=18, decimal_places=2, default=0, validators=[MinValueValidator(0)])
     days_limit = models.PositiveIntegerField(default=0)
 
-    class Meta:
+    class Meta(BranchScopedStampedOwnedActive.Meta):
         abstract = True
 
     def __str__(self):
@@ -44,9 +44,9 @@ class BookingAgency(PartyBase):
     iata_code = models.CharField(max_length=50, blank=True, null=True)
     waybill_prefix = models.CharField(max_length=20, blank=True, null=True)
 
-    class Meta:
+    class Meta(PartyBase.Meta):
         ordering = ["name"]
-        indexes = [models.Index(fields=["name"]), models.Index(fields=["transportation_mode"]), models.Index(fields=["branch"])]
+        indexes = [*PartyBase.Meta.indexes, models.Index(fields=["name"]), models.Index(fields=["transportation_mode"]), models.Index(fields=["branch"])]
         constraints = [models.UniqueConstraint(fields=["branch", "name", "transportation_mode"], name="uniq_bookingagency_branch_name_mode")]
 
 
@@ -63,9 +63,9 @@ class Carrier(PartyBase):
     cellphone_country_code = models.CharField(max_length=10)
     cellphone = models.CharField(max_length=30)
 
-    class Meta:
+    class Meta(PartyBase.Meta):
         ordering = ["name"]
-        indexes = [models.Index(fields=["name"]), models.Index(fields=["transportation_mode"]), models.Index(fields=["branch"])]
+        indexes = [*PartyBase.Meta.indexes, models.Index(fields=["name"]), models.Index(fields=["transportation_mode"]), models.Index(fields=["branch"])]
         constraints = [models.UniqueConstraint(fields=["branch", "name", "transportation_mode"], name="uniq_carrier_branch_name_mode")]
 
     def __str__(self):
@@ -76,9 +76,9 @@ class CustomsAgent(PartyBase):
     emirates_no = models.CharField(max_length=50, blank=True, null=True)
     mobile = models.CharField(max_length=30)
 
-    class Meta:
+    class Meta(PartyBase.Meta):
         ordering = ["name"]
-        indexes = [models.Index(fields=["name"]), models.Index(fields=["mobile"]), models.Index(fields=["branch"])]
+        indexes = [*PartyBase.Meta.indexes, models.Index(fields=["name"]), models.Index(fields=["mobile"]), models.Index(fields=["branch"])]
         constraints = [models.UniqueConstraint(fields=["branch", "name"], name="uniq_customsagent_branch_name")]
 
 
@@ -87,9 +87,9 @@ class Vendor(PartyBase):
     cellphone_country_code = models.CharField(max_length=10)
     cellphone = models.CharField(max_length=30)
 
-    class Meta:
+    class Meta(PartyBase.Meta):
         ordering = ["name"]
-        indexes = [models.Index(fields=["name"]), models.Index(fields=["trn"]), models.Index(fields=["account_no"]), models.Index(fields=["branch"])]
+        indexes = [*PartyBase.Meta.indexes, models.Index(fields=["name"]), models.Index(fields=["trn"]), models.Index(fields=["account_no"]), models.Index(fields=["branch"])]
         constraints = [models.UniqueConstraint(fields=["branch", "name"], name="uniq_vendor_branch_name")]
 
 
@@ -127,9 +127,9 @@ class Customer(BranchScopedStampedOwnedActive):
     department = models.CharField(max_length=120, blank=True, null=True)
     remarks = models.TextField(blank=True, null=True)
 
-    class Meta:
+    class Meta(BranchScopedStampedOwnedActive.Meta):
         ordering = ["-created"]
-        indexes = [models.Index(fields=["customer_type"]), models.Index(fields=["mobile_no"]), models.Index(fields=["branch"])]
+        indexes = [*BranchScopedStampedOwnedActive.Meta.indexes, models.Index(fields=["customer_type"]), models.Index(fields=["mobile_no"]), models.Index(fields=["branch"])]
 
     def __str__(self):
         if self.customer_type == self.CustomerType.PERSON and hasattr(self, "person"):
@@ -201,9 +201,9 @@ class CustomerCompany(models.Model):
 class Department(BranchScopedStampedOwnedActive):
     name = models.CharField(max_length=120)
 
-    class Meta:
+    class Meta(BranchScopedStampedOwnedActive.Meta):
         ordering = ["name"]
-        indexes = [models.Index(fields=["name"]), models.Index(fields=["branch"])]
+        indexes = [*BranchScopedStampedOwnedActive.Meta.indexes, models.Index(fields=["name"]), models.Index(fields=["branch"])]
         constraints = [models.UniqueConstraint(fields=["branch", "name"], name="uniq_department_branch_name")]
 
     def __str__(self):
@@ -213,9 +213,9 @@ class Department(BranchScopedStampedOwnedActive):
 class Designation(BranchScopedStampedOwnedActive):
     name = models.CharField(max_length=120)
 
-    class Meta:
+    class Meta(BranchScopedStampedOwnedActive.Meta):
         ordering = ["name"]
-        indexes = [models.Index(fields=["name"]), models.Index(fields=["branch"])]
+        indexes = [*BranchScopedStampedOwnedActive.Meta.indexes, models.Index(fields=["name"]), models.Index(fields=["branch"])]
         constraints = [models.UniqueConstraint(fields=["branch", "name"], name="uniq_designation_branch_name")]
 
     def __str__(self):
@@ -262,9 +262,9 @@ class Employee(BranchScopedStampedOwnedActive):
     parent_employee = models.ForeignKey("self", on_delete=models.SET_NULL, null=True, blank=True, related_name="child_employees")
     designations = models.ManyToManyField(Designation, blank=True, related_name="employees")
 
-    class Meta:
+    class Meta(BranchScopedStampedOwnedActive.Meta):
         ordering = ["first_name", "last_name"]
-        indexes = [models.Index(fields=["first_name", "last_name"]), models.Index(fields=["mobile_no"]), models.Index(fields=["primary_email"]), models.Index(fields=["branch"])]
+        indexes = [*BranchScopedStampedOwnedActive.Meta.indexes, models.Index(fields=["first_name", "last_name"]), models.Index(fields=["mobile_no"]), models.Index(fields=["primary_email"]), models.Index(fields=["branch"])]
         constraints = [models.UniqueConstraint(fields=["branch", "primary_email"], name="uniq_employee_branch_primary_email")]
 
     @property
@@ -274,13 +274,16 @@ class Employee(BranchScopedStampedOwnedActive):
     def __str__(self):
         return self.full_name
 
-    def save(self, *args, **kwargs):
+    def copy_present_address(self):
         if self.permanent_same_as_present:
             self.permanent_address = self.present_address
             self.permanent_city = self.present_city
             self.permanent_zip_code = self.present_zip_code
             self.permanent_country = self.present_country
             self.permanent_state = self.present_state
+
+    def save(self, *args, **kwargs):
+        self.copy_present_address()
         super().save(*args, **kwargs)
 
 
@@ -307,9 +310,34 @@ class MainActor(BranchScopedStampedOwnedActive):
     designation = models.OneToOneField("actors.Designation", on_delete=models.CASCADE, related_name="main_actor", blank=True, null=True)
     employee = models.OneToOneField("actors.Employee", on_delete=models.CASCADE, related_name="main_actor", blank=True, null=True)
 
-    class Meta:
+    # Ledger party for this actor; a stable key, so renames keep the same actor and account.
+    accounting_actor = models.OneToOneField(
+        "accounting.Actors", on_delete=models.SET_NULL, related_name="main_actor", blank=True, null=True
+    )
+
+    # Denormalized directory columns, kept in sync by actors.utils.actor_directory_fields.
+    search_name = models.CharField(max_length=255, blank=True, default="")
+    dedup_key = models.CharField(max_length=255, blank=True, default="")
+    phone = models.CharField(max_length=30, blank=True, default="")
+    email = models.CharField(max_length=254, blank=True, default="")
+    tax_ref = models.CharField(max_length=100, blank=True, default="")
+
+    # Derived from the linked record, which carries its own history.
+    history_excluded_fields = ("search_name", "dedup_key", "phone", "email", "tax_ref")
+
+    class Meta(BranchScopedStampedOwnedActive.Meta):
         ordering = ["display_name", "created"]
-        indexes = [models.Index(fields=["branch", "actor_type"]), models.Index(fields=["branch", "display_name"])]
+        indexes = [
+            *BranchScopedStampedOwnedActive.Meta.indexes,
+            models.Index(fields=["branch", "actor_type"]),
+            models.Index(fields=["branch", "display_name"]),
+            models.Index(fields=["branch", "search_name"]),
+            # Blocking key for actors.dedup.
+            models.Index(fields=["branch", "actor_type", "dedup_key"]),
+            models.Index(fields=["phone"]),
+            models.Index(fields=["email"]),
+            models.Index(fields=["tax_ref"]),
+        ]
 
     def linked_object(self):
         for obj in [self.booking_agency, self.carrier, self.customs_agent, self.vendor, self.customer, self.department, self.designation, self.employee]:
@@ -348,5 +376,25 @@ class MainActor(BranchScopedStampedOwnedActive):
                 self.actor_type = self.ActorType.EMPLOYEE
         super().save(*args, **kwargs)
 
+
+class ActorExposure(models.Model):
+    """
+    Open receivable / payable position per actor, maintained by actors.exposure
+    from the registered document sources (sales invoices, vendor bills) so a
+    credit check reads one row instead of summing open documents.
+    """
+    main_actor = models.OneToOneField(MainActor, on_delete=models.CASCADE, primary_key=True, related_name="exposure")
+    open_balance = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    open_items = models.PositiveIntegerField(default=0)
+    oldest_open_date = models.DateField(blank=True, null=True)
+    oldest_due_date = models.DateField(blank=True, null=True)
+    # As of refreshed_at; refresh_actor_exposure re-ages it (run daily).
+    overdue_amount = models.DecimalField(max_digits=18, decimal_places=2, default=0)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.main_actor_id}: {self.open_balance}"
+
+
 class Supplier(BranchScopedStampedOwnedActive):
     pass
\ No newline at end of file
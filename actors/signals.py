@@ -1,7 +1,8 @@
 from django.db.models.signals import post_save, post_delete
 from actors.models import BookingAgency, Carrier, CustomsAgent, Vendor, Customer, Department, Designation, Employee, CustomerPerson, CustomerCompany
 from actors.models import MainActor
-from actors.utils import upsert_main_actor, delete_main_actor, refresh_customer_main_actor_display
+from actors.utils import upsert_main_actor, delete_main_actor, schedule_customer_display_refresh, schedule_main_actor_upsert
+from core.utils.instrumentation import timed_function
 
 
 ACTOR_SIGNAL_MAP = [
@@ -19,22 +20,33 @@ ACTOR_SIGNAL_MAP = [
 def register_main_actor_signals():
     for model, field_name, actor_type in ACTOR_SIGNAL_MAP:
 
-        def _post_save(sender, instance, **kwargs):
-            upsert_main_actor(instance, field_name=field_name, actor_type=actor_type)
-
-        def _post_delete(sender, instance, **kwargs):
+        # Bind the loop values per handler; a plain closure would see the last entry.
+        # Creates run now, so the MainActor exists for the rest of the transaction;
+        # updates are coalesced into one upsert per actor on commit.
+        @timed_function("signal.actors.main_actor_upsert")
+        def _post_save(sender, instance, created=False, field_name=field_name, actor_type=actor_type, **kwargs):
+            if created:
+                upsert_main_actor(instance, field_name=field_name, actor_type=actor_type)
+            else:
+                schedule_main_actor_upsert(instance, field_name=field_name, actor_type=actor_type)
+
+        @timed_function("signal.actors.main_actor_delete")
+        def _post_delete(sender, instance, field_name=field_name, **kwargs):
             delete_main_actor(instance, field_name=field_name)
 
-        post_save.connect(_post_save, sender=model, dispatch_uid=f"mainactor_postsave_{model.__name__}")
-        post_delete.connect(_post_delete, sender=model, dispatch_uid=f"mainactor_postdelete_{model.__name__}")
+        post_save.connect(_post_save, sender=model, weak=False, dispatch_uid=f"mainactor_postsave_{model.__name__}")
+        post_delete.connect(_post_delete, sender=model, weak=False, dispatch_uid=f"mainactor_postdelete_{model.__name__}")
 
+    # Coalesced per customer: an inline of 20 contacts refreshes the MainActor once on commit.
+    @timed_function("signal.actors.customer_display_refresh")
     def _customer_person_company_save(sender, instance, **kwargs):
-        refresh_customer_main_actor_display(instance.customer)
+        schedule_customer_display_refresh(instance.customer_id)
 
+    @timed_function("signal.actors.customer_display_refresh")
     def _customer_person_company_delete(sender, instance, **kwargs):
-        refresh_customer_main_actor_display(instance.customer)
+        schedule_customer_display_refresh(instance.customer_id)
 
-    post_save.connect(_customer_person_company_save, sender=CustomerPerson, dispatch_uid="customerperson_refresh_mainactor")
-    post_save.connect(_customer_person_company_save, sender=CustomerCompany, dispatch_uid="customercompany_refresh_mainactor")
-    post_delete.connect(_customer_person_company_delete, sender=CustomerPerson, dispatch_uid="customerperson_refresh_mainactor_del")
-    post_delete.connect(_customer_person_company_delete, sender=CustomerCompany, dispatch_uid="customercompany_refresh_mainactor_del")
+    post_save.connect(_customer_person_company_save, sender=CustomerPerson, weak=False, dispatch_uid="customerperson_refresh_mainactor")
+    post_save.connect(_customer_person_company_save, sender=CustomerCompany, weak=False, dispatch_uid="customercompany_refresh_mainactor")
+    post_delete.connect(_customer_person_company_delete, sender=CustomerPerson, weak=False, dispatch_uid="customerperson_refresh_mainactor_del")
+    post_delete.connect(_customer_person_company_delete, sender=CustomerCompany, weak=False, dispatch_uid="customercompany_refresh_mainactor_del")
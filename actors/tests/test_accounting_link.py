@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from accounting.models import Accounts, Actors as AccountingActor, ChequeRegister
+from actors.models import MainActor, Vendor
+from master.models import Branch, Currency
+
+
+class AccountingActorLinkTests(TestCase):
+    def setUp(self):
+        self.branch = Branch.objects.create(name="Main", address="x", city="x", state="x", country="x", contact_number="1", is_main_branch=True)
+        self.currency = Currency.objects.create(code="XTS", name="Test", symbol="T", decimal_places=2)
+        self.user = get_user_model().objects.create_user(username="link", email="link@example.com", password="x", branch=self.branch)
+
+    def _vendor(self, name):
+        return Vendor.objects.create(
+            name=name, address="x", country="Nepal", currency=self.currency, branch=self.branch,
+            cellphone_country_code="+977", cellphone="9800000001",
+        )
+
+    def test_rename_keeps_the_same_accounting_actor_and_account(self):
+        vendor = self._vendor("Old Name")
+        ma = MainActor.objects.get(vendor=vendor)
+        actor = ma.accounting_actor
+        code = actor.account.code
+
+        vendor.name = "New Name"
+        with self.captureOnCommitCallbacks(execute=True):
+            vendor.save()
+
+        actor.refresh_from_db()
+        self.assertEqual(MainActor.objects.get(vendor=vendor).accounting_actor_id, actor.pk)
+        self.assertEqual(AccountingActor.objects.count(), 1)
+        self.assertEqual((actor.name, actor.account.name, actor.account.code), ("New Name", "New Name", code))
+
+    def test_command_merges_actors_left_behind_by_renames(self):
+        vendor = self._vendor("Old Name")
+        # The pre-link behaviour: the rename leaves "Old Name" behind and creates "New Name".
+        MainActor.objects.filter(vendor=vendor).update(accounting_actor=None)
+        vendor.name = "New Name"
+        with self.captureOnCommitCallbacks(execute=True):
+            vendor.save()
+        MainActor.objects.filter(vendor=vendor).update(accounting_actor=None)
+        self.assertEqual(AccountingActor.objects.count(), 2)
+        Accounts.objects.filter(actor__name="Old Name").update(balance=Decimal("100.00"))
+        Accounts.objects.filter(actor__name="New Name").update(balance=Decimal("25.50"))
+        cheque = ChequeRegister.objects.create(
+            branch=self.branch, contact=AccountingActor.objects.get(name="Old Name"), amount=Decimal("10")
+        )
+
+        call_command("link_accounting_actors", "--dry-run", stdout=StringIO())
+        self.assertEqual(AccountingActor.objects.count(), 2)
+
+        call_command("link_accounting_actors", stdout=StringIO())
+
+        actor = AccountingActor.objects.get()
+        self.assertEqual(MainActor.objects.get(vendor=vendor).accounting_actor_id, actor.pk)
+        self.assertEqual(actor.name, "New Name")
+        self.assertEqual(Accounts.objects.filter(account_class="actor").count(), 1)
+        self.assertEqual(actor.account.balance, Decimal("125.50"))
+        cheque.refresh_from_db()
+        self.assertEqual(cheque.contact_id, actor.pk)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounting.models import Accounts, Actors as AccountingActor
+from actors.bulk import bulk_import_actors
+from actors.models import Customer, MainActor, Vendor
+from master.models import Branch, Currency
+
+
+class BulkImportActorsTests(TestCase):
+    def setUp(self):
+        self.branch = Branch.objects.create(name="Main", address="x", city="x", state="x", country="x", contact_number="1", is_main_branch=True)
+        self.currency = Currency.objects.create(code="XTS", name="Test", symbol="T", decimal_places=2)
+        self.user = get_user_model().objects.create_user(username="bulk", email="bulk@example.com", password="x", branch=self.branch)
+
+    def _vendor(self, n):
+        return {"name": f"Vendor {n}", "address": "x", "country": "Nepal", "currency": self.currency.pk,
+                "cellphone_country_code": "+977", "cellphone": f"98000000{n:02d}"}
+
+    def test_creates_the_full_actor_chain_in_fixed_queries(self):
+        Vendor.objects.create(**{**self._vendor(0), "currency": self.currency}, branch=self.branch)  # takes AT00001
+
+        # FK and unique checks, code scan and one insert per table (history split in two by SQLite's parameter cap).
+        with self.assertNumQueries(17):
+            result = bulk_import_actors(Vendor, [self._vendor(n) for n in range(1, 41)], branch=self.branch)
+
+        self.assertEqual((result.created, result.accounting_actors), (40, 40))
+        self.assertEqual(MainActor.objects.filter(actor_type="vendor").count(), 41)
+        codes = sorted(Accounts.objects.filter(account_class="actor").values_list("code", flat=True))
+        self.assertEqual(codes[0], "AT00001")
+        self.assertEqual(codes[-1], "AT00041")
+        actor = AccountingActor.objects.get(name="Vendor 7")
+        self.assertEqual(actor.account.name, "Vendor 7")
+        self.assertEqual(Vendor.history.filter(name="Vendor 7").count(), 1)
+
+    def test_reuses_accounting_actor_with_same_name(self):
+        AccountingActor.objects.create(name="ACME", branch=self.branch)
+        result = bulk_import_actors(
+            Customer,
+            [{"customer_type": "company", "country": "Nepal", "address_line_1": "x", "mobile_country_code": "+977",
+              "mobile_no": "1", "currency_id": self.currency.pk, "company": {"company_name": "ACME"}}],
+            branch=self.branch,
+        )
+        self.assertEqual((result.accounting_actors, result.reused_accounting_actors), (0, 1))
+        self.assertEqual(MainActor.objects.get(customer__isnull=False).display_name, "ACME")
+        self.assertEqual(Customer.objects.get().company.company_name, "ACME")
+
+    def test_invalid_rows_write_nothing(self):
+        rows = [self._vendor(1), {**self._vendor(2), "currency": "00000000-0000-0000-0000-000000000000", "bogus": 1}]
+        with self.assertRaises(ValidationError) as ctx:
+            bulk_import_actors(Vendor, rows, branch=self.branch)
+        self.assertEqual(set(ctx.exception.message_dict), {"1.currency", "1.bogus"})
+        self.assertFalse(Vendor.objects.exists())
+
+    def test_unique_conflicts_reported_per_row(self):
+        Vendor.objects.create(**{**self._vendor(1), "currency": self.currency}, branch=self.branch)
+        rows = [self._vendor(1), self._vendor(2), self._vendor(2)]
+        with self.assertRaises(ValidationError) as ctx:
+            bulk_import_actors(Vendor, rows, branch=self.branch)
+        self.assertEqual(set(ctx.exception.message_dict), {"0.name", "2.name"})
+        self.assertEqual(Vendor.objects.count(), 1)
+
+    def test_customer_with_person_and_company_rejected(self):
+        row = {"customer_type": "company", "country": "Nepal", "address_line_1": "x", "mobile_country_code": "+977",
+               "mobile_no": "1", "currency_id": self.currency.pk,
+               "person": {"first_name": "A", "last_name": "B"}, "company": {"company_name": "ACME"}}
+        with self.assertRaises(ValidationError) as ctx:
+            bulk_import_actors(Customer, [row], branch=self.branch)
+        self.assertIn("0.company", ctx.exception.message_dict)
+        self.assertFalse(Customer.objects.exists())
+
+    def test_endpoint(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.post("/api/actors/vendors/bulk-import/", {"rows": [self._vendor(1), self._vendor(2)]}, format="json")
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(response.json()["created"], 2)
+        self.assertEqual(client.post("/api/actors/vendors/bulk-import/", [{"name": ""}], format="json").status_code, 400)
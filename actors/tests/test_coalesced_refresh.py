@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.test import TestCase
+
+from actors.models import Customer, CustomerCompany, MainActor, Vendor
+from master.models import Branch, Currency
+
+
+class CoalescedMainActorRefreshTests(TestCase):
+    def setUp(self):
+        self.branch = Branch.objects.create(name="Main", address="x", city="x", state="x", country="x", contact_number="1", is_main_branch=True)
+        self.currency = Currency.objects.create(code="XTS", name="Test", symbol="T", decimal_places=2)
+        self.user = get_user_model().objects.create_user(username="coalesce", email="coalesce@example.com", password="x", branch=self.branch)
+
+    def test_company_edits_refresh_the_main_actor_once_per_transaction(self):
+        customer = Customer.objects.create(
+            customer_type="company", country="Nepal", address_line_1="x", mobile_country_code="+977",
+            mobile_no="9812345678", currency=self.currency, branch=self.branch,
+        )
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            company = CustomerCompany.objects.create(customer=customer, company_name="Globex 0")
+            for n in range(1, 6):
+                company.company_name = f"Globex {n}"
+                company.save()
+
+        self.assertEqual(len(callbacks), 1)
+        actor = MainActor.objects.get(customer=customer)
+        self.assertEqual(actor.display_name, "Globex 5")
+        self.assertEqual(actor.history.filter(display_name__startswith="Globex").count(), 1)
+
+    def test_repeated_vendor_saves_upsert_once_with_the_final_state(self):
+        vendor = Vendor.objects.create(
+            name="Initial", address="x", country="Nepal", currency=self.currency, branch=self.branch,
+            cellphone_country_code="+977", cellphone="9800000001",
+        )
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            for n in range(3):
+                vendor.name = f"Renamed {n}"
+                vendor.save()
+            self.assertEqual(MainActor.objects.get(vendor=vendor).display_name, "Initial")
+
+        self.assertEqual(len(callbacks), 1)
+        actor = MainActor.objects.get(vendor=vendor)
+        self.assertEqual((actor.display_name, actor.accounting_actor.name), ("Renamed 2", "Renamed 2"))
+
+    def test_rolled_back_savepoint_does_not_swallow_later_refreshes(self):
+        vendor = Vendor.objects.create(
+            name="Initial", address="x", country="Nepal", currency=self.currency, branch=self.branch,
+            cellphone_country_code="+977", cellphone="9800000001",
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    vendor.name = "Discarded"
+                    vendor.save()
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            vendor.name = "Kept"
+            vendor.save()
+
+        self.assertEqual(MainActor.objects.get(vendor=vendor).display_name, "Kept")
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from actors import exposure
+from actors.exposure import ExposureSource, check_credit
+from actors.models import ActorExposure, Customer, MainActor
+from master.models import Branch, Currency
+
+
+class CreditExposureTests(TestCase):
+    def setUp(self):
+        self.branch = Branch.objects.create(name="Main", address="x", city="x", state="x", country="x", contact_number="1", is_main_branch=True)
+        self.currency = Currency.objects.create(code="XTS", name="Test", symbol="T", decimal_places=2)
+        self.user = get_user_model().objects.create_user(username="credit", email="credit@example.com", password="x", branch=self.branch)
+        self.customer = Customer.objects.create(
+            customer_type="company", country="Nepal", address_line_1="x", mobile_country_code="+977",
+            mobile_no="9812345678", currency=self.currency, branch=self.branch,
+            credit_limit=Decimal("1000.00"), days_limit=30,
+        )
+        self.actor = MainActor.objects.get(customer=self.customer)
+
+    def test_check_reads_exposure_and_party_limits_in_one_query(self):
+        ActorExposure.objects.create(
+            main_actor=self.actor, open_balance=Decimal("900.00"), open_items=2,
+            oldest_open_date=timezone.localdate() - timedelta(days=45), overdue_amount=Decimal("400.00"),
+        )
+
+        with self.assertNumQueries(1):
+            check = check_credit(party=self.customer, amount=Decimal("200.00"))
+
+        self.assertFalse(check.allowed)
+        self.assertEqual(len(check.reasons), 2)
+        self.assertEqual((check.available, check.days_outstanding), (Decimal("100.00"), 45))
+
+        Customer.objects.filter(pk=self.customer.pk).update(days_limit=60)
+        self.assertTrue(check_credit(self.actor.pk, amount=Decimal("100.00")).allowed)
+
+    def test_no_exposure_and_no_limit_is_allowed(self):
+        Customer.objects.filter(pk=self.customer.pk).update(credit_limit=0, days_limit=0)
+        check = check_credit(self.actor, amount=Decimal("1000000"))
+        self.assertTrue(check.allowed)
+        self.assertIsNone(check.available)
+
+    def test_credit_check_endpoint(self):
+        ActorExposure.objects.create(main_actor=self.actor, open_balance=Decimal("950.00"))
+        client = APIClient()
+        client.force_authenticate(self.user)
+        self.assertEqual(client.get("/api/actors/credit-check/", {"actor": str(self.actor.pk)}).status_code, 503)
+
+        with mock.patch("actors.views.exposure_tracked", return_value=True):
+            response = client.get("/api/actors/credit-check/", {"actor": str(self.actor.pk), "amount": "100"})
+
+            self.assertEqual(client.get("/api/actors/credit-check/").status_code, 400)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.data["allowed"])
+        self.assertEqual(response.data["open_balance"], Decimal("950.00"))
+
+    def test_moving_a_document_refreshes_both_parties(self):
+        other = Customer.objects.create(
+            customer_type="company", country="Nepal", address_line_1="x", mobile_country_code="+977",
+            mobile_no="9812345679", currency=self.currency, branch=self.branch,
+        )
+        # Any model with a party FK will do; MainActor.customer stands in for Sales.customer.
+        source = ExposureSource(MainActor, "customer", "open_balance", "created", None, exposure.Q())
+        document = MainActor.objects.get(pk=self.actor.pk)
+        document.customer_id = other.pk
+
+        with mock.patch.object(exposure, "_SOURCES", [source]), mock.patch.object(exposure, "refresh_exposure") as refresh:
+            with self.captureOnCommitCallbacks(execute=True):
+                exposure._remember_party(MainActor, document)
+                exposure._source_changed(MainActor, document)
+
+        self.assertCountEqual(refresh.call_args_list, [mock.call(Customer, other.pk), mock.call(Customer, self.customer.pk)])
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from accounting.models import Accounts, Actors as AccountingActor, ChequeRegister
+from actors.dedup import find_duplicate_candidates, merge_actors
+from actors.models import MainActor, Vendor
+from actors.utils import dedup_name_key
+from master.models import Branch, Currency
+
+
+class ActorDedupTests(TestCase):
+    def setUp(self):
+        self.branch = Branch.objects.create(name="Main", address="x", city="x", state="x", country="x", contact_number="1", is_main_branch=True)
+        self.other = Branch.objects.create(name="Other", address="x", city="x", state="x", country="x", contact_number="2")
+        self.currency = Currency.objects.create(code="XTS", name="Test", symbol="T", decimal_places=2)
+        self.user = get_user_model().objects.create_user(username="dedup", email="dedup@example.com", password="x", branch=self.branch)
+        self._n = 0
+
+    def _vendor(self, name, branch=None, **extra):
+        self._n += 1
+        fields = {"cellphone_country_code": "+977", "cellphone": f"98{self._n:08d}", **extra}
+        return Vendor.objects.create(
+            name=name, address="x", country="Nepal", currency=self.currency, branch=branch or self.branch, **fields
+        )
+
+    def test_dedup_key_ignores_case_punctuation_and_legal_form(self):
+        self.assertEqual({dedup_name_key(n) for n in ["ACME Ltd", "Acme Limited", "ACME LTD.", "acme"]}, {"acme"})
+        self.assertEqual(dedup_name_key("Smith & Sons Pvt. Ltd"), "smithsons")
+        self.assertEqual(dedup_name_key("The Company"), "thecompany")
+
+    def test_candidates_come_from_blocks_in_fixed_queries(self):
+        acme = self._vendor("ACME Ltd")
+        self._vendor("Acme Limited")
+        self._vendor("ACME LTD.")
+        self._vendor("Acme Freight Services", email="ops@acmefs.com")
+        self._vendor("Acme Freight Servises")
+        self._vendor("Zenith Cargo", email="ops@acmefs.com")
+        self._vendor("Globex")
+        self._vendor("Acme", branch=self.other)
+        self._vendor("Initech", tax_ref_no="NP1")
+        self._vendor("Initrode Holdings", tax_ref_no="np1")
+
+        # Two queries per blocking column (one when no key repeats, as for phone) plus one to load the pairs.
+        with self.assertNumQueries(10):
+            candidates = find_duplicate_candidates()
+
+        names = dict(MainActor.objects.values_list("pk", "display_name"))
+        pairs = {frozenset((names[c.survivor_id], names[c.duplicate_id])) for c in candidates}
+        self.assertEqual(pairs, {
+            frozenset(("ACME Ltd", "Acme Limited")),
+            frozenset(("ACME Ltd", "ACME LTD.")),
+            frozenset(("Acme Limited", "ACME LTD.")),
+            frozenset(("Acme Freight Services", "Acme Freight Servises")),
+            frozenset(("Initech", "Initrode Holdings")),
+        })
+        first = next(c for c in candidates if names[c.duplicate_id] == "Acme Limited")
+        self.assertEqual(first.survivor_id, acme.main_actor.pk)
+
+    def test_merge_repoints_references_and_combines_balances(self):
+        survivor_vendor = self._vendor("ACME Ltd")
+        duplicate_vendor = self._vendor("Acme Limited")
+        survivor, duplicate = MainActor.objects.get(vendor=survivor_vendor), MainActor.objects.get(vendor=duplicate_vendor)
+        Accounts.objects.filter(actor=survivor.accounting_actor).update(balance=Decimal("10.00"))
+        Accounts.objects.filter(actor=duplicate.accounting_actor).update(balance=Decimal("5.00"))
+        cheque = ChequeRegister.objects.create(branch=self.branch, contact=duplicate.accounting_actor, amount=Decimal("5.00"))
+
+        merge_actors(survivor, duplicate)
+
+        self.assertFalse(Vendor.objects.filter(pk=duplicate_vendor.pk).exists())
+        self.assertFalse(MainActor.objects.filter(pk=duplicate.pk).exists())
+        cheque.refresh_from_db()
+        self.assertEqual(cheque.contact_id, survivor.accounting_actor_id)
+        self.assertEqual(AccountingActor.objects.count(), 1)
+        self.assertEqual(Accounts.objects.get(actor=survivor.accounting_actor).balance, Decimal("15.00"))
+
+    def test_commands(self):
+        keep = self._vendor("ACME Ltd")
+        drop = self._vendor("Acme Limited")
+        out = StringIO()
+        call_command("find_duplicate_actors", stdout=out, stderr=StringIO())
+        self.assertIn("Acme Limited", out.getvalue())
+
+        call_command("merge_actors", str(keep.main_actor.pk), str(drop.main_actor.pk), stdout=StringIO())
+        self.assertEqual(list(Vendor.objects.values_list("name", flat=True)), ["ACME Ltd"])
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from actors.directory import rebuild_directory
+from actors.models import Customer, CustomerCompany, MainActor, Vendor
+from master.models import Branch, Currency
+
+
+class ActorDirectoryTests(TestCase):
+    url = "/api/actors/directory/search/"
+
+    def setUp(self):
+        self.branch = Branch.objects.create(name="Main", address="x", city="x", state="x", country="x", contact_number="1", is_main_branch=True)
+        self.other = Branch.objects.create(name="Other", address="x", city="x", state="x", country="x", contact_number="2")
+        self.currency = Currency.objects.create(code="XTS", name="Test", symbol="T", decimal_places=2)
+        self.user = get_user_model().objects.create_user(username="dir", email="dir@example.com", password="x", branch=self.branch)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _vendor(self, name, branch=None, **extra):
+        return Vendor.objects.create(
+            name=name, address="x", country="Nepal", currency=self.currency, branch=branch or self.branch,
+            cellphone_country_code="+977", cellphone=extra.pop("cellphone", "9800000000"), **extra,
+        )
+
+    def test_signals_fill_directory_columns(self):
+        vendor = self._vendor("ACME Freight  Ltd", cellphone="980-111 2222", email="Ops@Acme.com", tax_ref_no="np123")
+        actor = vendor.main_actor
+        self.assertEqual(
+            (actor.search_name, actor.phone, actor.email, actor.tax_ref),
+            ("acme freight ltd", "9801112222", "ops@acme.com", "NP123"),
+        )
+
+        customer = Customer.objects.create(
+            customer_type="company", country="Nepal", address_line_1="x", mobile_country_code="+977",
+            mobile_no="9812345678", currency=self.currency, branch=self.branch,
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            CustomerCompany.objects.create(customer=customer, company_name="Globex", email="hi@globex.com")
+        actor = MainActor.objects.get(customer=customer)
+        self.assertEqual((actor.search_name, actor.email, actor.phone), ("globex", "hi@globex.com", "9812345678"))
+
+    def test_ranked_search_across_types_and_branch_scope(self):
+        self._vendor("Super Acme")
+        self._vendor("Acme")
+        self._vendor("Acmeville Traders")
+        self._vendor("Acme Elsewhere", branch=self.other)
+
+        names = [r["display_name"] for r in self.client.get(self.url, {"q": "acme"}).json()["results"]]
+        self.assertEqual(names, ["Acme", "Acme Elsewhere", "Acmeville Traders", "Super Acme"])
+
+        self.user.branch = self.other
+        self.user.save()
+        names = [r["display_name"] for r in self.client.get(self.url, {"q": "ACME"}).json()["results"]]
+        self.assertEqual(names, ["Acme Elsewhere"])
+
+    def test_phone_lookup_and_rebuild(self):
+        vendor = self._vendor("Initech", cellphone="9807776666")
+        MainActor.objects.filter(pk=vendor.main_actor.pk).update(search_name="", phone="")
+        self.assertEqual(rebuild_directory(), 1)
+
+        results = self.client.get(self.url, {"q": "+977 980-777-6666", "type": "vendor"}).json()["results"]
+        self.assertEqual([(r["display_name"], r["record_id"], r["rank"]) for r in results], [("Initech", str(vendor.pk), 0)])
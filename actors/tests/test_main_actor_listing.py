@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from actors.models import Customer, MainActor, Vendor
+from master.models import Branch, Currency
+
+
+class MainActorListingTests(TestCase):
+    def setUp(self):
+        self.branch = Branch.objects.create(name="Main", address="x", city="x", state="x", country="x", contact_number="1", is_main_branch=True)
+        self.currency = Currency.objects.create(code="XTS", name="Test", symbol="T", decimal_places=2)
+        self.user = get_user_model().objects.create_user(username="listing", email="listing@example.com", password="x", branch=self.branch)
+        for index in range(3):
+            Vendor.objects.create(
+                name=f"Vendor {index}", address="x", country="Nepal", currency=self.currency, branch=self.branch,
+                cellphone_country_code="+977", cellphone=f"980000000{index}",
+            )
+        for index in range(2):
+            Customer.objects.create(
+                customer_type="company", country="Nepal", address_line_1="x", mobile_country_code="+977",
+                mobile_no=f"981234567{index}", currency=self.currency, branch=self.branch,
+            )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_list_reads_parties_with_one_query_per_actor_type(self):
+        # count, page, facets, vendors, customers
+        with self.assertNumQueries(5):
+            response = self.client.get("/api/actors/main-actors/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 5)
+        vendors = [row for row in response.data["results"] if row["actor_type"] == MainActor.ActorType.VENDOR]
+        self.assertEqual(sorted(row["party"]["name"] for row in vendors), ["Vendor 0", "Vendor 1", "Vendor 2"])
+        self.assertTrue(all(row["party"] for row in response.data["results"]))
+        self.assertEqual(response.data["facets"]["vendor"], 3)
+        self.assertEqual(response.data["facets"]["customer"], 2)
+        self.assertEqual(response.data["facets"]["carrier"], 0)
+
+    def test_facets_ignore_the_actor_type_filter(self):
+        response = self.client.get("/api/actors/main-actors/", {"actor_type": "customer"})
+
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual((response.data["facets"]["vendor"], response.data["facets"]["customer"]), (3, 2))
+
+    def test_retrieve_includes_party(self):
+        actor = MainActor.objects.filter(actor_type=MainActor.ActorType.CUSTOMER).first()
+        response = self.client.get(f"/api/actors/main-actors/{actor.pk}/")
+        self.assertEqual(response.data["party"]["customer_type"], "company")
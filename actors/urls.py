@@ -3,7 +3,7 @@ from rest_framework_bulk.routes import BulkRouter
 from actors.views import (
     BookingAgencyViewSet, CarrierViewSet, CustomsAgentViewSet, VendorViewSet,
     CustomerViewSet, DepartmentViewSet, DesignationViewSet, EmployeeViewSet,
-    MainActorViewSet,
+    MainActorViewSet, ActorDirectorySearchView, CreditCheckView,
 )
 
 router = BulkRouter()
@@ -18,5 +18,7 @@ router.register(r"employees", EmployeeViewSet, basename="employee")
 router.register(r"main-actors", MainActorViewSet, basename="main-actor")
 
 urlpatterns = [
+    path("directory/search/", ActorDirectorySearchView.as_view(), name="actor-directory-search"),
+    path("credit-check/", CreditCheckView.as_view(), name="actor-credit-check"),
     path("", include(router.urls)),
 ]
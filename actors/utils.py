@@ -1,40 +1,156 @@
 from __future__ import annotations
+import re
 from typing import Optional
-from actors.models import MainActor
+from django.utils import timezone
+from actors.models import Customer, MainActor
+from core.utils.onCommit import coalesce_on_commit
+
+_NON_DIGITS = re.compile(r"\D+")
+_SPACES = re.compile(r"\s+")
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+# Dropped from dedup keys, so "ACME Ltd", "Acme Limited" and "ACME LTD." share one.
+LEGAL_SUFFIXES = frozenset({
+    "the", "and", "co", "company", "corp", "corporation", "inc", "incorporated", "llc", "llp",
+    "ltd", "limited", "plc", "pvt", "private", "pte", "gmbh", "sa", "pty",
+})
+
+# Phone / email / tax reference attributes per linked model, first non-empty wins.
+DIRECTORY_SOURCES = {
+    "phone": ("cellphone", "mobile", "mobile_no", "telephone", "telephone_no"),
+    "email": ("email", "primary_email"),
+    "tax_ref": ("tax_ref_no", "trn"),
+}
+
+
+def normalize_search_name(value) -> str:
+    return _SPACES.sub(" ", str(value or "")).strip().lower()[:255]
+
+
+def dedup_name_key(value) -> str:
+    """
+    Name blocking key for actors.dedup: lowercase alphanumerics without legal-form words or spacing.
+    """
+    tokens = _NON_ALNUM.split(str(value or "").lower().replace("&", " and "))
+    tokens = [t for t in tokens if t]
+    kept = [t for t in tokens if t not in LEGAL_SUFFIXES] or tokens
+    return "".join(kept)[:255]
+
+
+def name_fields(display_name) -> dict:
+    """
+    MainActor columns derived from the display name.
+    """
+    return {"search_name": normalize_search_name(display_name), "dedup_key": dedup_name_key(display_name)}
+
+
+def normalize_phone(value) -> str:
+    return _NON_DIGITS.sub("", str(value or ""))[:30]
+
+
+def actor_directory_fields(instance, detail=None, lookup_detail=True) -> dict:
+    """
+    MainActor directory columns for a linked actor record. `detail` is a Customer's
+    person/company row when the caller already has it; bulk import passes
+    lookup_detail=False so a customer without one costs no query.
+    """
+    values = {}
+    for column, attrs in DIRECTORY_SOURCES.items():
+        values[column] = next((getattr(instance, a) for a in attrs if getattr(instance, a, None)), "") or ""
+
+    if detail is None and lookup_detail and isinstance(instance, Customer):
+        # Reverse one-to-ones raise an AttributeError subclass when missing.
+        detail = getattr(instance, "person", None) or getattr(instance, "company", None)
+    if detail is not None and not values["email"]:
+        values["email"] = detail.email or ""
+
+    return {
+        "phone": normalize_phone(values["phone"]),
+        "email": values["email"].strip().lower()[:254],
+        "tax_ref": values["tax_ref"].strip().upper()[:100],
+    }
 
 
 def _sync_accounting_actor(main_actor: MainActor) -> None:
+    """
+    Keeps main_actor.accounting_actor in step: one pk lookup for linked actors. An
+    unlinked MainActor adopts an unlinked accounting actor with its name (rows created
+    before the link existed), else gets a new one.
+    """
     from accounting.models import Actors as AccountingActor
 
     if not main_actor.branch_id or not main_actor.display_name:
         return
 
-    defaults = {
-        "branch_id": main_actor.branch_id,
-        "name": main_actor.display_name,
-        "active": main_actor.active,
-        "user_add": main_actor.user_add,
-    }
+    if main_actor.accounting_actor_id:
+        actor = AccountingActor.objects.filter(pk=main_actor.accounting_actor_id).first()
+        if actor is not None:
+            updates = {}
+            if actor.name != main_actor.display_name:
+                updates["name"] = main_actor.display_name
+            if actor.active != main_actor.active:
+                updates["active"] = main_actor.active
+            if updates:
+                for key, value in updates.items():
+                    setattr(actor, key, value)
+                # Actors.save() renames the linked ledger account too.
+                actor.save(update_fields=list(updates.keys()) + ["updated"])
+            return
 
-    actor, created = AccountingActor.objects.get_or_create(
-        branch_id=main_actor.branch_id,
-        name=main_actor.display_name,
-        defaults=defaults,
+    actor = (
+        AccountingActor.objects.filter(branch_id=main_actor.branch_id, name=main_actor.display_name, main_actor__isnull=True)
+        .order_by("created")
+        .first()
     )
-    if created:
-        return
+    if actor is None:
+        actor = AccountingActor.objects.create(
+            branch_id=main_actor.branch_id,
+            name=main_actor.display_name,
+            active=main_actor.active,
+            user_add=main_actor.user_add,
+        )
+    main_actor.accounting_actor = actor
+    # Queryset update: no second MainActor save (and history row) just for the link.
+    MainActor.objects.filter(pk=main_actor.pk).update(accounting_actor=actor, updated=timezone.now())
+
+
+def merge_accounting_actors(survivor, duplicates) -> None:
+    """
+    Folds duplicate accounting Actors into `survivor`: references and ledger
+    entries are repointed, duplicate account balances are added to the
+    survivor's account, and the duplicates and their accounts are deleted.
+    """
+    from django.db.models import F, Sum
+
+    from accounting.models import Accounts, Actors as AccountingActor
+    from core.utils.mergeRecords import repoint_references
 
-    updates = {}
-    if actor.active != main_actor.active:
-        updates["active"] = main_actor.active
-    if updates:
-        for key, value in updates.items():
-            setattr(actor, key, value)
-        actor.save(update_fields=list(updates.keys()) + ["updated"])
+    duplicate_ids = [actor.pk for actor in duplicates]
+    repoint_references(AccountingActor, duplicate_ids, survivor.pk)
+
+    account_ids = [actor.account_id for actor in duplicates if actor.account_id]
+    if account_ids and survivor.account_id is None:
+        survivor.account_id = account_ids.pop(0)
+        AccountingActor.objects.filter(pk=survivor.pk).update(account_id=survivor.account_id, updated=timezone.now())
+        AccountingActor.objects.filter(pk__in=duplicate_ids, account_id=survivor.account_id).update(account=None)
+
+    AccountingActor.objects.filter(pk__in=duplicate_ids).delete()
+    if account_ids:
+        moved = Accounts.objects.filter(pk__in=account_ids).aggregate(total=Sum("balance"))["total"] or 0
+        repoint_references(Accounts, account_ids, survivor.account_id)
+        Accounts.objects.filter(pk=survivor.account_id).update(balance=F("balance") + moved, updated=timezone.now())
+        Accounts.objects.filter(pk__in=account_ids).delete()
 
 
 def upsert_main_actor(instance, field_name: str, actor_type: str) -> MainActor:
-    defaults = {"branch": instance.branch, "actor_type": actor_type, "display_name": str(instance)}
+    display_name = str(instance)
+    defaults = {
+        "branch": instance.branch,
+        "actor_type": actor_type,
+        "display_name": display_name,
+        **name_fields(display_name),
+        **actor_directory_fields(instance),
+    }
     obj, _ = MainActor.objects.update_or_create(**{field_name: instance}, defaults=defaults)
     _sync_accounting_actor(obj)
     return obj
@@ -49,7 +165,39 @@ def refresh_customer_main_actor_display(customer) -> None:
         return
     ma = customer.main_actor
     ma.display_name = str(customer)
-    ma.save(update_fields=["display_name", "updated"])
+    directory = {**name_fields(ma.display_name), **actor_directory_fields(customer)}
+    for key, value in directory.items():
+        setattr(ma, key, value)
+    ma.save(update_fields=["display_name", *directory, "updated"])
+    _sync_accounting_actor(ma)
+
+
+def schedule_main_actor_upsert(instance, field_name: str, actor_type: str) -> None:
+    """
+    Coalesced upsert_main_actor: one run per actor when the transaction commits.
+    """
+    model, pk = type(instance), instance.pk
+
+    def _upsert():
+        current = model._base_manager.filter(pk=pk).first()
+        if current is not None:
+            upsert_main_actor(current, field_name=field_name, actor_type=actor_type)
+
+    coalesce_on_commit(("actors.main_actor_upsert", model._meta.label_lower, pk), _upsert)
+
+
+def schedule_customer_display_refresh(customer_id) -> None:
+    """
+    Coalesced refresh_customer_main_actor_display: one run per customer when the
+    transaction commits, however many person / company rows changed.
+    """
+
+    def _refresh():
+        customer = Customer.objects.select_related("main_actor").filter(pk=customer_id).first()
+        if customer is not None:
+            refresh_customer_main_actor_display(customer)
+
+    coalesce_on_commit(("actors.customer_display_refresh", customer_id), _refresh)
 
 
 def get_main_actor_for_instance(instance) -> Optional[MainActor]:
@@ -1,5 +1,13 @@
+from decimal import Decimal, InvalidOperation
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError
 from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 
@@ -13,7 +21,10 @@ from actors.filters import (
     BookingAgencyFilter, CarrierFilter, CustomsAgentFilter, VendorFilter, CustomerFilter,
     DepartmentFilter, DesignationFilter, EmployeeFilter, MainActorFilter,
 )
-from core.utils.BaseModelViewSet import BaseModelViewSet 
+from actors.bulk import bulk_import_actors
+from actors.directory import actor_type_facets, party_summaries, search_directory
+from actors.exposure import check_credit, exposure_tracked
+from core.utils.BaseModelViewSet import BaseModelViewSet, BranchScopedMixin
 
 
 class BulkCreateMixin:
@@ -26,7 +37,39 @@ class BulkCreateMixin:
         return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
 
 
-class BookingAgencyViewSet(BaseModelViewSet):
+class BulkImportActorsMixin:
+    """
+    POST <list>/bulk-import/ with a list of rows (or {"rows": [...]}) for large contact
+    imports; see actors.bulk. Rows land in the caller's branch.
+    """
+
+    @action(detail=False, methods=["post"], url_path="bulk-import")
+    def bulk_import(self, request, *args, **kwargs):
+        rows = request.data.get("rows") if isinstance(request.data, dict) else request.data
+        if not isinstance(rows, list) or not rows:
+            raise ValidationError({"rows": "Send a non-empty list of rows."})
+        branch = getattr(request.user, "branch", None)
+        if branch is None:
+            raise ValidationError({"branch": "User has no branch."})
+
+        try:
+            result = bulk_import_actors(self.get_queryset().model, rows, branch=branch)
+        except DjangoValidationError as e:
+            raise ValidationError(e.message_dict)
+        except IntegrityError:
+            # Conflicts are checked per row up front; this is a concurrent write winning the race.
+            raise ValidationError({"rows": "The import conflicts with records saved meanwhile; nothing was written."})
+        return Response(
+            {
+                "created": result.created,
+                "accounting_actors": result.accounting_actors,
+                "reused_accounting_actors": result.reused_accounting_actors,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class BookingAgencyViewSet(BulkImportActorsMixin, BaseModelViewSet):
     queryset = BookingAgency.objects.all()
     serializer_class = BookingAgencySerializer
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -35,7 +78,7 @@ class BookingAgencyViewSet(BaseModelViewSet):
     ordering_fields = ["name", "created"]
 
 
-class CarrierViewSet(BaseModelViewSet):
+class CarrierViewSet(BulkImportActorsMixin, BaseModelViewSet):
     queryset = Carrier.objects.all()
     serializer_class = CarrierSerializer
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -44,7 +87,7 @@ class CarrierViewSet(BaseModelViewSet):
     ordering_fields = ["name", "created"]
 
 
-class CustomsAgentViewSet(BaseModelViewSet):
+class CustomsAgentViewSet(BulkImportActorsMixin, BaseModelViewSet):
     queryset = CustomsAgent.objects.all()
     serializer_class = CustomsAgentSerializer
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -53,7 +96,7 @@ class CustomsAgentViewSet(BaseModelViewSet):
     ordering_fields = ["name", "created"]
 
 
-class VendorViewSet(BaseModelViewSet):
+class VendorViewSet(BulkImportActorsMixin, BaseModelViewSet):
     queryset = Vendor.objects.all()
     serializer_class = VendorSerializer
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -62,7 +105,7 @@ class VendorViewSet(BaseModelViewSet):
     ordering_fields = ["name", "created"]
 
 
-class CustomerViewSet(BaseModelViewSet):
+class CustomerViewSet(BulkImportActorsMixin, BaseModelViewSet):
     queryset = Customer.objects.all().select_related("currency", "account")
     serializer_class = CustomerSerializer
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -71,7 +114,7 @@ class CustomerViewSet(BaseModelViewSet):
     ordering_fields = ["created", "mobile_no"]
 
 
-class DepartmentViewSet(BaseModelViewSet):
+class DepartmentViewSet(BulkImportActorsMixin, BaseModelViewSet):
     queryset = Department.objects.all()
     serializer_class = DepartmentSerializer
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -80,7 +123,7 @@ class DepartmentViewSet(BaseModelViewSet):
     ordering_fields = ["name", "created"]
 
 
-class DesignationViewSet(BaseModelViewSet):
+class DesignationViewSet(BulkImportActorsMixin, BaseModelViewSet):
     queryset = Designation.objects.all()
     serializer_class = DesignationSerializer
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -89,7 +132,7 @@ class DesignationViewSet(BaseModelViewSet):
     ordering_fields = ["name", "created"]
 
 
-class EmployeeViewSet(BaseModelViewSet):
+class EmployeeViewSet(BulkImportActorsMixin, BaseModelViewSet):
     queryset = Employee.objects.all().select_related("department", "account").prefetch_related("designations")
     serializer_class = EmployeeSerializer
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -98,10 +141,103 @@ class EmployeeViewSet(BaseModelViewSet):
     ordering_fields = ["first_name", "last_name", "created"]
 
 
-class MainActorViewSet(viewsets.ReadOnlyModelViewSet):
+class MainActorViewSet(BranchScopedMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Each row carries its linked party's summary under "party", read with one
+    query per actor type on the page; list() adds {"facets": {actor_type: count}}
+    for the current filters other than actor_type itself.
+    """
     queryset = MainActor.objects.all()
     serializer_class = MainActorSerializer
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_class = MainActorFilter
-    search_fields = ["display_name"]
+    search_fields = ["search_name", "phone", "email", "tax_ref"]
     ordering_fields = ["display_name", "created"]
+
+    def _with_parties(self, actors):
+        data = self.get_serializer(actors, many=True).data
+        summaries = party_summaries(actors)
+        for actor, row in zip(actors, data):
+            row["party"] = summaries.get(actor.pk)
+        return data
+
+    def _facet_queryset(self):
+        params = self.request.query_params.copy()
+        params.pop("actor_type", None)
+        queryset = self.filterset_class(params, queryset=self.get_queryset(), request=self.request).qs
+        return SearchFilter().filter_queryset(self.request, queryset, self)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        facets = actor_type_facets(self._facet_queryset())
+        if page is None:
+            return Response({"results": self._with_parties(list(queryset)), "facets": facets})
+        response = self.get_paginated_response(self._with_parties(page))
+        response.data["facets"] = facets
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        return Response(self._with_parties([self.get_object()])[0])
+
+
+class ActorDirectorySearchView(APIView):
+    """
+    GET ?q=<name, phone, email or tax ref>&type=vendor&type=customer&limit=20
+    Ranked matches across every party type, in the caller's branch scope.
+    """
+    permission_classes = [IsAuthenticated]
+    max_limit = 100
+
+    def get(self, request):
+        try:
+            limit = max(1, min(int(request.query_params.get("limit", 20)), self.max_limit))
+        except ValueError:
+            raise ValidationError({"limit": "Must be an integer."})
+
+        queryset = MainActor.objects.all()
+        branch = getattr(request.user, "branch", None)
+        if branch is None:
+            queryset = queryset.none()
+        elif not branch.is_main_branch:
+            queryset = queryset.filter(branch=branch)
+
+        results = search_directory(
+            queryset,
+            request.query_params.get("q", ""),
+            actor_types=request.query_params.getlist("type") or None,
+            limit=limit,
+        )
+        return Response({"results": results})
+
+
+class CreditCheckView(APIView):
+    """
+    GET ?actor=<main actor id>&amount=<new document total>
+    The actor's open balance, overdue amount and limits, and whether `amount` more is allowed.
+    503 while no installed app registers exposure sources (see actors.exposure).
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        if not exposure_tracked():
+            return Response(
+                {"detail": "Credit exposure is not tracked: no exposure sources are installed."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+        actor_id = request.query_params.get("actor")
+        if not actor_id:
+            raise ValidationError({"actor": "This parameter is required."})
+        try:
+            amount = Decimal(request.query_params.get("amount") or 0)
+        except InvalidOperation:
+            raise ValidationError({"amount": "Must be a number."})
+
+        try:
+            check = check_credit(actor_id, amount=amount)
+        except DjangoValidationError:
+            raise ValidationError({"actor": "Invalid id."})
+        branch = getattr(request.user, "branch", None)
+        if check is None or branch is None or (not branch.is_main_branch and check.branch_id != branch.pk):
+            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(check.as_dict())
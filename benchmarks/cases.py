@@ -0,0 +1,140 @@
+"""
+Benchmark cases for the core write paths.
+
+A case is registered with @case(name, requires=(apps...)). It receives the
+shared Context, performs its own setup, and returns the operation to time:
+a callable taking the iteration number. Cases whose apps are not installed
+are skipped by the runner.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from benchmarks import generators
+
+CASES = {}
+
+
+@dataclass
+class Context:
+    rng: random.Random
+    branch: object = None
+    user: object = None
+    currency: object = None
+    extra: dict = field(default_factory=dict)
+
+
+def case(name: str, requires: tuple = ()):
+    def decorator(func):
+        CASES[name] = (func, tuple(requires))
+        return func
+
+    return decorator
+
+
+@case("journal_voucher_create_approve", requires=("accounting",))
+def journal_voucher_create_approve(ctx: Context):
+    from accounting.models import Accounts
+
+    coa = generators.make_chart_of_accounts(ctx.rng, ctx.branch, count=20)
+    accounts = list(Accounts.objects.filter(pk__in=[c.account_id for c in coa]))
+
+    def op(i):
+        voucher = generators.make_journal_voucher(ctx.rng, ctx.branch, accounts, lines=3)
+        voucher.approved = True
+        voucher.save()
+
+    return op
+
+
+@case("actor_upsert_batch", requires=("actors", "accounting"))
+def actor_upsert_batch(ctx: Context):
+    # One op = create 10 vendors (MainActor + accounting actor + ledger account) and rename them.
+    def op(i):
+        vendors = generators.make_vendors(ctx.rng, ctx.branch, ctx.currency, count=10, start=i * 10)
+        for vendor in vendors:
+            vendor.name = f"{vendor.name} Ltd"
+            vendor.save()
+
+    return op
+
+
+@case("actor_bulk_import", requires=("actors", "accounting"))
+def actor_bulk_import(ctx: Context):
+    # Same work as actor_upsert_batch's create step (10 vendors per op) through actors.bulk.
+    from actors.bulk import bulk_import_actors
+    from actors.models import Vendor
+
+    def op(i):
+        rows = [
+            {"name": f"Bulk Vendor {i * 10 + n}", "address": "Benchmark Rd", "country": "Nepal", "currency": ctx.currency.pk,
+             "cellphone_country_code": "+977", "cellphone": f"98{ctx.rng.randint(10000000, 99999999)}"}
+            for n in range(10)
+        ]
+        bulk_import_actors(Vendor, rows, branch=ctx.branch)
+
+    return op
+
+
+@case("shipment_package_hu_sync", requires=("operations", "warehouse"))
+def shipment_package_hu_sync(ctx: Context):
+    shipment = generators.make_shipment(ctx.rng, ctx.branch)
+
+    def op(i):
+        generators.make_package(ctx.rng, shipment, quantity=5, seq=i)
+
+    return op
+
+
+@case("invoice_from_shipment", requires=("operations", "sales", "actors"))
+def invoice_from_shipment(ctx: Context):
+    from actors.models import Customer
+    from operations.models import PaymentSummary, ShipmentCharges
+    from operations.services.invoicing import generate_invoice_from_shipment
+
+    customer = generators.build(Customer, ctx.rng, branch=ctx.branch, currency=ctx.currency, customer_type="company")
+
+    def op(i):
+        shipment = generators.make_shipment(ctx.rng, ctx.branch, seq=i)
+        summary, _ = PaymentSummary.objects.get_or_create(shipment=shipment, defaults={"branch": ctx.branch})
+        for n in range(3):
+            generators.build(
+                ShipmentCharges,
+                ctx.rng,
+                n,
+                branch=ctx.branch,
+                payment_summary=summary,
+                charge_name=f"Freight {n}",
+                qty=Decimal("1.00"),
+            )
+        generate_invoice_from_shipment(shipment_id=shipment.pk, customer_id=customer.pk, currency_id=ctx.currency.pk)
+
+    return op
+
+
+@case("warehouse_moves", requires=("operations", "warehouse"))
+def warehouse_moves(ctx: Context):
+    from warehouse.models import HandlingUnit, InventoryMove
+    from warehouse.utils import log_move
+
+    shipment = generators.make_shipment(ctx.rng, ctx.branch)
+    locations = generators.make_locations(ctx.rng, ctx.branch, count=6)
+    units = [
+        generators.build(HandlingUnit, ctx.rng, n, branch=ctx.branch, shipment=shipment, hu_code=f"HU{n:05d}")
+        for n in range(20)
+    ]
+    move_types = [InventoryMove.MoveType.RECEIVE, InventoryMove.MoveType.PUTAWAY, InventoryMove.MoveType.PICK]
+
+    def op(i):
+        log_move(
+            handling_unit=units[i % len(units)],
+            move_type=move_types[i % len(move_types)],
+            to_location=ctx.rng.choice(locations),
+            branch=ctx.branch,
+            user=ctx.user,
+        )
+
+    return op
@@ -0,0 +1,108 @@
+"""
+Concurrent read/write benchmark for the SQLite connection profile.
+
+    python -m benchmarks.db_concurrency --readers 8 --writers 2 --seconds 5
+
+Runs the same mixed workload against a scratch database twice: once as stock
+Django/sqlite3 connects (rollback journal, the stdlib's 5 s lock wait) and
+once with the pragmas from core.utils.dbTuning, whose busy_timeout is then
+the only lock wait. Reports committed reads/writes and "database is
+locked" errors per profile. Postgres deployments are covered by the pooled
+profile in settings and are not exercised here.
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from core.utils.dbTuning import DEFAULT_SQLITE_PRAGMAS, sqlite_pragma_statements
+
+# profile -> (pragmas, sqlite3.connect timeout in seconds)
+PROFILES = {
+    "default": ({}, 5.0),
+    "tuned": (DEFAULT_SQLITE_PRAGMAS, 0),
+}
+
+
+def _connect(path, profile):
+    pragmas, timeout = PROFILES[profile]
+    conn = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+    for statement in sqlite_pragma_statements(pragmas):
+        conn.execute(statement)
+    return conn
+
+
+def _prepare(path, profile, rows):
+    conn = _connect(path, profile)
+    conn.execute("CREATE TABLE ledger (id INTEGER PRIMARY KEY, actor INTEGER, amount REAL)")
+    conn.execute("CREATE INDEX ledger_actor ON ledger (actor)")
+    conn.executemany("INSERT INTO ledger (actor, amount) VALUES (?, ?)", ((i % 500, 1.0) for i in range(rows)))
+    conn.close()
+
+
+def _worker(path, profile, deadline, is_writer, counters, lock):
+    conn = _connect(path, profile)
+    done = errors = 0
+    n = 0
+    while time.perf_counter() < deadline:
+        n += 1
+        try:
+            if is_writer:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute("INSERT INTO ledger (actor, amount) VALUES (?, ?)", (n % 500, 1.0))
+                conn.execute("UPDATE ledger SET amount = amount + 1 WHERE actor = ?", (n % 500,))
+                conn.execute("COMMIT")
+            else:
+                conn.execute("SELECT actor, SUM(amount) FROM ledger WHERE actor = ? GROUP BY actor", (n % 500,)).fetchall()
+            done += 1
+        except sqlite3.OperationalError:
+            errors += 1
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+    conn.close()
+
+    key = "writes" if is_writer else "reads"
+    with lock:
+        counters[key] += done
+        counters["errors"] += errors
+
+
+def run(profile, readers, writers, seconds, rows):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.sqlite3")
+        _prepare(path, profile, rows)
+
+        counters = {"reads": 0, "writes": 0, "errors": 0}
+        lock = threading.Lock()
+        deadline = time.perf_counter() + seconds
+        threads = [
+            threading.Thread(target=_worker, args=(path, profile, deadline, i < writers, counters, lock))
+            for i in range(readers + writers)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    return {name: value / seconds if name != "errors" else value for name, value in counters.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SQLite default vs tuned profile under concurrency.")
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--rows", type=int, default=50_000)
+    args = parser.parse_args(argv)
+
+    print(f"{'profile':<8} {'reads/s':>10} {'writes/s':>10} {'errors':>8}")
+    for profile in PROFILES:
+        r = run(profile, args.readers, args.writers, args.seconds, args.rows)
+        print(f"{profile:<8} {r['reads']:>10.0f} {r['writes']:>10.0f} {r['errors']:>8}")
+
+
+if __name__ == "__main__":
+    main()
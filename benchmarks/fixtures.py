@@ -0,0 +1,256 @@
+"""
+Bulk synthetic dataset for load testing (`manage.py generate_fixture_data`).
+
+Rows go straight to the database with cursor.executemany: no model
+instances, no save() observers, no signals. Everything those observers
+would maintain is therefore wired here explicitly: COA and actor ledger
+Accounts with their codes, MainActor -> accounting Actors links, posted
+vouchers with matching Accounts.balance, and one PaymentSummary per
+shipment. History rows are not generated.
+"""
+
+from __future__ import annotations
+
+import random
+import uuid
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.apps import apps
+from django.db import connections, models, transaction
+from django.utils import timezone
+
+from master.models import Branch, Currency
+
+# (category, first code, group name) for the COA roots seeded per branch.
+COA_ROOTS = [
+    ("asset", 1000, "Assets"),
+    ("liability", 2000, "Liabilities"),
+    ("equity", 3000, "Equity"),
+    ("income", 4000, "Revenue"),
+    ("expense", 6000, "Expenses"),
+]
+
+
+VENDOR_NAME_WORDS = (
+    "Alpine", "Bagmati", "Crescent", "Delta", "Everest", "Falcon", "Gandaki", "Harbor", "Indus", "Jade",
+    "Karnali", "Lotus", "Meridian", "Narayani", "Orchid", "Pioneer", "Quartz", "Rapti", "Summit", "Terai",
+)
+VENDOR_NAME_KINDS = ("Cargo", "Freight", "Logistics", "Traders", "Shipping", "Movers", "Carriers", "Express")
+
+# Every Nth vendor repeats the previous one under another legal form (same dedup_key and phone).
+DUPLICATE_VENDOR_EVERY = 50
+
+
+class RowWriter:
+    """
+    executemany-based inserter. Columns the caller does not pass get the model
+    default (auto_now fields get "now"), prepared once per table.
+    """
+
+    def __init__(self, using, batch_size):
+        self.connection = connections[using]
+        self.batch_size = batch_size
+        self.now = timezone.now()
+        self._tables = {}
+
+    def _prep_for(self, field):
+        target = field.target_field if field.is_relation else field
+        if isinstance(target, models.UUIDField) and not self.connection.features.has_native_uuid_field:
+            return lambda v: v.hex if v is not None else None
+        if isinstance(target, (models.DecimalField, models.DateField, models.UUIDField)):
+            return lambda v: target.get_db_prep_save(v, self.connection)
+        return None
+
+    def _table(self, model):
+        if model not in self._tables:
+            fields = list(model._meta.concrete_fields)
+            defaults = {}
+            for field in fields:
+                if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+                    value = self.now
+                elif field.has_default() and not field.primary_key:
+                    value = field.get_default()
+                else:
+                    value = None
+                defaults[field.attname] = field.get_db_prep_save(value, self.connection)
+
+            qn = self.connection.ops.quote_name
+            sql = "INSERT INTO {} ({}) VALUES ({})".format(
+                qn(model._meta.db_table),
+                ", ".join(qn(f.column) for f in fields),
+                ", ".join(["%s"] * len(fields)),
+            )
+            self._tables[model] = (sql, [(f.attname, self._prep_for(f), defaults[f.attname]) for f in fields])
+        return self._tables[model]
+
+    def insert(self, model, rows) -> int:
+        sql, columns = self._table(model)
+        params = [
+            tuple(
+                (prep(row[attname]) if prep else row[attname]) if attname in row else default
+                for attname, prep, default in columns
+            )
+            for row in rows
+        ]
+        with self.connection.cursor() as cursor:
+            for start in range(0, len(params), self.batch_size):
+                cursor.executemany(sql, params[start:start + self.batch_size])
+        return len(params)
+
+
+class FixtureGenerator:
+    def __init__(self, *, seed=42, batch_size=5000, using="default", log=None):
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.using = using
+        self.writer = RowWriter(using, batch_size)
+        self.log = log or (lambda message: None)
+        self.counts = defaultdict(int)
+
+    def _id(self):
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def _insert(self, model, rows):
+        self.counts[model._meta.label] += self.writer.insert(model, rows)
+
+    def generate(self, *, branches, actors, vouchers, lines, shipments, currency_code="NPR"):
+        currency = Currency.objects.using(self.using).filter(code=currency_code).first()
+        if currency is None:
+            currency = Currency.objects.using(self.using).create(code=currency_code, name=currency_code, symbol=currency_code)
+
+        offset = Branch.objects.using(self.using).filter(name__startswith="Fixture Branch").count()
+        for n in range(offset, offset + branches):
+            branch = Branch.objects.using(self.using).create(
+                name=f"Fixture Branch {n}", address="Fixture St", city="Kathmandu", state="Bagmati",
+                country="Nepal", contact_number=f"98{n:08d}",
+            )
+            self.counts[Branch._meta.label] += 1
+            with transaction.atomic(using=self.using):
+                ledger = self._chart_of_accounts(branch)
+                ledger += self._actors(branch, currency, actors)
+                self._vouchers(branch, ledger, vouchers, lines)
+                if shipments:
+                    self._shipments(branch, shipments)
+            self.log(f"{branch.name}: done")
+        return dict(self.counts)
+
+    def _chart_of_accounts(self, branch):
+        """
+        Returns the postable ledger as [{"id", "code", "balance"}] (group roots excluded).
+        """
+        from accounting.models import Accounts, ChartofAccount
+
+        accounts, coas, ledger = [], [], []
+        for category, root_code, root_name in COA_ROOTS:
+            root_id = self._id()
+            for leaf in range(0, 10):
+                code = f"{root_code + leaf * 10}"
+                name = root_name if leaf == 0 else f"{root_name} {leaf}"
+                account = {"id": self._id(), "branch_id": branch.pk, "code": code, "name": name, "account_class": "coa"}
+                accounts.append(account)
+                coas.append({
+                    "id": root_id if leaf == 0 else self._id(), "branch_id": branch.pk, "code": code, "name": name,
+                    "account_type": category, "is_group": leaf == 0, "parent_id": None if leaf == 0 else root_id,
+                    "account_id": account["id"],
+                })
+                if leaf:
+                    ledger.append({"id": account["id"], "code": code, "balance": Decimal("0")})
+
+        self._insert(Accounts, accounts)
+        self._insert(ChartofAccount, coas)
+        return ledger
+
+    def _actors(self, branch, currency, count):
+        from accounting.models import Accounts, Actors
+        from actors.models import MainActor, Vendor
+        from actors.utils import actor_directory_fields, name_fields
+
+        ledger = []
+        for start in range(0, count, self.batch_size):
+            vendors, main_actors, acc_actors, accounts = [], [], [], []
+            for i in range(start, min(count, start + self.batch_size)):
+                # Distinct words, so only the planted duplicates score as near-identical names.
+                name = f"{self.rng.choice(VENDOR_NAME_WORDS)} {self.rng.choice(VENDOR_NAME_KINDS)} {i:07d}"
+                cellphone = f"98{self.rng.randint(10000000, 99999999)}"
+                if vendors and i % DUPLICATE_VENDOR_EVERY == DUPLICATE_VENDOR_EVERY - 1:
+                    # Same company as the previous row under another legal form, for find_duplicate_actors.
+                    name, cellphone = f"{vendors[-1]['name']} Pvt. Ltd.", vendors[-1]["cellphone"]
+                vendor_id, account_id, acc_actor_id = self._id(), self._id(), self._id()
+                vendor = {
+                    "id": vendor_id, "branch_id": branch.pk, "name": name, "address": "Fixture Rd", "country": "Nepal",
+                    "currency_id": currency.pk, "cellphone_country_code": "+977",
+                    "cellphone": cellphone,
+                    "email": f"vendor{i:07d}@{branch.branch_id}.fixture.test".lower(),
+                    "tax_ref_no": f"PAN{self.rng.randint(100000000, 999999999)}",
+                }
+                vendors.append(vendor)
+                # The directory columns the MainActor upsert signal would fill.
+                main_actors.append({
+                    "id": self._id(), "branch_id": branch.pk, "vendor_id": vendor_id,
+                    "actor_type": MainActor.ActorType.VENDOR.value, "display_name": name,
+                    **name_fields(name), "accounting_actor_id": acc_actor_id,
+                    **actor_directory_fields(Vendor(**vendor), lookup_detail=False),
+                })
+                code = f"AT{i + 1:05d}"
+                accounts.append({"id": account_id, "branch_id": branch.pk, "code": code, "name": name, "account_class": "actor"})
+                acc_actors.append({"id": acc_actor_id, "branch_id": branch.pk, "name": name, "account_id": account_id})
+                ledger.append({"id": account_id, "code": code, "balance": Decimal("0")})
+
+            self._insert(Accounts, accounts)
+            self._insert(Actors, acc_actors)
+            self._insert(Vendor, vendors)
+            self._insert(MainActor, main_actors)
+        return ledger
+
+    def _vouchers(self, branch, ledger, count, lines):
+        from accounting.models import Accounts, JournalVoucher, JournalVoucherItem
+
+        first_day = date(2024, 1, 1)
+        now = timezone.now()
+        for start in range(0, count, self.batch_size):
+            vouchers, items = [], []
+            for i in range(start, min(count, start + self.batch_size)):
+                amount = Decimal(self.rng.randint(100, 100000))
+                debit, *credits = self.rng.sample(ledger, lines)
+                total = amount * len(credits)
+                voucher_id = self._id()
+                vouchers.append({
+                    "id": voucher_id, "branch_id": branch.pk, "voucher_no": f"JV{i + 1:08d}",
+                    "voucher_date": first_day + timedelta(days=i % 730), "approved": True, "approved_at": now, "total": total,
+                })
+                items.append({"id": self._id(), "journal_voucher_id": voucher_id, "account_id": debit["id"], "dr_amount": total})
+                debit["balance"] += total
+                for credit in credits:
+                    items.append({"id": self._id(), "journal_voucher_id": voucher_id, "account_id": credit["id"], "cr_amount": amount})
+                    credit["balance"] -= amount
+
+            self._insert(JournalVoucher, vouchers)
+            self._insert(JournalVoucherItem, items)
+
+        # Posted vouchers move balances by dr - cr, as handle_journalvoucher_posting does.
+        by_balance = defaultdict(list)
+        for account in ledger:
+            if account["balance"]:
+                by_balance[account["balance"]].append(account["id"])
+        for balance, ids in by_balance.items():
+            Accounts.objects.using(self.using).filter(pk__in=ids).update(balance=balance)
+
+    def _shipments(self, branch, count):
+        if not apps.is_installed("operations"):
+            self.log("operations is not installed; skipping shipments")
+            return
+
+        from benchmarks.generators import build
+        from operations.models import PaymentSummary, Shipment
+
+        for start in range(0, count, self.batch_size):
+            shipments = [
+                build(Shipment, self.rng, i, save=False, branch=branch, doc_ref_no=f"SH{i + 1:08d}",
+                      origin_port="NPKTM", destination_port="AEDXB")
+                for i in range(start, min(count, start + self.batch_size))
+            ]
+            Shipment.objects.using(self.using).bulk_create(shipments, batch_size=self.batch_size)
+            self.counts[Shipment._meta.label] += len(shipments)
+            self._insert(PaymentSummary, [{"id": self._id(), "branch_id": branch.pk, "shipment_id": s.pk} for s in shipments])
@@ -0,0 +1,175 @@
+"""
+Reproducible synthetic data for the benchmark cases.
+
+Every generator takes a `random.Random` so a given --seed always yields the
+same rows. Objects are created through the normal save() path (observers and
+signals included) because that path is what the cases measure.
+"""
+
+from __future__ import annotations
+
+import random
+import uuid
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import models
+from django.utils import timezone
+
+from master.models import Branch, Currency
+
+
+def _value_for(field, rng: random.Random, seq: int):
+    if getattr(field, "choices", None):
+        return field.choices[0][0]
+    if isinstance(field, models.EmailField):
+        return f"bench{seq}@example.com"
+    if isinstance(field, (models.CharField, models.TextField)):
+        text = f"{field.name[:12].upper()}{seq:06d}"
+        return text[: field.max_length] if getattr(field, "max_length", None) else text
+    if isinstance(field, models.BooleanField):
+        return False
+    if isinstance(field, (models.IntegerField, models.FloatField)):
+        return rng.randint(1, 10)
+    if isinstance(field, models.DecimalField):
+        return Decimal(rng.randint(1, 1000))
+    if isinstance(field, models.DateTimeField):
+        return timezone.make_aware(datetime.combine(date(2025, 1, 1), time()))
+    if isinstance(field, models.DateField):
+        return date(2025, 1, 1)
+    if isinstance(field, models.UUIDField):
+        return uuid.UUID(int=rng.getrandbits(128))
+    return f"x{seq}"
+
+
+def build(model, rng: random.Random, seq: int = 0, save: bool = True, **overrides):
+    """
+    Instance of `model` with every required, non-defaulted field filled
+    deterministically; required foreign keys are built recursively.
+    """
+    data = {}
+    for field in model._meta.concrete_fields:
+        if field.primary_key or field.name in overrides:
+            continue
+        if field.has_default() or field.null or field.blank:
+            continue
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+            continue
+        if field.is_relation:
+            data[field.name] = build(field.related_model, rng, seq)
+        else:
+            data[field.name] = _value_for(field, rng, seq)
+    data.update(overrides)
+    obj = model(**data)
+    if save:
+        obj.save()
+    return obj
+
+
+def make_branches(rng: random.Random, count: int = 1) -> list[Branch]:
+    branches = []
+    for i in range(count):
+        branches.append(
+            Branch.objects.create(
+                name=f"Bench Branch {i}",
+                address="Bench St",
+                city="Kathmandu",
+                state="Bagmati",
+                country="Nepal",
+                contact_number=f"98{rng.randint(10000000, 99999999)}",
+                is_main_branch=i == 0,
+            )
+        )
+    return branches
+
+
+def make_user(branch: Branch):
+    return get_user_model().objects.create_user(
+        username=f"bench-{branch.pk}", email=f"bench-{branch.pk}@example.com", password="bench", branch=branch
+    )
+
+
+def make_currency(code: str = "NPR") -> Currency:
+    currency, _ = Currency.objects.get_or_create(
+        code=code, defaults={"name": code, "symbol": code, "decimal_places": 2, "is_base": True}
+    )
+    return currency
+
+
+def make_chart_of_accounts(rng: random.Random, branch: Branch, count: int = 10):
+    from accounting.models import Category, ChartofAccount
+
+    categories = [c for c, _ in Category.choices]
+    return [
+        ChartofAccount.objects.create(branch=branch, name=f"COA {i}", account_type=rng.choice(categories))
+        for i in range(count)
+    ]
+
+
+def make_vendors(rng: random.Random, branch: Branch, currency: Currency, count: int, start: int = 0):
+    from actors.models import Vendor
+
+    return [
+        Vendor.objects.create(
+            branch=branch,
+            name=f"Vendor {start + i:06d}",
+            address="Bench Rd",
+            country="Nepal",
+            currency=currency,
+            cellphone_country_code="+977",
+            cellphone=f"98{rng.randint(10000000, 99999999)}",
+        )
+        for i in range(count)
+    ]
+
+
+def make_journal_voucher(rng: random.Random, branch: Branch, accounts, lines: int = 2):
+    from accounting.models import JournalVoucher, JournalVoucherItem
+
+    voucher = JournalVoucher.objects.create(branch=branch, voucher_date=date(2025, 1, 1), narration="bench")
+    amount = Decimal(rng.randint(100, 10000))
+    debit, credit = rng.sample(list(accounts), 2)
+    items = [JournalVoucherItem(journal_voucher=voucher, account=debit, dr_amount=amount * (lines - 1))]
+    items += [JournalVoucherItem(journal_voucher=voucher, account=credit, cr_amount=amount) for _ in range(lines - 1)]
+    JournalVoucherItem.objects.bulk_create(items)
+    return voucher
+
+
+def make_shipment(rng: random.Random, branch: Branch, seq: int = 0):
+    from operations.models import Shipment
+
+    return build(
+        Shipment,
+        rng,
+        seq,
+        branch=branch,
+        origin_port="NPKTM",
+        destination_port="AEDXB",
+        shipper=f"Shipper {seq}",
+        consignee=f"Consignee {seq}",
+    )
+
+
+def make_package(rng: random.Random, shipment, quantity: int = 5, seq: int = 0):
+    from master.models import UnitofMeasurementLength
+    from operations.models import ShipmentPackages
+
+    unit = UnitofMeasurementLength.objects.first() or build(UnitofMeasurementLength, rng, seq)
+    return ShipmentPackages.objects.create(
+        branch=shipment.branch,
+        shipment=shipment,
+        length=rng.randint(10, 120),
+        width=rng.randint(10, 120),
+        height=rng.randint(10, 120),
+        package_unit=unit,
+        quantity=quantity,
+    )
+
+
+def make_locations(rng: random.Random, branch: Branch, count: int = 4):
+    from warehouse.models import Location, Warehouse, Zone
+
+    warehouse = build(Warehouse, rng, branch=branch, type="self")
+    zone = build(Zone, rng, branch=branch, warehouse=warehouse)
+    return [build(Location, rng, i, branch=branch, zone=zone, code=f"L{i:03d}") for i in range(count)]
@@ -0,0 +1,75 @@
+"""
+Concurrent throughput check for the WSGI and ASGI deployments.
+
+    gunicorn logidesk.wsgi:application -w 4 -b :8000
+    uvicorn logidesk.asgi:application --workers 4 --port 8001
+
+    python -m benchmarks.loadtest --token <JWT> \
+        --wsgi http://localhost:8000 --asgi http://localhost:8001 \
+        --path /api/accounting/accounts/ --path /api/accounting/async/accounts/
+
+Stdlib only: each target is hit by --concurrency threads for --requests
+requests, and the run reports throughput and latency percentiles.
+"""
+
+import argparse
+import statistics
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _fetch(url, token, timeout):
+    req = urllib.request.Request(url, headers={"Authorization": f"Bearer {token}"} if token else {})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            resp.read()
+            ok = 200 <= resp.status < 300
+    except (urllib.error.URLError, TimeoutError):
+        ok = False
+    return time.perf_counter() - start, ok
+
+
+def run(url, token=None, requests=500, concurrency=50, timeout=30):
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        started = time.perf_counter()
+        results = list(pool.map(lambda _: _fetch(url, token, timeout), range(requests)))
+        elapsed = time.perf_counter() - started
+
+    latencies = sorted(r[0] for r in results)
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        "url": url,
+        "requests": requests,
+        "errors": sum(1 for r in results if not r[1]),
+        "rps": requests / elapsed if elapsed else 0.0,
+        "p50_ms": quantiles[49] * 1000,
+        "p95_ms": quantiles[94] * 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare WSGI vs ASGI throughput.")
+    parser.add_argument("--wsgi", help="Base URL of the WSGI server.")
+    parser.add_argument("--asgi", help="Base URL of the ASGI server.")
+    parser.add_argument("--path", action="append", required=True, help="Endpoint path (repeatable).")
+    parser.add_argument("--token", help="JWT access token.")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    targets = [(name, base) for name, base in (("wsgi", args.wsgi), ("asgi", args.asgi)) if base]
+    if not targets:
+        parser.error("pass --wsgi and/or --asgi")
+
+    print(f"{'server':<6} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'errors':>7}  url")
+    for name, base in targets:
+        for path in args.path:
+            r = run(base.rstrip("/") + path, args.token, args.requests, args.concurrency)
+            print(f"{name:<6} {r['rps']:>9.1f} {r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f} {r['errors']:>7}  {r['url']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Runs benchmark cases and compares them with a stored baseline.
+
+Query counts are deterministic and compared tightly; throughput depends on
+the machine, so it gets a wider tolerance. Cases run in autocommit mode so
+on_commit observers fire exactly as they do in production.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+from pathlib import Path
+
+from django.apps import apps
+from django.db import connection
+
+from benchmarks import generators
+from benchmarks.cases import CASES, Context
+from core.utils.userSession import reset_current_user, set_current_user
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+
+def available_cases(names=None):
+    selected = names or list(CASES)
+    unknown = [n for n in selected if n not in CASES]
+    if unknown:
+        raise KeyError(", ".join(unknown))
+    for name in selected:
+        func, requires = CASES[name]
+        missing = [app for app in requires if not apps.is_installed(app)]
+        yield name, func, missing
+
+
+class QueryCounter:
+    """
+    connection.execute_wrapper that counts statements (unbounded, unlike CaptureQueriesContext).
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def run_case(func, iterations: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    branch = generators.make_branches(rng, 1)[0]
+    ctx = Context(rng=rng, branch=branch, user=generators.make_user(branch), currency=generators.make_currency())
+
+    token = set_current_user(ctx.user)
+    try:
+        op = func(ctx)
+        queries = QueryCounter()
+        with connection.execute_wrapper(queries):
+            start = time.perf_counter()
+            for i in range(iterations):
+                op(i)
+            elapsed = time.perf_counter() - start
+    finally:
+        reset_current_user(token)
+
+    return {
+        "iterations": iterations,
+        "seconds": round(elapsed, 4),
+        "ops_per_sec": round(iterations / elapsed, 2) if elapsed else None,
+        "queries_per_op": round(queries.count / iterations, 2),
+    }
+
+
+def load_baseline(path=BASELINE_PATH) -> dict:
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text()).get("cases", {})
+
+
+def save_baseline(results: dict, path=BASELINE_PATH) -> None:
+    cases = load_baseline(path)
+    cases.update(results)
+    payload = {
+        "_note": "Regenerate with `manage.py run_benchmarks --update-baseline`; ops_per_sec is machine-specific.",
+        "cases": dict(sorted(cases.items())),
+    }
+    Path(path).write_text(json.dumps(payload, indent=2) + "\n")
+
+
+def compare(results: dict, baseline: dict, query_tolerance: float, throughput_tolerance: float) -> list[str]:
+    """
+    Returns human-readable regressions against the baseline.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if result["queries_per_op"] > base["queries_per_op"] * (1 + query_tolerance):
+            regressions.append(f"{name}: queries/op {base['queries_per_op']} -> {result['queries_per_op']}")
+        if base.get("ops_per_sec") and result["ops_per_sec"] < base["ops_per_sec"] * (1 - throughput_tolerance):
+            regressions.append(f"{name}: ops/sec {base['ops_per_sec']} -> {result['ops_per_sec']}")
+    return regressions
@@ -1,6 +1,18 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_migrate
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from core.signals import register_auth_state_signals, seed_after_migrate
+        from core.utils.changeFeed import register_tombstone_signals
+        from core.utils.dbTuning import configure_sqlite_connection
+
+        post_migrate.connect(seed_after_migrate, sender=self, dispatch_uid="core_seed_after_migrate")
+        connection_created.connect(configure_sqlite_connection, dispatch_uid="core_configure_sqlite_connection")
+        register_auth_state_signals()
+        register_tombstone_signals()
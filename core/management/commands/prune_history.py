@@ -0,0 +1,99 @@
+import gzip
+import json
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils import timezone
+
+from core.utils.changeFeed import prune_tombstones
+from core.utils.historyPolicy import history_retention_days, iter_history_models
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete historical rows older than each model's retention window, in small "
+        "batches, archiving them to gzip JSONL first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--model", action="append", default=[], help="Model label (e.g. accounting.accounts); repeatable.")
+        parser.add_argument("--days", type=int, help="Override the retention window for every selected model.")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows deleted per transaction.")
+        parser.add_argument("--sleep", type=float, default=0.0, help="Seconds to pause between batches.")
+        parser.add_argument("--archive-dir", help="Archive directory (default: settings.HISTORY_ARCHIVE_DIR).")
+        parser.add_argument("--no-archive", action="store_true", help="Delete without writing an archive.")
+        parser.add_argument("--dry-run", action="store_true", help="Only report how many rows would be pruned.")
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        selected = {label.lower() for label in options["model"]}
+        targets = [(m, hm) for m, hm in iter_history_models() if not selected or m._meta.label_lower in selected]
+        unknown = selected - {m._meta.label_lower for m, _ in targets}
+        if unknown:
+            raise CommandError(f"No history tracked for: {', '.join(sorted(unknown))}")
+
+        archive_dir = None
+        if not options["no_archive"] and not options["dry_run"]:
+            archive_dir = Path(options["archive_dir"] or settings.HISTORY_ARCHIVE_DIR)
+            archive_dir.mkdir(parents=True, exist_ok=True)
+
+        total = 0
+        for model, history_model in targets:
+            days = options["days"] if options["days"] is not None else history_retention_days(model)
+            if days is None:
+                continue
+
+            cutoff = timezone.now() - timedelta(days=days)
+            qs = history_model.objects.using(options["database"]).filter(history_date__lt=cutoff)
+            if options["dry_run"]:
+                count = qs.count()
+            else:
+                count = self._prune(model, qs, archive_dir, options)
+            total += count
+            if count:
+                self.stdout.write(f"{model._meta.label_lower}: {count} rows older than {days} days")
+
+        verb = "Would prune" if options["dry_run"] else "Pruned"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {total} historical rows."))
+
+        if not selected and not options["dry_run"]:
+            tombstones = prune_tombstones(using=options["database"])
+            self.stdout.write(f"Pruned {tombstones} change-feed tombstones.")
+
+    def _prune(self, model, qs, archive_dir, options) -> int:
+        archive_path = None
+        if archive_dir is not None:
+            stamp = timezone.now().strftime("%Y%m%dT%H%M%S")
+            archive_path = archive_dir / f"{model._meta.label_lower}-{stamp}.jsonl.gz"
+        # Opened with the first expired row, so models with nothing to prune leave no file.
+        archive = None
+
+        pruned = 0
+        try:
+            while True:
+                # Oldest first; each batch is its own short transaction.
+                ids = list(qs.order_by("history_date", "history_id").values_list("history_id", flat=True)[: options["batch_size"]])
+                if not ids:
+                    break
+
+                with transaction.atomic(using=options["database"]):
+                    batch = qs.model.objects.using(options["database"]).filter(history_id__in=ids)
+                    if archive_path is not None:
+                        if archive is None:
+                            archive = gzip.open(archive_path, "wt", encoding="utf-8")
+                        for row in batch.values().iterator():
+                            archive.write(json.dumps(row, cls=DjangoJSONEncoder) + "\n")
+                    batch.delete()
+                pruned += len(ids)
+
+                if options["sleep"]:
+                    time.sleep(options["sleep"])
+        finally:
+            if archive is not None:
+                archive.close()
+        return pruned
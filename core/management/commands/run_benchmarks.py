@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from benchmarks.runner import BASELINE_PATH, available_cases, compare, load_baseline, run_case, save_baseline
+
+
+class Command(BaseCommand):
+    help = "Run the write-path benchmarks on a throwaway test database and compare with the baseline."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--case", action="append", default=[], help="Case name; repeatable (default: all).")
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument("--baseline", default=str(BASELINE_PATH))
+        parser.add_argument("--update-baseline", action="store_true", help="Store these results as the new baseline.")
+        parser.add_argument("--query-tolerance", type=float, default=0.1, help="Allowed relative increase in queries/op.")
+        parser.add_argument("--throughput-tolerance", type=float, default=0.5, help="Allowed relative drop in ops/sec.")
+
+    def handle(self, *args, **options):
+        try:
+            cases = list(available_cases(options["case"] or None))
+        except KeyError as e:
+            raise CommandError(f"Unknown benchmark case: {e}")
+
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        results = {}
+        try:
+            for name, func, missing in cases:
+                if missing:
+                    self.stdout.write(f"{name:<34} skipped (not installed: {', '.join(missing)})")
+                    continue
+                result = results[name] = run_case(func, options["iterations"], options["seed"])
+                self.stdout.write(
+                    f"{name:<34} {result['ops_per_sec']:>9} ops/s {result['queries_per_op']:>8} queries/op"
+                )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        if options["update_baseline"]:
+            save_baseline(results, options["baseline"])
+            self.stdout.write(self.style.SUCCESS(f"Baseline updated: {options['baseline']}"))
+            return
+
+        regressions = compare(
+            results, load_baseline(options["baseline"]), options["query_tolerance"], options["throughput_tolerance"]
+        )
+        if regressions:
+            raise CommandError("Benchmark regressions:\n  " + "\n  ".join(regressions))
+        self.stdout.write(self.style.SUCCESS("No regressions against the baseline."))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+from core.utils.seedInitialData import seed_initial_data
+
+
+class Command(BaseCommand):
+    help = "Seed the main branch, the initial superuser and the currency list (idempotent)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS, help="Database alias to seed.")
+
+    def handle(self, *args, **options):
+        seed_initial_data(using=options["database"])
+        self.stdout.write(self.style.SUCCESS("Initial data seeded."))
@@ -58,4 +58,20 @@ class CustomUser(AbstractUser):
         if self.branch:
             return f"{self.username} - {self.branch}"
         full = f"{self.first_name} {self.last_name}".strip()
-        return full or self.username
\ No newline at end of file
+        return full or self.username
+
+class Tombstone(models.Model):
+    """
+    One row per deleted StampedOwnedActive object, read by the ?since= change feed
+    (core.utils.changeFeed). The auto-increment id is the delete cursor.
+    """
+    model_label = models.CharField(max_length=100)
+    object_id = models.CharField(max_length=64)
+    branch_id = models.UUIDField(blank=True, null=True)
+    deleted_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["model_label", "branch_id", "id"])]
+
+    def __str__(self):
+        return f"{self.model_label}:{self.object_id}"
@@ -1 +1,91 @@
-#for communications
\ No newline at end of file
+#for communications
+from django.conf import settings
+
+
+def seed_after_migrate(sender, using, **kwargs):
+    if not getattr(settings, "SEED_INITIAL_DATA_ON_MIGRATE", True):
+        return
+
+    from core.utils.seedInitialData import seed_initial_data
+
+    seed_initial_data(using=using)
+
+
+def _invalidate_users(*user_ids):
+    from core.utils.jwtClaims import invalidate_auth_state
+    from core.utils.userCapabilities import invalidate_user_capabilities
+
+    if user_ids:
+        invalidate_auth_state(*user_ids)
+        invalidate_user_capabilities(*user_ids)
+
+
+def invalidate_user_auth_state(sender, instance, **kwargs):
+    _invalidate_users(instance.pk)
+
+
+def invalidate_membership_auth_state(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    m2m_changed for CustomUser.groups and CustomUser.user_permissions, from either side.
+    """
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    from django.contrib.auth import get_user_model
+
+    User = get_user_model()
+    if not reverse:
+        _invalidate_users(instance.pk)
+    elif pk_set:
+        _invalidate_users(*pk_set)
+    else:
+        field = "groups" if sender is User.groups.through else "user_permissions"
+        _invalidate_users(*User.objects.filter(**{field: instance}).values_list("pk", flat=True))
+
+
+def invalidate_group_permissions_auth_state(sender, instance, action, reverse, pk_set, model, **kwargs):
+    """
+    m2m_changed for Group.permissions: every member of the affected groups.
+    """
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+
+    from django.contrib.auth import get_user_model
+
+    if not reverse:
+        group_ids = [instance.pk]
+    elif pk_set:
+        group_ids = list(pk_set)
+    else:
+        group_ids = list(instance.group_set.values_list("pk", flat=True))
+    _invalidate_users(*get_user_model().objects.filter(groups__in=group_ids).values_list("pk", flat=True).distinct())
+
+
+def invalidate_branch_auth_state(sender, instance, **kwargs):
+    from django.contrib.auth import get_user_model
+
+    _invalidate_users(*get_user_model().objects.filter(branch_id=instance.pk).values_list("pk", flat=True))
+
+
+def register_auth_state_signals():
+    """
+    Drops cached JWT auth state (core.utils.jwtClaims) and user capabilities
+    (core.utils.userCapabilities) when anything they describe changes.
+    """
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.models import Group
+    from django.db.models.signals import m2m_changed, post_delete, post_save
+
+    from master.models import Branch
+
+    User = get_user_model()
+    post_save.connect(invalidate_user_auth_state, sender=User, dispatch_uid="core_auth_state_user_save")
+    post_delete.connect(invalidate_user_auth_state, sender=User, dispatch_uid="core_auth_state_user_delete")
+    m2m_changed.connect(invalidate_membership_auth_state, sender=User.groups.through, dispatch_uid="core_auth_state_groups")
+    m2m_changed.connect(
+        invalidate_membership_auth_state, sender=User.user_permissions.through, dispatch_uid="core_auth_state_user_permissions"
+    )
+    m2m_changed.connect(
+        invalidate_group_permissions_auth_state, sender=Group.permissions.through, dispatch_uid="core_auth_state_group_permissions"
+    )
+    post_save.connect(invalidate_branch_auth_state, sender=Branch, dispatch_uid="core_auth_state_branch")
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import csv
+import io
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db.models import Q
+from django.test import RequestFactory, TestCase
+from rest_framework.test import force_authenticate
+
+from accounting.models import Actors, ChequeRegister
+from core.utils.aging import AgingSource, AgingView, build_aging, get_aging, register_aging_source
+from master.models import Branch
+
+# Any branch-scoped document with a party, an open amount and a date will do.
+CHEQUE_AGING = AgingSource(
+    ChequeRegister,
+    party_field="contact",
+    amount_field="amount",
+    due_field="cheque_date",
+    date_field="received_date",
+    party_name_field="contact__name",
+    open_filter=Q(active=True) & ~Q(status="cleared"),
+)
+
+
+class ChequeAgingView(AgingView):
+    aging_source = CHEQUE_AGING
+
+
+class AgingTests(TestCase):
+    as_of = date(2026, 6, 30)
+
+    @classmethod
+    def setUpTestData(cls):
+        register_aging_source(CHEQUE_AGING)
+
+    def setUp(self):
+        self.branch = Branch.objects.create(name="Main", address="x", city="x", state="x", country="x", contact_number="1", is_main_branch=True)
+        self.other = Branch.objects.create(name="Other", address="x", city="x", state="x", country="x", contact_number="2")
+        self.user = get_user_model().objects.create_user(username="aging", email="aging@example.com", password="x", branch=self.other)
+        self.acme = Actors.objects.create(name="Acme", branch=self.other)
+        self.globex = Actors.objects.create(name="Globex", branch=self.other)
+
+    def _cheque(self, contact, amount, due, branch=None, **extra):
+        return ChequeRegister.objects.create(
+            branch=branch or self.other, contact=contact, amount=Decimal(amount), cheque_date=due, **extra
+        )
+
+    def test_buckets_per_party_in_one_query(self):
+        self._cheque(self.acme, "100", date(2026, 7, 15))  # not yet due
+        self._cheque(self.acme, "50", date(2026, 6, 1))  # 29 days
+        self._cheque(self.acme, "25", date(2026, 5, 1))  # 60 days
+        self._cheque(self.acme, "999", date(2026, 5, 1), status="cleared")
+        self._cheque(self.globex, "10", date(2026, 3, 31))  # 91 days
+        self._cheque(self.globex, "7", None, received_date=date(2026, 4, 15))  # 76 days, by fallback date
+        self._cheque(self.globex, "1000", date(2026, 6, 1), branch=self.branch)
+
+        with self.assertNumQueries(1):
+            report = build_aging(CHEQUE_AGING, as_of=self.as_of, branch_id=self.other.pk)
+
+        rows = {row["party"]: row for row in report["rows"]}
+        self.assertEqual(report["buckets"], ["0_30", "31_60", "61_90", "91_plus"])
+        self.assertEqual(
+            [rows["Acme"][b] for b in report["buckets"]], [Decimal("150"), Decimal("25"), Decimal("0"), Decimal("0")]
+        )
+        self.assertEqual(
+            [rows["Globex"][b] for b in report["buckets"]], [Decimal("0"), Decimal("0"), Decimal("7"), Decimal("10")]
+        )
+        self.assertEqual((rows["Acme"]["items"], report["totals"]["total"]), (3, Decimal("192")))
+
+    def test_cached_per_as_of_until_a_row_changes(self):
+        cheque = self._cheque(self.acme, "100", date(2026, 6, 1))
+        get_aging(CHEQUE_AGING, as_of=self.as_of, branch_id=self.other.pk)
+        with self.assertNumQueries(0):
+            get_aging(CHEQUE_AGING, as_of=self.as_of, branch_id=self.other.pk)
+
+        cheque.amount = Decimal("60")
+        with self.captureOnCommitCallbacks(execute=True):
+            cheque.save()
+        report = get_aging(CHEQUE_AGING, as_of=self.as_of, branch_id=self.other.pk)
+        self.assertEqual(report["totals"]["total"], Decimal("60"))
+
+    def test_view_scopes_to_branch_and_streams_csv(self):
+        self._cheque(self.acme, "100", date(2026, 6, 1))
+        self._cheque(self.globex, "1000", date(2026, 6, 1), branch=self.branch)
+        view = ChequeAgingView.as_view()
+
+        request = RequestFactory().get("/aging/", {"as_of": "2026-06-30", "format": "csv"})
+        force_authenticate(request, user=self.user)
+        response = view(request)
+
+        self.assertTrue(response.streaming)
+        rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+        self.assertEqual([(row["party"], Decimal(row["0_30"])) for row in rows], [("Acme", Decimal("100"))])
+
+        request = RequestFactory().get("/aging/", {"as_of": "June"})
+        force_authenticate(request, user=self.user)
+        self.assertEqual(view(request).status_code, 400)
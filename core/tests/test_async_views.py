@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from master.models import Branch, Currency
+
+
+class AsyncListViewTests(TestCase):
+    def setUp(self):
+        self.branch = Branch.objects.create(name="Main", address="x", city="x", state="x", country="x", contact_number="1", is_main_branch=True)
+        self.user = get_user_model().objects.create_user(username="async", email="async@example.com", password="x", branch=self.branch)
+        Currency.objects.create(code="XAU", name="Gold", symbol="Au", decimal_places=2)
+        Currency.objects.create(code="XAG", name="Silver", symbol="Ag", decimal_places=2)
+
+    async def test_requires_authentication(self):
+        response = await self.async_client.get("/api/master/async/currencies/")
+        self.assertEqual(response.status_code, 401)
+
+    async def test_lists_with_search_ordering_and_pagination(self):
+        headers = {"Authorization": f"Bearer {AccessToken.for_user(self.user)}"}
+        response = await self.async_client.get(
+            "/api/master/async/currencies/", {"search": "X", "ordering": "code", "page_size": 1}, headers=headers
+        )
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["count"], 2)
+        self.assertEqual([row["code"] for row in body["results"]], ["XAG"])
+        self.assertIn("page=2", body["next"])
+        self.assertIsNone(body["previous"])
+
+    async def test_filter_values_are_parsed_like_the_drf_viewsets(self):
+        headers = {"Authorization": f"Bearer {AccessToken.for_user(self.user)}"}
+        response = await self.async_client.get("/api/master/async/currencies/", {"active": "true"}, headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["count"], 2)
+
+        response = await self.async_client.get("/api/master/async/currencies/", {"is_base": "false"}, headers=headers)
+        self.assertEqual(response.json()["count"], 2)
+
+        response = await self.async_client.get("/api/master/async/ports/", {"nearest_branch": "not-a-uuid"}, headers=headers)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("nearest_branch", response.json())
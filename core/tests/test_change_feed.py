@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounting.models import Accounts
+from accounting.observer.balanceUpdate import _apply_deltas
+from actors.models import Department
+from core.models import Tombstone
+from master.models import Branch
+
+
+@override_settings(CHANGE_FEED_SETTLE_SECONDS=0)
+class ChangeFeedTests(TestCase):
+    url = "/api/actors/departments/"
+
+    def setUp(self):
+        self.main = Branch.objects.create(name="Main", address="x", city="x", state="x", country="x", contact_number="1", is_main_branch=True)
+        self.other = Branch.objects.create(name="Other", address="x", city="x", state="x", country="x", contact_number="2")
+        self.user = get_user_model().objects.create_user(username="feed", email="feed@example.com", password="x", branch=self.other)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_full_sync_then_deltas(self):
+        ops = Department.objects.create(name="Ops", branch=self.other)
+        Department.objects.create(name="HQ", branch=self.main)
+
+        first = self.client.get(self.url, {"since": ""}).json()
+        self.assertEqual([row["name"] for row in first["results"]], ["Ops"])
+        self.assertEqual(first["deleted"], [])
+
+        empty = self.client.get(self.url, {"since": first["cursor"]}).json()
+        self.assertEqual((empty["results"], empty["deleted"]), ([], []))
+
+        ops.name = "Operations"
+        ops.save()
+        doomed = Department.objects.create(name="Temp", branch=self.other)
+        doomed_id = str(doomed.pk)
+        doomed.delete()
+        Department.objects.create(name="Gone elsewhere", branch=self.main).delete()
+
+        delta = self.client.get(self.url, {"since": empty["cursor"]}).json()
+        self.assertEqual([row["name"] for row in delta["results"]], ["Operations"])
+        self.assertEqual(delta["deleted"], [doomed_id])
+        self.assertEqual(Tombstone.objects.filter(model_label="actors.department").count(), 2)
+
+    def test_balance_updates_reach_the_feed(self):
+        url = "/api/accounting/accounts/"
+        account = Accounts.objects.create(branch=self.other, code="F1", name="Feed", account_class="coa")
+        cursor = self.client.get(url, {"since": ""}).json()["cursor"]
+
+        # Posting writes balances with queryset.update(), which skips auto_now.
+        _apply_deltas({account.pk: Decimal("12.50")})
+
+        delta = self.client.get(url, {"since": cursor}).json()
+        self.assertEqual([(row["id"], Decimal(row["balance"])) for row in delta["results"]], [(str(account.pk), Decimal("12.50"))])
+
+    def test_paging_with_limit(self):
+        for n in range(5):
+            Department.objects.create(name=f"D{n}", branch=self.other)
+
+        seen, cursor = [], ""
+        while True:
+            body = self.client.get(self.url, {"since": cursor, "limit": 2}).json()
+            seen += [row["name"] for row in body["results"]]
+            cursor = body["cursor"]
+            if not body["has_more"]:
+                break
+        self.assertEqual(sorted(seen), [f"D{n}" for n in range(5)])
+
+    def test_invalid_cursor(self):
+        self.assertEqual(self.client.get(self.url, {"since": "garbage"}).status_code, 400)
+
+    @override_settings(CHANGE_FEED_SETTLE_SECONDS=60)
+    def test_changes_younger_than_the_settle_time_are_held_back(self):
+        old = Department.objects.create(name="Old", branch=self.other)
+        Department.objects.filter(pk=old.pk).update(updated=timezone.now() - timedelta(seconds=120))
+        first = self.client.get(self.url, {"since": ""}).json()
+        self.assertEqual([row["name"] for row in first["results"]], ["Old"])
+
+        # Still inside the settle time: not served yet, and not skipped later.
+        late = Department.objects.create(name="Late", branch=self.other)
+        Department.objects.filter(pk=late.pk).update(updated=timezone.now() - timedelta(seconds=30))
+        self.assertEqual(self.client.get(self.url, {"since": first["cursor"]}).json()["results"], [])
+
+        Department.objects.filter(pk=late.pk).update(updated=timezone.now() - timedelta(seconds=90))
+        delta = self.client.get(self.url, {"since": first["cursor"]}).json()
+        self.assertEqual([row["name"] for row in delta["results"]], ["Late"])
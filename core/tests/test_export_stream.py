@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import csv
+import io
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from actors.models import Department
+from master.models import Branch
+
+
+class ExportStreamTests(TestCase):
+    url = "/api/actors/departments/export/"
+
+    def setUp(self):
+        self.main = Branch.objects.create(name="Main", address="x", city="x", state="x", country="x", contact_number="1", is_main_branch=True)
+        self.other = Branch.objects.create(name="Other", address="x", city="x", state="x", country="x", contact_number="2")
+        self.user = get_user_model().objects.create_user(username="exp", email="exp@example.com", password="x", branch=self.other)
+        for name in ("Ops", "Sales"):
+            Department.objects.create(name=name, branch=self.other)
+        Department.objects.create(name="HQ", branch=self.main)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _rows(self, response):
+        body = b"".join(response.streaming_content).decode()
+        return list(csv.DictReader(io.StringIO(body)))
+
+    def test_csv_is_streamed_in_branch_scope(self):
+        response = self.client.get(self.url, {"format": "csv", "search": "", "ordering": "name"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertIn("attachment;", response["Content-Disposition"])
+        rows = self._rows(response)
+        self.assertEqual([row["name"] for row in rows], ["Ops", "Sales"])
+        self.assertEqual(rows[0]["branch_id"], str(self.other.pk))
+
+    def test_defaults_to_csv_and_rejects_unknown_format(self):
+        self.assertEqual(len(self._rows(self.client.get(self.url))), 2)
+        response = self.client.get(self.url, {"format": "pdf"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("format", response.json())
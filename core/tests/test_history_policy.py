@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import gzip
+import json
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from accounting.models import Accounts
+from core.utils.historyPolicy import bulk_create_with_history, defer_history
+from master.models import Branch
+
+
+class HistoryPolicyTests(TestCase):
+    def setUp(self):
+        self.branch = Branch.objects.create(name="Main", address="x", city="x", state="x", country="x", contact_number="1", is_main_branch=True)
+
+    def _account(self, code="H1"):
+        return Accounts.objects.create(branch=self.branch, code=code, name="History", account_class="coa")
+
+    def test_excluded_field_not_tracked(self):
+        field_names = {f.name for f in Accounts.history.model._meta.fields}
+        self.assertNotIn("balance", field_names)
+        self.assertIn("name", field_names)
+
+    def test_update_fields_save_on_untracked_fields_skips_history(self):
+        account = self._account()
+        account.balance = Decimal("10.00")
+        account.save(update_fields=["balance", "updated"])
+        self.assertEqual(account.history.count(), 1)
+
+        account.name = "Renamed"
+        account.save(update_fields=["name", "balance", "updated"])
+        self.assertEqual(account.history.count(), 2)
+
+    def test_deferred_history_keeps_one_row_per_object(self):
+        with defer_history():
+            account = self._account()
+            for i in range(5):
+                account.name = f"Name {i}"
+                account.save()
+            self.assertEqual(account.history.count(), 0)
+
+        rows = list(account.history.all())
+        self.assertEqual(len(rows), 1)
+        self.assertEqual((rows[0].history_type, rows[0].name), ("+", "Name 4"))
+
+    def test_deferred_row_written_before_delete(self):
+        with defer_history():
+            account = self._account()
+            account.name = "Renamed"
+            account.save()
+            pk = account.pk
+            account.delete()
+
+        rows = Accounts.history.filter(id=pk).order_by("history_date", "history_id")
+        self.assertEqual([(row.history_type, row.name) for row in rows], [("+", "Renamed"), ("-", "Renamed")])
+
+    def test_bulk_create_with_history(self):
+        accounts = [Accounts(branch=self.branch, code=f"B{i}", name=f"Bulk {i}", account_class="coa") for i in range(3)]
+        with self.assertNumQueries(2):
+            bulk_create_with_history(accounts, Accounts)
+        self.assertEqual(Accounts.history.filter(code__startswith="B").count(), 3)
+
+    def test_prune_history_archives_and_deletes_old_rows(self):
+        old, recent = self._account("P1"), self._account("P2")
+        Accounts.history.filter(id=old.id).update(history_date=timezone.now() - timedelta(days=40))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            call_command("prune_history", model=["accounting.accounts"], days=30, batch_size=1, archive_dir=tmp, stdout=StringIO())
+            archives = list(Path(tmp).glob("accounting.accounts-*.jsonl.gz"))
+            self.assertEqual(len(archives), 1)
+            with gzip.open(archives[0], "rt") as fh:
+                rows = [json.loads(line) for line in fh]
+
+        self.assertEqual([row["id"] for row in rows], [str(old.id)])
+        self.assertFalse(Accounts.history.filter(id=old.id).exists())
+        self.assertTrue(Accounts.history.filter(id=recent.id).exists())
+
+    def test_prune_history_writes_no_archive_when_nothing_expires(self):
+        self._account("P3")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            call_command("prune_history", model=["accounting.accounts"], days=30, archive_dir=tmp, stdout=StringIO())
+            self.assertEqual(list(Path(tmp).iterdir()), [])
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from master.models import Branch
+
+
+@override_settings(INSTRUMENTATION_ENABLED=True)
+class InstrumentationTests(TestCase):
+    def setUp(self):
+        self.branch = Branch.objects.create(name="Main", address="x", city="x", state="x", country="x", contact_number="1", is_main_branch=True)
+        self.user = get_user_model().objects.create_user(
+            username="inst", email="inst@example.com", password="x", branch=self.branch, is_staff=True
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_server_timing_and_metrics(self):
+        response = self.client.get("/api/accounting/accounts/")
+        self.assertEqual(response.status_code, 200)
+        timing = response["Server-Timing"]
+        for span in ("db.query;dur=", "serialize;dur=", "total;dur="):
+            self.assertIn(span, timing)
+
+        self.client.force_login(self.user)
+        metrics = self.client.get("/metrics").content.decode()
+        self.assertIn('logidesk_span_duration_seconds_count{span="serialize"}', metrics)
+        self.assertIn('logidesk_request_duration_seconds_count{view="accounts-list",method="GET",status="200"}', metrics)
+
+    def test_profile_token_dumps_profile(self):
+        with tempfile.TemporaryDirectory() as tmp, override_settings(PROFILING_TOKEN="secret", PROFILING_DIR=tmp):
+            token = f"Bearer {AccessToken.for_user(self.user)}"
+            response = self.client.get("/api/accounting/accounts/", HTTP_X_PROFILE_TOKEN="secret", HTTP_AUTHORIZATION=token)
+            self.assertTrue((Path(tmp) / f"{response['X-Profile-Id']}.prof").exists())
+
+            response = self.client.get("/api/accounting/accounts/", HTTP_X_PROFILE_TOKEN="wrong", HTTP_AUTHORIZATION=token)
+            self.assertNotIn("X-Profile-Id", response)
+
+            self.user.is_staff = False
+            self.user.save()
+            token = f"Bearer {AccessToken.for_user(self.user)}"
+            response = self.client.get("/api/accounting/accounts/", HTTP_X_PROFILE_TOKEN="secret", HTTP_AUTHORIZATION=token)
+            self.assertNotIn("X-Profile-Id", response)
+
+    def test_metrics_denied_without_staff_or_token(self):
+        anonymous = APIClient()
+        self.assertEqual(anonymous.get("/metrics").status_code, 403)
+
+        with override_settings(METRICS_TOKEN="scrape"):
+            self.assertEqual(anonymous.get("/metrics", HTTP_AUTHORIZATION="Bearer wrong").status_code, 403)
+            self.assertEqual(anonymous.get("/metrics", HTTP_AUTHORIZATION="Bearer caf\u00e9").status_code, 403)
+            self.assertEqual(anonymous.get("/metrics", HTTP_AUTHORIZATION="Bearer scrape").status_code, 200)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.utils.IsMainBranchOrOwnBranch import IsMainBranchOrOwnBranch
+from core.utils.jwtClaims import build_claims_user
+
+from master.models import Branch
+
+
+class ClaimsJWTAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.branch = Branch.objects.create(name="Main", address="x", city="x", state="x", country="x", contact_number="1", is_main_branch=True)
+        self.user = get_user_model().objects.create_user(username="jwt", email="jwt@example.com", password="secret", branch=self.branch)
+        self.group = Group.objects.create(name="Ops")
+        self.user.groups.add(self.group)
+        self.client = APIClient()
+
+    def _login(self):
+        response = self.client.post("/auth/jwt/create/", {"email": "jwt@example.com", "password": "secret"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_claims_user_skips_user_lookup(self):
+        tokens = self._login()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        self.assertEqual(self.client.get("/api/master/currencies/").status_code, 200)  # warms the auth state
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/master/currencies/")
+        self.assertEqual(response.status_code, 200)
+        tables = " ".join(q["sql"] for q in queries.captured_queries)
+        self.assertNotIn("core_customuser", tables)
+        self.assertNotIn("master_branch", tables)
+
+    def test_revoked_user_is_rejected_after_save(self):
+        tokens = self._login()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        self.assertEqual(self.client.get("/api/master/currencies/").status_code, 200)
+
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get("/api/master/currencies/").status_code, 401)
+
+    def test_group_change_requires_refresh(self):
+        tokens = self._login()
+        self.user.groups.remove(self.group)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        self.assertEqual(self.client.get("/api/master/currencies/").status_code, 401)
+
+        self.client.credentials()
+        refreshed = self.client.post("/auth/jwt/refresh/", {"refresh": tokens["refresh"]}, format="json").json()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {refreshed['access']}")
+        self.assertEqual(self.client.get("/api/master/currencies/").status_code, 200)
+
+    def test_djoser_me_gets_full_user(self):
+        tokens = self._login()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        response = self.client.get("/auth/users/me/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["email"], "jwt@example.com")
+
+    def test_branch_permission_compares_ids(self):
+        other = Branch.objects.create(name="Other", address="x", city="x", state="x", country="x", contact_number="2")
+        self.user.branch = other
+        self.user.save()
+        token = self.client.post("/auth/jwt/create/", {"email": "jwt@example.com", "password": "secret"}, format="json").json()
+        user = build_claims_user(AccessToken(token["access"]))
+        request = type("Request", (), {"user": user})()
+
+        permission = IsMainBranchOrOwnBranch()
+        with self.assertNumQueries(0):
+            self.assertTrue(permission.has_object_permission(request, None, SimpleNamespace(branch_id=other.pk)))
+            self.assertFalse(permission.has_object_permission(request, None, SimpleNamespace(branch_id=self.branch.pk)))
+            self.assertFalse(permission.has_object_permission(request, None, Group(name="no branch")))
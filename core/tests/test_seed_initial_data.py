@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from core.utils.seedInitialData import seed_initial_data
+from core.utils.versionedCache import get_model_version
+from master.models import Currency
+from master.rates import get_rate_table
+
+
+class SeedInitialDataTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_test_database_starts_empty(self):
+        self.assertFalse(Currency.objects.exists())
+
+    def test_seeding_drops_cached_currency_data(self):
+        self.assertEqual(get_rate_table().ids_by_code, {})
+        version = get_model_version(Currency)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            seed_initial_data()
+
+        self.assertGreater(get_model_version(Currency), version)
+        self.assertIn("NPR", get_rate_table().ids_by_code)
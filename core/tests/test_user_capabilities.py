@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from master.models import Branch
+
+
+class UserCapabilitiesTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.branch = Branch.objects.create(name="Main", address="x", city="x", state="x", country="x", contact_number="1", is_main_branch=True)
+        self.user = get_user_model().objects.create_user(username="caps", email="caps@example.com", password="x", branch=self.branch)
+        self.group = Group.objects.create(name="Accounts")
+        self.user.groups.add(self.group)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_capabilities_are_cached(self):
+        first = self.client.get("/api/core/me/capabilities/").json()
+        self.assertEqual(first["branch"]["name"], "Main")
+        self.assertEqual([g["name"] for g in first["groups"]], ["Accounts"])
+        self.assertEqual(first["permissions"], [])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get("/api/core/me/capabilities/").json(), first)
+            first_group = self.client.get(f"/api/core/users/{self.user.pk}/first-group/").json()
+            self.assertEqual(first_group, {"id": self.group.pk, "name": "Accounts"})
+
+    def test_group_permission_change_invalidates(self):
+        self.client.get("/api/core/me/capabilities/")
+        self.group.permissions.add(Permission.objects.get(codename="view_currency"))
+
+        body = self.client.get("/api/core/me/capabilities/").json()
+        self.assertEqual(body["permissions"], ["master.view_currency"])
+
+        user = get_user_model().objects.get(pk=self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertTrue(user.has_perm("master.view_currency"))
+
+    def test_assign_group_replaces_membership(self):
+        admin = get_user_model().objects.create_user(username="adm", email="adm@example.com", password="x", is_staff=True)
+        sales = Group.objects.create(name="Sales")
+        self.client.get("/api/core/me/groups/")
+        url = f"/api/core/users/{self.user.pk}/assign-group/"
+        self.assertEqual(self.client.post(url, {"group_id": sales.pk}, format="json").status_code, 403)
+
+        client = APIClient()
+        client.force_authenticate(admin)
+        response = client.post(url, {"group_id": sales.pk}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get("/api/core/me/groups/").json(), [{"group_name": "Sales"}])
+
+    def test_first_group_of_another_user_needs_staff(self):
+        other = get_user_model().objects.create_user(username="other", email="other@example.com", password="x")
+        url = f"/api/core/users/{self.user.pk}/first-group/"
+
+        client = APIClient()
+        client.force_authenticate(other)
+        self.assertEqual(client.get(url).status_code, 403)
+
+        other.is_staff = True
+        other.save()
+        client.force_authenticate(other)
+        self.assertEqual(client.get(url).json(), {"id": self.group.pk, "name": "Accounts"})
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounting.models import Actors
+from core.utils.userSession import get_current_user, reset_current_user, set_current_user
+from master.models import Branch
+
+
+class RequestContextTests(TestCase):
+    def setUp(self):
+        self.branch = Branch.objects.create(name="Main", address="x", city="x", state="x", country="x", contact_number="1", is_main_branch=True)
+        self.user = get_user_model().objects.create_user(username="ctx", email="ctx@example.com", password="x", branch=self.branch)
+
+    def test_context_is_reset(self):
+        token = set_current_user(self.user)
+        self.assertEqual(get_current_user(), self.user.id)
+        reset_current_user(token)
+        self.assertIsNone(get_current_user())
+
+    def test_viewset_binds_token_user_for_observers(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.post("/api/accounting/actors/", {"name": "Context Actor"}, format="json")
+        self.assertEqual(response.status_code, 201)
+
+        actor = Actors.objects.select_related("account").get(name="Context Actor")
+        self.assertEqual(actor.user_add_id, self.user.id)
+        self.assertEqual(actor.account.user_add_id, self.user.id)
+        self.assertIsNone(get_current_user())
@@ -0,0 +1,12 @@
+from django.urls import path
+
+from core.utils.getuserGroup import UserGroupAPIView
+from core.utils.userGroups import AssignUserToGroupView, GetUserFirstGroupView
+from core.views import UserCapabilitiesView
+
+urlpatterns = [
+    path("me/capabilities/", UserCapabilitiesView.as_view(), name="me-capabilities"),
+    path("me/groups/", UserGroupAPIView.as_view(), name="me-groups"),
+    path("users/<int:user_id>/first-group/", GetUserFirstGroupView.as_view(), name="user-first-group"),
+    path("users/<int:user_id>/assign-group/", AssignUserToGroupView.as_view(), name="assign-user-group"),
+]
@@ -6,7 +6,10 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework_bulk.generics import BulkModelViewSet
 from master.models import Branch
 from core.utils.IsMainBranchOrOwnBranch import IsMainBranchOrOwnBranch
-from core.utils.userSession import get_current_user_branch
+from core.utils.changeFeed import ChangeFeedMixin
+from core.utils.exportStream import ExportMixin
+from core.utils.instrumentation import timed
+from core.utils.userSession import get_current_user_branch_id, reset_current_user, set_current_user
 
 class IsAuthenticated(permissions.IsAuthenticated):
     pass
@@ -39,22 +42,59 @@ class BranchScopedMixin:
         return qs
 
 
-class BaseModelViewSet(BranchScopedMixin, BulkModelViewSet):
+class BaseModelViewSet(ExportMixin, ChangeFeedMixin, BranchScopedMixin, BulkModelViewSet):
     permission_classes = [IsAuthenticated, IsMainBranchOrOwnBranch]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     ordering_fields = "__all__"
     search_fields = []
     filterset_class = None
 
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        # Rebind after DRF authentication so observers see the token user.
+        self._user_context_token = set_current_user(request.user)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        token = getattr(self, "_user_context_token", None)
+        if token is not None:
+            reset_current_user(token)
+            self._user_context_token = None
+        return super().finalize_response(request, response, *args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        if self.wants_change_feed(request):
+            with timed("db.query"):
+                return self.list_changes(request)
+
+        # Same as ListModelMixin.list, split into timed spans for Server-Timing.
+        queryset = self.filter_queryset(self.get_queryset())
+
+        with timed("db.query"):
+            page = self.paginate_queryset(queryset)
+            rows = page if page is not None else list(queryset)
+        with timed("serialize"):
+            data = self.get_serializer(rows, many=True).data
+
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+    def retrieve(self, request, *args, **kwargs):
+        with timed("db.query"):
+            instance = self.get_object()
+        with timed("serialize"):
+            data = self.get_serializer(instance).data
+        return Response(data)
+
     def _valid_branch_for(self, user):
         """Return a valid Branch object for this user, else None."""
         branch = getattr(user, "branch", None)
         if branch and Branch.objects.filter(pk=branch.pk).exists():
             return branch
 
-        # Optional fallback from session helper
+        # Optional fallback from the request context
         try:
-            fb_id = get_current_user_branch()
+            fb_id = get_current_user_branch_id()
         except Exception:
             fb_id = None
         if fb_id and Branch.objects.filter(pk=fb_id).exists():
@@ -65,14 +105,16 @@ class BaseModelViewSet(BranchScopedMixin, BulkModelViewSet):
     def perform_create(self, serializer):
         branch = self.request.user.branch
         extra = {"branch": branch}
-        serializer.save(**extra)
+        with timed("db.save"):
+            serializer.save(**extra)
 
     def perform_update(self, serializer):
         extra = {}
         branch = self.request.user.branch
         if branch is not None:
             extra["branch"] = branch
-        serializer.save(**extra)
+        with timed("db.save"):
+            serializer.save(**extra)
 
 
 
@@ -12,8 +12,9 @@ class IsMainBranchOrOwnBranch(BasePermission):
 
     def has_object_permission(self, request, view, obj):
         # If user is from main branch, allow everything
-        if request.user.branch and request.user.branch.is_main_branch:
+        branch = getattr(request.user, "branch", None)
+        if branch and branch.is_main_branch:
             return True
 
-        # Otherwise, restrict access to user's own branch
-        return hasattr(obj, 'branch_display') and obj.branch_display == request.user.branch
+        # Otherwise, restrict access to user's own branch (compare ids; never load obj.branch)
+        return hasattr(obj, "branch_id") and branch is not None and obj.branch_id == branch.pk
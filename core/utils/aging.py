@@ -0,0 +1,187 @@
+"""
+AR / AP aging.
+
+An AgingSource describes open documents: the party FK, the open amount and
+the due date (falling back to the document date when it is empty). The
+report is one grouped aggregation per branch: a conditional Sum per bucket
+over date ranges derived from `as_of`, grouped by party, so the database
+scans the open rows once and returns one row per party.
+
+Results are cached per (source, branch, as_of) under the source model's
+version counter (core.utils.versionedCache); register_aging_source() bumps
+it on every save or delete, and sources written with queryset.update() bump
+it themselves.
+
+The concrete reports are sales.SalesAgingView and purchase.VendorBillsAgingView.
+Neither app is in INSTALLED_APPS or logidesk/urls.py yet, so those endpoints
+are not served and their open-item indexes have no migration until the apps
+get their initial migrations; the engine itself is tested against
+accounting.ChequeRegister.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.utils.exportStream import CSVExportRenderer, stream_csv
+from core.utils.versionedCache import bump_model_version_on_commit, get_cache, get_model_version
+from master.singletons import company_header
+
+AGING_KEY_PREFIX = "aging"
+
+# (first day, last day) past due; None = open-ended. Not-yet-due items age as day 0.
+AGING_BUCKETS = ((0, 30), (31, 60), (61, 90), (91, None))
+
+
+@dataclass(frozen=True)
+class AgingSource:
+    model: type
+    party_field: str  # FK to the party ("customer", "vendor")
+    amount_field: str  # open amount ("balance_due", "remaining_amount")
+    due_field: str
+    date_field: str | None = None  # used when due_field is empty
+    party_name_field: str | None = None  # e.g. "customer__main_actor__display_name"
+    open_filter: Q = Q()
+
+    @property
+    def label(self) -> str:
+        return self.model._meta.label_lower
+
+
+def bucket_label(bucket) -> str:
+    first, last = bucket
+    return f"{first}_plus" if last is None else f"{first}_{last}"
+
+
+def register_aging_source(source: AgingSource) -> None:
+    """
+    Invalidates cached reports for `source` whenever one of its rows changes.
+    """
+
+    def _bump(sender, using=None, **kwargs):
+        bump_model_version_on_commit(sender, using=using)
+
+    uid = f"aging_{source.label}"
+    post_save.connect(_bump, sender=source.model, weak=False, dispatch_uid=uid)
+    post_delete.connect(_bump, sender=source.model, weak=False, dispatch_uid=f"{uid}_delete")
+
+
+def aging_queryset(source: AgingSource, *, as_of: date, branch_id=None, buckets=AGING_BUCKETS):
+    """
+    values() queryset with one row per party: a column per bucket, `total` and `items`.
+    """
+    amount = source.amount_field
+    queryset = source.model._base_manager.filter(source.open_filter, **{f"{amount}__gt": 0})
+    if branch_id is not None:
+        queryset = queryset.filter(branch_id=branch_id)
+    if source.date_field:
+        queryset = queryset.alias(aging_date=Coalesce(source.due_field, source.date_field))
+    else:
+        queryset = queryset.alias(aging_date=F(source.due_field))
+
+    columns = {}
+    for first, last in buckets:
+        # Due `first`..`last` days before as_of; the first bucket also takes items not yet due.
+        condition = Q() if first == 0 else Q(aging_date__lte=as_of - timedelta(days=first))
+        if last is not None:
+            condition &= Q(aging_date__gte=as_of - timedelta(days=last))
+        columns[bucket_label((first, last))] = Sum(amount, filter=condition, default=Decimal("0"))
+
+    group_by = [f"{source.party_field}_id"]
+    if source.party_name_field:
+        group_by.append(source.party_name_field)
+    return (
+        queryset.values(*group_by)
+        .annotate(**columns, total=Sum(amount), items=Count("pk"))
+        .order_by(f"{source.party_field}_id")
+    )
+
+
+def build_aging(source: AgingSource, *, as_of: date, branch_id=None, buckets=AGING_BUCKETS) -> dict:
+    labels = [bucket_label(bucket) for bucket in buckets]
+    rows, totals = [], dict.fromkeys([*labels, "total"], Decimal("0"))
+    for row in aging_queryset(source, as_of=as_of, branch_id=branch_id, buckets=buckets):
+        entry = {
+            "party_id": row[f"{source.party_field}_id"],
+            "party": row.get(source.party_name_field) if source.party_name_field else None,
+            **{label: row[label] for label in labels},
+            "total": row["total"],
+            "items": row["items"],
+        }
+        for key in totals:
+            totals[key] += entry[key]
+        rows.append(entry)
+    return {"as_of": as_of.isoformat(), "buckets": labels, "rows": rows, "totals": totals}
+
+
+def get_aging(source: AgingSource, *, as_of: date, branch_id=None, buckets=AGING_BUCKETS) -> dict:
+    """
+    build_aging, cached per (source, branch, as_of) until a source row changes.
+    """
+    cache = get_cache()
+    key = (
+        f"{AGING_KEY_PREFIX}:{source.label}:{get_model_version(source.model)}:"
+        f"{branch_id or 'all'}:{as_of.isoformat()}:{','.join(bucket_label(b) for b in buckets)}"
+    )
+    report = cache.get(key)
+    if report is None:
+        report = build_aging(source, as_of=as_of, branch_id=branch_id, buckets=buckets)
+        cache.set(key, report, timeout=getattr(settings, "AGING_CACHE_TIMEOUT", 600))
+    return report
+
+
+class AgingView(APIView):
+    """
+    GET ?as_of=YYYY-MM-DD&format=json|csv
+    Aging per party in the caller's branch; main-branch users see every branch
+    or pick one with ?branch=<id>.
+    """
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [JSONRenderer, CSVExportRenderer]
+    aging_source: AgingSource = None
+
+    def get_as_of(self, request) -> date:
+        raw = request.query_params.get("as_of")
+        if not raw:
+            return timezone.localdate()
+        as_of = parse_date(raw)
+        if as_of is None:
+            raise ValidationError({"as_of": "Use YYYY-MM-DD."})
+        return as_of
+
+    def get_branch_id(self, request):
+        branch = getattr(request.user, "branch", None)
+        if branch is None:
+            raise ValidationError({"branch": "User has no branch."})
+        if not branch.is_main_branch:
+            return branch.pk
+        raw = request.query_params.get("branch")
+        try:
+            return type(branch)._meta.pk.to_python(raw) if raw else None
+        except DjangoValidationError:
+            raise ValidationError({"branch": "Invalid id."})
+
+    def get(self, request):
+        report = get_aging(self.aging_source, as_of=self.get_as_of(request), branch_id=self.get_branch_id(request))
+        if request.query_params.get("format", "json").lower() != "csv":
+            return Response({"company": company_header(), **report})
+
+        labels = report["buckets"]
+        rows = ([r["party_id"], r["party"] or "", *(r[label] for label in labels), r["total"], r["items"]] for r in report["rows"])
+        filename = f"{self.aging_source.model._meta.model_name}-aging-{report['as_of']}.csv"
+        return stream_csv(["party_id", "party", *labels, "total", "items"], rows, filename)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from functools import reduce
+from operator import or_
+
+from asgiref.sync import sync_to_async
+from django.db.models import Q
+from django.http import JsonResponse
+from django.views import View
+from django_filters.filterset import filterset_factory
+from rest_framework.exceptions import AuthenticationFailed, ValidationError
+from rest_framework.settings import api_settings
+
+from master.models import Branch
+from core.utils.userSession import reset_current_user, set_current_user
+
+
+class AsyncListView(View):
+    """
+    Read-only JSON list endpoint served with Django's async ORM.
+
+    Mirrors BaseModelViewSet for the hot dashboard lists: same authentication
+    classes, same branch scoping, PageNumberPagination-shaped payload, and
+    ?search= / ?ordering= / filters. Filters go through django-filter like the
+    DRF viewsets: `filterset_class` (reuse the viewset's), or one built from
+    `filter_fields`; values it cannot parse give a 400.
+    Serializers must only emit local columns and FK ids (no lazy relations).
+    """
+
+    queryset = None
+    serializer_class = None
+    filterset_class = None
+    filter_fields = []
+    search_fields = []
+    ordering_fields = []
+    ordering = ["-created"]
+    page_size = api_settings.PAGE_SIZE or 20
+    max_page_size = 500
+
+    async def get(self, request, *args, **kwargs):
+        user = await self.authenticate(request)
+        if user is None:
+            return JsonResponse({"detail": "Authentication credentials were not provided."}, status=401)
+
+        token = set_current_user(user)
+        try:
+            qs = await self.get_queryset(user)
+            try:
+                # FilterSet validation may query (model choice filters); keep it off the event loop.
+                qs = await sync_to_async(self.filter_queryset)(request, qs)
+            except ValidationError as e:
+                return JsonResponse(e.detail, status=400)
+
+            page, page_size = self.get_page(request)
+            count = await qs.acount()
+            start = (page - 1) * page_size
+            rows = [obj async for obj in qs[start:start + page_size]]
+        finally:
+            reset_current_user(token)
+
+        return JsonResponse(
+            {
+                "count": count,
+                "next": self._page_url(request, page + 1) if start + page_size < count else None,
+                "previous": self._page_url(request, page - 1) if page > 1 else None,
+                "results": await self.serialize(rows),
+            }
+        )
+
+    async def serialize(self, rows):
+        # Serializer fields are sync code; keep them off the event loop.
+        return await sync_to_async(lambda: self.serializer_class(rows, many=True).data)()
+
+    async def authenticate(self, request):
+        for auth_cls in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+            try:
+                result = await sync_to_async(auth_cls().authenticate)(request)
+            except AuthenticationFailed:
+                return None
+            if result is not None:
+                return result[0]
+
+        user = await request.auser()
+        return user if user.is_authenticated else None
+
+    async def get_queryset(self, user):
+        qs = self.queryset.all()
+        model_cls = qs.model
+        if not any(f.name == "branch" for f in model_cls._meta.get_fields()):
+            return qs
+
+        branch_id = getattr(user, "branch_id", None)
+        if not branch_id:
+            return qs
+        is_main = await Branch.objects.filter(pk=branch_id, is_main_branch=True).aexists()
+        return qs if is_main else qs.filter(branch_id=branch_id)
+
+    def get_filterset_class(self, model):
+        if self.filterset_class is not None:
+            return self.filterset_class
+        if self.filter_fields:
+            return filterset_factory(model, fields=self.filter_fields)
+        return None
+
+    def filter_queryset(self, request, qs):
+        params = request.GET
+
+        filterset_class = self.get_filterset_class(qs.model)
+        if filterset_class is not None:
+            filterset = filterset_class(params, queryset=qs, request=request)
+            if not filterset.is_valid():
+                raise ValidationError(filterset.errors)
+            qs = filterset.qs
+
+        term = (params.get("search") or "").strip()
+        if term and self.search_fields:
+            qs = qs.filter(reduce(or_, (Q(**{f"{f}__icontains": term}) for f in self.search_fields)))
+
+        ordering = [o for o in (params.get("ordering") or "").split(",") if o.lstrip("-") in self.ordering_fields]
+        return qs.order_by(*(ordering or self.ordering))
+
+    def get_page(self, request):
+        try:
+            page = max(1, int(request.GET.get("page", 1)))
+        except ValueError:
+            page = 1
+        try:
+            page_size = int(request.GET.get("page_size", self.page_size))
+        except ValueError:
+            page_size = self.page_size
+        return page, max(1, min(page_size, self.max_page_size))
+
+    def _page_url(self, request, page):
+        params = request.GET.copy()
+        params["page"] = page
+        return request.build_absolute_uri(f"{request.path}?{params.urlencode()}")
@@ -0,0 +1,178 @@
+"""
+Delta sync for offline clients: `?since=<cursor>` on any BaseModelViewSet list.
+
+A cursor pins the last (updated, pk) the client has seen plus the last
+Tombstone id. The feed returns rows changed after that position in
+(updated, pk) order, the ids deleted since, and the next cursor. An empty
+`since` starts a full sync. Both reads honour the viewset's filterset and
+branch scope; (branch, updated, id) indexes are added to every branch-scoped
+model by core.utils.coreModels.
+
+`updated` is stamped in Python before the writer commits, and Tombstone ids
+are taken at insert, so a row can become visible after the cursor has moved
+past it. The feed therefore only serves rows and tombstones older than
+CHANGE_FEED_SETTLE_SECONDS: anything stamped before that horizon has
+committed, provided write transactions are shorter than the settle time.
+Changes reach clients that many seconds late, each exactly once.
+
+queryset.update() and bulk_update() skip auto_now: writers using them set
+`updated` themselves, or the change never reaches clients.
+
+Tombstones are kept for CHANGE_FEED_RETENTION_DAYS (pruned by prune_history);
+older cursors get 410 and the client must resync from scratch.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime, timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Max, Q
+from django.db.models.signals import post_delete
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+CURSOR_PARAM = "since"
+
+
+def _retention_days() -> int:
+    return getattr(settings, "CHANGE_FEED_RETENTION_DAYS", 30)
+
+
+def _settle_seconds() -> int:
+    return getattr(settings, "CHANGE_FEED_SETTLE_SECONDS", 30)
+
+
+def encode_cursor(updated, pk, tombstone_id) -> str:
+    payload = {
+        "u": updated.isoformat() if updated else None,
+        "k": str(pk) if pk is not None else None,
+        "t": tombstone_id or 0,
+        "at": timezone.now().isoformat(),
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(raw: str) -> dict | None:
+    """
+    Returns {"updated", "pk", "tombstone_id", "issued_at"}, or None for a full sync.
+    """
+    if not raw or raw == "0":
+        return None
+    try:
+        padded = raw + "=" * (-len(raw) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return {
+            "updated": datetime.fromisoformat(payload["u"]) if payload["u"] else None,
+            "pk": payload["k"],
+            "tombstone_id": int(payload["t"]),
+            "issued_at": datetime.fromisoformat(payload["at"]),
+        }
+    except (ValueError, KeyError, TypeError):
+        raise ValidationError({CURSOR_PARAM: "Invalid cursor."})
+
+
+def record_tombstone(sender, instance, using, **kwargs):
+    from core.models import Tombstone
+
+    Tombstone.objects.using(using).create(
+        model_label=sender._meta.label_lower,
+        object_id=str(instance.pk),
+        branch_id=getattr(instance, "branch_id", None),
+    )
+
+
+def register_tombstone_signals():
+    """
+    Connects record_tombstone per concrete StampedOwnedActive model (not globally,
+    so unrelated models keep Django's fast-delete path).
+    """
+    from core.utils.coreModels import StampedOwnedActive
+
+    for model in apps.get_models():
+        if issubclass(model, StampedOwnedActive):
+            post_delete.connect(record_tombstone, sender=model, dispatch_uid=f"core_tombstone_{model._meta.label_lower}")
+
+
+def prune_tombstones(days=None, using="default") -> int:
+    from core.models import Tombstone
+
+    cutoff = timezone.now() - timedelta(days=_retention_days() if days is None else days)
+    deleted, _ = Tombstone.objects.using(using).filter(deleted_at__lt=cutoff).delete()
+    return deleted
+
+
+class ChangeFeedMixin:
+    """
+    Serves `?since=` from list(). Needs a model with an `updated` timestamp.
+    """
+
+    change_feed_page_size = 500
+    change_feed_max_page_size = 5000
+
+    def wants_change_feed(self, request) -> bool:
+        return CURSOR_PARAM in request.query_params
+
+    def _change_feed_limit(self, request) -> int:
+        try:
+            limit = int(request.query_params.get("limit", self.change_feed_page_size))
+        except ValueError:
+            raise ValidationError({"limit": "Must be an integer."})
+        return max(1, min(limit, self.change_feed_max_page_size))
+
+    def list_changes(self, request):
+        from core.models import Tombstone
+
+        queryset = self.filter_queryset(self.get_queryset())
+        model = queryset.model
+        if not any(f.name == "updated" for f in model._meta.concrete_fields):
+            raise ValidationError({CURSOR_PARAM: f"{model._meta.label} does not support change feeds."})
+
+        cursor = decode_cursor(request.query_params.get(CURSOR_PARAM, ""))
+        if cursor and cursor["issued_at"] < timezone.now() - timedelta(days=_retention_days()):
+            return Response({"detail": "Cursor expired; resync from scratch."}, status=status.HTTP_410_GONE)
+
+        # Only changes stamped before the horizon are certainly committed (see module docstring).
+        horizon = timezone.now() - timedelta(seconds=_settle_seconds())
+        tombstone_high = Tombstone.objects.filter(deleted_at__lte=horizon).aggregate(high=Max("id"))["high"] or 0
+        if cursor:
+            tombstone_high = max(tombstone_high, cursor["tombstone_id"])
+
+        limit = self._change_feed_limit(request)
+        changed = queryset.filter(updated__lte=horizon).order_by("updated", "pk")
+        if cursor and cursor["updated"] is not None:
+            changed = changed.filter(
+                Q(updated__gt=cursor["updated"]) | Q(updated=cursor["updated"], pk__gt=cursor["pk"])
+            )
+        rows = list(changed[: limit + 1])
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        deleted = []
+        if cursor:
+            tombstones = Tombstone.objects.filter(
+                model_label=model._meta.label_lower, id__gt=cursor["tombstone_id"], id__lte=tombstone_high
+            )
+            branch = getattr(request.user, "branch", None)
+            if any(f.name == "branch" for f in model._meta.concrete_fields) and branch and not branch.is_main_branch:
+                tombstones = tombstones.filter(branch_id=branch.pk)
+            deleted = list(tombstones.order_by("id").values_list("object_id", flat=True))
+
+        if rows:
+            last_updated, last_pk = rows[-1].updated, rows[-1].pk
+        elif cursor:
+            last_updated, last_pk = cursor["updated"], cursor["pk"]
+        else:
+            last_updated, last_pk = None, None
+
+        return Response({
+            "results": self.get_serializer(rows, many=True).data,
+            "deleted": deleted,
+            "cursor": encode_cursor(last_updated, last_pk, tombstone_high),
+            "has_more": has_more,
+        })
@@ -1,9 +1,10 @@
 from django.db import models
 from django.conf import settings
-from simple_history.models import HistoricalRecords
 import uuid
 
 from master.models import Branch
+from core.utils.historyPolicy import PolicyHistoricalRecords, skips_history
+from core.utils.userSession import get_current_user
 
 
 class UUIDPk(models.Model):
@@ -26,12 +27,29 @@ class StampedOwnedActive(UUIDPk):
         related_query_name="%(app_label)s_%(class)s_created",
     )
     active = models.BooleanField(default=True)
-    history = HistoricalRecords(inherit=True)
+    history = PolicyHistoricalRecords(inherit=True)
     is_system_generated = models.BooleanField(default=False)
 
+    # History policy, see core.utils.historyPolicy.PolicyHistoricalRecords.
+    history_excluded_fields = ()
+    history_skip_when_only = ()
+    history_retention_days = None
+
     class Meta:
         abstract = True
 
+    def save(self, *args, **kwargs):
+        if self._state.adding and self.user_add_id is None:
+            self.user_add_id = get_current_user()
+        if hasattr(self, "skip_history_when_saving") or not skips_history(type(self), kwargs.get("update_fields")):
+            return super().save(*args, **kwargs)
+
+        self.skip_history_when_saving = True
+        try:
+            super().save(*args, **kwargs)
+        finally:
+            del self.skip_history_when_saving
+
 
 class BranchScoped(models.Model):
     branch = models.ForeignKey(
@@ -46,9 +64,15 @@ class BranchScoped(models.Model):
         abstract = True
 
 
+# Backs the ?since= change feed. Concrete models that declare their own Meta must
+# subclass the base Meta (and extend its indexes) to keep it.
+CHANGE_FEED_INDEX_FIELDS = ["branch", "updated", "id"]
+
+
 class BranchScopedStampedOwnedActive(StampedOwnedActive, BranchScoped):
     class Meta:
         abstract = True
+        indexes = [models.Index(fields=CHANGE_FEED_INDEX_FIELDS)]
 
 
 class TransactionBasedBranchScopedStampedOwnedActive(StampedOwnedActive, BranchScoped):
@@ -70,3 +94,4 @@ class TransactionBasedBranchScopedStampedOwnedActive(StampedOwnedActive, BranchS
 
     class Meta:
         abstract = True
+        indexes = [models.Index(fields=CHANGE_FEED_INDEX_FIELDS)]
@@ -0,0 +1,29 @@
+from django.conf import settings
+
+# Applied to every new SQLite connection. WAL lets readers proceed while a
+# writer commits; busy_timeout makes writers wait instead of raising
+# "database is locked"; synchronous=NORMAL is durable under WAL except on power loss.
+DEFAULT_SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 128 * 1024 * 1024,
+    "busy_timeout": 5000,
+}
+
+
+def sqlite_pragma_statements(pragmas=None):
+    pragmas = DEFAULT_SQLITE_PRAGMAS if pragmas is None else pragmas
+    return [f"PRAGMA {name}={value};" for name, value in pragmas.items()]
+
+
+def configure_sqlite_connection(sender, connection, **kwargs):
+    """
+    connection_created receiver: applies settings.SQLITE_PRAGMAS to SQLite connections.
+    """
+    if connection.vendor != "sqlite":
+        return
+
+    pragmas = getattr(settings, "SQLITE_PRAGMAS", DEFAULT_SQLITE_PRAGMAS)
+    with connection.cursor() as cursor:
+        for statement in sqlite_pragma_statements(pragmas):
+            cursor.execute(statement)
@@ -0,0 +1,139 @@
+"""
+Streaming exports for any BaseModelViewSet: GET <list-url>/export/?format=csv|xlsx.
+The list route itself only serves JSON; exports live at /export/.
+
+Rows come from the same filterset, search and branch scope as list(), read
+with values_list().iterator(chunk_size=EXPORT_CHUNK_SIZE): no model instances
+and no serializer, so memory stays flat with row count. CSV is streamed as it
+is produced. XLSX needs the optional openpyxl package; its write-only
+workbook is spooled to a temporary file and then streamed.
+"""
+
+from __future__ import annotations
+
+import csv
+import tempfile
+from datetime import date, datetime
+
+from django.conf import settings
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils import timezone
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotAcceptable, ValidationError
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+EXPORT_FORMATS = ("csv", "xlsx")
+
+
+class CSVExportRenderer(BaseRenderer):
+    # Only lets ?format=csv through DRF content negotiation; the view builds its own response.
+    media_type = "text/csv"
+    format = "csv"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return data
+
+
+class _Echo:
+    """
+    File-like object for csv.writer that hands each row back instead of buffering it.
+    """
+
+    def write(self, value):
+        return value
+
+
+def _cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return timezone.localtime(value).isoformat() if timezone.is_aware(value) else value.isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def stream_csv(header, rows, filename) -> StreamingHttpResponse:
+    """
+    Streams `header` and then `rows` (iterable of lists) as a CSV attachment.
+    """
+    writer = csv.writer(_Echo())
+
+    def stream():
+        yield writer.writerow(header)
+        for row in rows:
+            yield writer.writerow(row)
+
+    response = StreamingHttpResponse(stream(), content_type="text/csv; charset=utf-8")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+class ExportMixin:
+    """
+    `export_fields` lists the exported lookups (values_list names, so "currency__code"
+    works); by default every concrete column, foreign keys as their ids.
+    """
+
+    export_fields = None
+
+    def get_export_fields(self, model):
+        if self.export_fields:
+            return list(self.export_fields)
+        return [field.attname for field in model._meta.concrete_fields]
+
+    def _export_rows(self, queryset, fields):
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        for row in queryset.values_list(*fields).iterator(chunk_size=chunk_size):
+            yield [_cell(value) for value in row]
+
+    def _export_filename(self, model, extension):
+        return f"{model._meta.model_name}-{timezone.localdate():%Y%m%d}.{extension}"
+
+    def perform_content_negotiation(self, request, force=False):
+        if getattr(self, "action", None) != "export":
+            return super().perform_content_negotiation(request, force)
+        # ?format= picks the file type here, not a renderer, so DRF must not 404 an unknown
+        # one; export() answers it with a 400. Errors render as JSON.
+        renderer = JSONRenderer()
+        return renderer, renderer.media_type
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request, *args, **kwargs):
+        export_format = request.query_params.get("format", "csv").lower()
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError({"format": f"Use one of: {', '.join(EXPORT_FORMATS)}."})
+
+        queryset = self.filter_queryset(self.get_queryset())
+        model = queryset.model
+        fields = self.get_export_fields(model)
+        if export_format == "xlsx":
+            return self._export_xlsx(queryset, model, fields)
+        return self._export_csv(queryset, model, fields)
+
+    def _export_csv(self, queryset, model, fields):
+        return stream_csv(fields, self._export_rows(queryset, fields), self._export_filename(model, "csv"))
+
+    def _export_xlsx(self, queryset, model, fields):
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            raise NotAcceptable("XLSX export needs the openpyxl package; use format=csv.")
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(model._meta.model_name[:31])
+        sheet.append(fields)
+        for row in self._export_rows(queryset, fields):
+            sheet.append(row)
+
+        spool = tempfile.TemporaryFile(suffix=".xlsx")
+        workbook.save(spool)
+        spool.seek(0)
+        return FileResponse(
+            spool, as_attachment=True, filename=self._export_filename(model, "xlsx"), content_type=XLSX_CONTENT_TYPE
+        )
@@ -1,25 +1,9 @@
-from threading import local
-from django.contrib.auth.decorators import login_required
-from django.utils.deprecation import MiddlewareMixin
+from core.utils.userSession import get_current_user_instance
 
- 
-_user = local()
 
- 
-class CurrentUserMiddleware(MiddlewareMixin):
-    
-    def process_request(self, request):
-        try:
-            _user.value = request.user
-        except:
-            pass
- 
 def get_current_user():
-    try:
-        return _user.value
-    except AttributeError:
-        return None
-    except:
-        return None
-    
- 
\ No newline at end of file
+    """
+    Returns the current user's ID (usable as a ForeignKey default), else None.
+    Backed by the request context in core.utils.userSession.
+    """
+    return getattr(get_current_user_instance(), "id", None)
@@ -1,32 +1,16 @@
-from rest_framework import serializers
-from django.contrib.auth.models import Group
-from rest_framework.views import APIView
-from rest_framework import authentication, permissions
-from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.contrib.auth.models import Group
- 
-
-class UserGroupSerializer(serializers.ModelSerializer):
-    group_name = serializers.SerializerMethodField()
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-    def get_group_name(self, obj):
-        return obj.name
+from core.utils.userCapabilities import get_user_capabilities
 
-    class Meta:
-        model = Group
-        fields = ['group_name']
- 
-from rest_framework.views import APIView
-from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
-from django.contrib.auth.models import Group
- 
 
 class UserGroupAPIView(APIView):
+    """
+    The caller's groups, served from the capabilities cache.
+    """
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        user_groups = request.user.groups.all()
-        serializer = UserGroupSerializer(user_groups, many=True)
-        return Response(serializer.data)
+        capabilities = get_user_capabilities(request.user) or {"groups": []}
+        return Response([{"group_name": group["name"]} for group in capabilities["groups"]])
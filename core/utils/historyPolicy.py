@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.apps import apps
+from django.conf import settings
+from django.db import models, transaction
+from simple_history.models import HistoricalRecords
+from simple_history.utils import (
+    bulk_create_with_history as _bulk_create_with_history,
+    bulk_update_with_history as _bulk_update_with_history,
+    get_history_manager_for_model,
+    get_history_model_for_model,
+)
+
+from core.utils.userSession import get_current_user, get_current_user_instance
+
+# Saves touching only these fields never produce a history row on their own.
+ALWAYS_SKIPPED_FIELDS = frozenset({"updated", "updated_at"})
+
+# {(model, pk, using): (instance, history_type)} while inside defer_history().
+_deferred = ContextVar("deferred_history", default=None)
+
+
+def history_excluded_fields(model) -> tuple:
+    return tuple(getattr(model, "history_excluded_fields", ()))
+
+
+def history_retention_days(model):
+    """
+    Days of history kept for `model`: settings.HISTORY_RETENTION_DAYS[label],
+    then the model's `history_retention_days`, then HISTORY_RETENTION_DEFAULT_DAYS.
+    None keeps history forever.
+    """
+    overrides = getattr(settings, "HISTORY_RETENTION_DAYS", {})
+    if model._meta.label_lower in overrides:
+        return overrides[model._meta.label_lower]
+    days = getattr(model, "history_retention_days", None)
+    if days is not None:
+        return days
+    return getattr(settings, "HISTORY_RETENTION_DEFAULT_DAYS", None)
+
+
+def iter_history_models():
+    """
+    Yields (model, history_model) for every installed model tracked by simple_history.
+    """
+    for model in apps.get_models():
+        if hasattr(model._meta, "simple_history_manager_attribute"):
+            yield model, get_history_model_for_model(model)
+
+
+def skips_history(model, update_fields) -> bool:
+    """
+    True when a save(update_fields=...) only touches fields the model's policy
+    does not audit: `history_excluded_fields`, `history_skip_when_only`, timestamps.
+    """
+    if not update_fields:
+        return False
+    ignored = ALWAYS_SKIPPED_FIELDS.union(
+        history_excluded_fields(model), getattr(model, "history_skip_when_only", ())
+    )
+    return set(update_fields) <= ignored
+
+
+class PolicyHistoricalRecords(HistoricalRecords):
+    """
+    HistoricalRecords that reads a per-model policy from class attributes:
+
+    - history_excluded_fields: columns left out of the historical table
+    - history_skip_when_only: update_fields-saves limited to these write no row
+    - history_retention_days: see history_retention_days() / prune_history
+
+    Historical tables get a composite (id, history_date) index for per-object
+    audit lookups. Inside `defer_history()` rows are buffered and bulk-written
+    once per object.
+    """
+
+    def get_meta_options(self, model):
+        meta_fields = super().get_meta_options(model)
+        meta_fields["indexes"] = (
+            *meta_fields.get("indexes", ()),
+            models.Index(fields=(model._meta.pk.attname, "history_date")),
+        )
+        return meta_fields
+
+    def fields_included(self, model):
+        excluded = set(self.excluded_fields).union(history_excluded_fields(model))
+        return [field for field in model._meta.fields if field.name not in excluded]
+
+    def create_history_model(self, model, inherited):
+        history_model = super().create_history_model(model, inherited)
+        history_model._history_excluded_fields = [*self.excluded_fields, *history_excluded_fields(model)]
+        return history_model
+
+    def create_historical_record(self, instance, history_type, using=None):
+        buffer = _deferred.get()
+        if buffer is None:
+            return super().create_historical_record(instance, history_type, using=using)
+
+        key = (type(instance), instance.pk, using)
+        if history_type == "-":
+            # Write the buffered state first so it does not land after the delete row.
+            pending = buffer.pop(key, None)
+            if pending is not None:
+                super().create_historical_record(pending[0], pending[1], using=using)
+            return super().create_historical_record(instance, history_type, using=using)
+
+        previous = buffer.get(key)
+        # An object created and then updated in the same block is one "+" row.
+        buffer[key] = (instance, "+" if previous and previous[1] == "+" else history_type)
+
+
+def _flush(buffer) -> None:
+    groups = {}
+    for (model, _pk, using), (instance, history_type) in buffer.items():
+        groups.setdefault((model, using, history_type), []).append(instance)
+
+    default_user = get_current_user_instance()
+    for (model, using, history_type), instances in groups.items():
+        manager = get_history_manager_for_model(model)
+        if using:
+            manager = manager.db_manager(using)
+        manager.bulk_history_create(instances, update=history_type == "~", default_user=default_user)
+
+
+@contextmanager
+def defer_history(using=None):
+    """
+    Buffers history rows produced inside the block and writes them with one
+    bulk insert per model on exit, keeping only the final state of each object.
+    Nested blocks share the outermost buffer. Deletes are still written at once,
+    after any buffered row for the same object.
+    """
+    if _deferred.get() is not None:
+        yield
+        return
+
+    buffer = {}
+    token = _deferred.set(buffer)
+    try:
+        with transaction.atomic(using=using):
+            yield
+            _deferred.reset(token)
+            token = None
+            _flush(buffer)
+    finally:
+        if token is not None:
+            _deferred.reset(token)
+
+
+def _stamp_user_add(objs) -> None:
+    user_id = get_current_user()
+    if user_id is None:
+        return
+    for obj in objs:
+        if hasattr(obj, "user_add_id") and obj.user_add_id is None:
+            obj.user_add_id = user_id
+
+
+def bulk_create_with_history(objs, model, batch_size=500, **kwargs):
+    """
+    bulk_create plus one bulk insert of "+" history rows, stamped like save().
+    """
+    objs = list(objs)
+    _stamp_user_add(objs)
+    kwargs.setdefault("default_user", get_current_user_instance())
+    return _bulk_create_with_history(objs, model, batch_size=batch_size, **kwargs)
+
+
+def bulk_update_with_history(objs, model, fields, batch_size=500, **kwargs):
+    """
+    bulk_update plus "~" history rows, skipped when the policy says `fields` are not audited.
+    """
+    objs = list(objs)
+    if skips_history(model, fields):
+        return model.objects.bulk_update(objs, fields, batch_size=batch_size)
+    kwargs.setdefault("default_user", get_current_user_instance())
+    return _bulk_update_with_history(objs, model, fields, batch_size=batch_size, **kwargs)
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import cProfile
+import functools
+import hmac
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils import timezone
+from rest_framework.exceptions import APIException
+from rest_framework.settings import api_settings
+
+# Per-request spans: {name: [total_seconds, calls]}. None outside an instrumented request.
+_spans = ContextVar("instrumentation_spans", default=None)
+
+_lock = threading.Lock()
+# Process-wide aggregates rendered by metrics_view: {(metric, labels): [sum_seconds, count]}.
+_registry = {}
+
+
+def instrumentation_enabled() -> bool:
+    return getattr(settings, "INSTRUMENTATION_ENABLED", False)
+
+
+def _record(metric: str, labels: tuple, seconds: float) -> None:
+    with _lock:
+        entry = _registry.setdefault((metric, labels), [0.0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+
+
+@contextmanager
+def timed(name: str):
+    """
+    Times the block as span `name`: added to the current request's Server-Timing
+    header and to the process-wide /metrics counters. No-op when disabled.
+    """
+    if not instrumentation_enabled():
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        spans = _spans.get()
+        if spans is not None:
+            span = spans.setdefault(name, [0.0, 0])
+            span[0] += elapsed
+            span[1] += 1
+        _record("span", (("span", name),), elapsed)
+
+
+def timed_function(name: str):
+    """
+    Decorator form of `timed`.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _server_timing_header(spans, total: float) -> str:
+    parts = [f"{name.replace(' ', '_')};dur={seconds * 1000:.1f}" for name, (seconds, _calls) in spans.items()]
+    parts.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(parts)
+
+
+def _token_matches(secret: str, supplied: str) -> bool:
+    # Bytes: compare_digest rejects str holding non-ASCII characters.
+    return bool(secret and supplied) and hmac.compare_digest(secret.encode(), supplied.encode())
+
+
+def _is_staff(request) -> bool:
+    """
+    Whether the request comes from a staff user, by session or by the API's
+    authentication classes (DRF has not authenticated the request yet here).
+    """
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return user.is_staff
+    for authentication_class in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+        try:
+            result = authentication_class().authenticate(request)
+        except APIException:
+            return False
+        if result is not None:
+            return bool(result[0].is_staff)
+    return False
+
+
+def _should_profile(request) -> bool:
+    supplied = request.headers.get("X-Profile-Token", "")
+    if not _token_matches(getattr(settings, "PROFILING_TOKEN", ""), supplied) or not _is_staff(request):
+        return False
+    return random.random() < getattr(settings, "PROFILING_SAMPLE_RATE", 1.0)
+
+
+def _dump_profile(profiler, request) -> str:
+    directory = Path(getattr(settings, "PROFILING_DIR", "profiles"))
+    directory.mkdir(parents=True, exist_ok=True)
+    slug = request.path.strip("/").replace("/", "_") or "root"
+    profile_id = f"{timezone.now():%Y%m%dT%H%M%S%f}-{slug}"
+    profiler.dump_stats(directory / f"{profile_id}.prof")
+    return profile_id
+
+
+class ServerTimingMiddleware:
+    """
+    Opt-in (INSTRUMENTATION_ENABLED) request timing: collects `timed` spans into a
+    Server-Timing header and per-view request metrics. Staff requests carrying
+    X-Profile-Token == PROFILING_TOKEN are sampled into a cProfile dump.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not instrumentation_enabled():
+            return self.get_response(request)
+
+        token = _spans.set({})
+        profiler = cProfile.Profile() if _should_profile(request) else None
+        start = time.perf_counter()
+        try:
+            if profiler is not None:
+                response = profiler.runcall(self.get_response, request)
+            else:
+                response = self.get_response(request)
+            return self._finish(request, response, profiler, start)
+        finally:
+            _spans.reset(token)
+
+    async def __acall__(self, request):
+        if not instrumentation_enabled():
+            return await self.get_response(request)
+
+        # cProfile is per-thread and cannot follow an event loop; async requests are timed only.
+        token = _spans.set({})
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+            return self._finish(request, response, None, start)
+        finally:
+            _spans.reset(token)
+
+    def _finish(self, request, response, profiler, start):
+        total = time.perf_counter() - start
+        response["Server-Timing"] = _server_timing_header(_spans.get() or {}, total)
+
+        match = getattr(request, "resolver_match", None)
+        view = getattr(match, "view_name", None) or "unresolved"
+        _record("request", (("view", view), ("method", request.method), ("status", str(response.status_code))), total)
+
+        if profiler is not None:
+            response["X-Profile-Id"] = _dump_profile(profiler, request)
+        return response
+
+
+def render_metrics() -> str:
+    with _lock:
+        items = sorted((key, list(value)) for key, value in _registry.items())
+
+    lines = []
+    for metric in ("request", "span"):
+        name = f"logidesk_{metric}_duration_seconds"
+        lines.append(f"# TYPE {name} summary")
+        for (kind, labels), (seconds, count) in items:
+            if kind != metric:
+                continue
+            label_text = ",".join(f'{k}="{v}"' for k, v in labels)
+            lines.append(f"{name}_sum{{{label_text}}} {seconds:.6f}")
+            lines.append(f"{name}_count{{{label_text}}} {count}")
+    return "\n".join(lines) + "\n"
+
+
+def metrics_view(request):
+    """
+    Prometheus text exposition of the timing aggregates, for staff users or
+    scrapers sending `Authorization: Bearer <METRICS_TOKEN>`. Denied otherwise.
+    """
+    supplied = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+    if not _token_matches(getattr(settings, "METRICS_TOKEN", ""), supplied) and not _is_staff(request):
+        return HttpResponseForbidden()
+    return HttpResponse(render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -0,0 +1,210 @@
+"""
+JWT claims fast path.
+
+Tokens carry the user's branch, main-branch flag and group ids, so
+ClaimsJWTAuthentication can build the request user without loading the user
+row. Revocation is checked against a small per-user auth state cached for
+JWT_CLAIMS_REVALIDATE_SECONDS and dropped whenever the user, their groups or
+their branch change. The state includes a stamp over everything the claims
+describe (plus the password hash): a token whose stamp no longer matches is
+rejected and the client has to refresh it, which re-issues current claims.
+
+Paths in JWT_FULL_USER_PATH_PREFIXES (djoser's /auth/ by default) still get
+the full database user, since those endpoints read and save the user itself.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from master.models import Branch
+
+AUTH_STATE_KEY_PREFIX = "jwtauth"
+STAMP_CLAIM = "auth_stamp"
+
+
+def _get_cache():
+    return caches[getattr(settings, "JWT_CLAIMS_CACHE_ALIAS", "default")]
+
+
+def _state_key(user_id) -> str:
+    return f"{AUTH_STATE_KEY_PREFIX}:{user_id}"
+
+
+def _auth_stamp(*, branch_id, is_main_branch, group_ids, is_staff, is_superuser, password) -> str:
+    raw = "|".join(
+        [str(branch_id), str(bool(is_main_branch)), ",".join(map(str, sorted(group_ids))),
+         str(bool(is_staff)), str(bool(is_superuser)), password or ""]
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()[:24]
+
+
+def load_auth_state(user_id) -> dict | None:
+    """
+    Returns {"is_active", "stamp"} for the user (cached), or None if the user no longer exists.
+    """
+    cache = _get_cache()
+    key = _state_key(user_id)
+    state = cache.get(key)
+    if state is not None:
+        return state or None
+
+    User = get_user_model()
+    row = (
+        User.objects.filter(pk=user_id)
+        .values("is_active", "branch_id", "branch__is_main_branch", "is_staff", "is_superuser", "password")
+        .first()
+    )
+    if row is None:
+        state = {}
+    else:
+        group_ids = User.groups.through.objects.filter(customuser_id=user_id).values_list("group_id", flat=True)
+        state = {
+            "is_active": row["is_active"],
+            "stamp": _auth_stamp(
+                branch_id=row["branch_id"],
+                is_main_branch=row["branch__is_main_branch"],
+                group_ids=list(group_ids),
+                is_staff=row["is_staff"],
+                is_superuser=row["is_superuser"],
+                password=row["password"],
+            ),
+        }
+    cache.set(key, state, timeout=getattr(settings, "JWT_CLAIMS_REVALIDATE_SECONDS", 60))
+    return state or None
+
+
+def invalidate_auth_state(*user_ids) -> None:
+    _get_cache().delete_many([_state_key(user_id) for user_id in user_ids])
+
+
+def add_user_claims(token, user):
+    """
+    Writes the branch / group claims and the auth stamp for `user` into `token`.
+    """
+    branch = user.branch if user.branch_id else None
+    group_ids = sorted(user.groups.values_list("id", flat=True))
+    token["branch_id"] = str(user.branch_id) if user.branch_id else None
+    token["is_main_branch"] = bool(branch and branch.is_main_branch)
+    token["groups"] = group_ids
+    token["email"] = user.email
+    token["is_staff"] = user.is_staff
+    token["is_superuser"] = user.is_superuser
+    token[STAMP_CLAIM] = _auth_stamp(
+        branch_id=user.branch_id,
+        is_main_branch=token["is_main_branch"],
+        group_ids=group_ids,
+        is_staff=user.is_staff,
+        is_superuser=user.is_superuser,
+        password=user.password,
+    )
+    return token
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        return add_user_claims(super().get_token(user), user)
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Re-issues the claims on refresh so branch / group changes reach the client.
+    """
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        access = AccessToken(data["access"])
+        user = (
+            get_user_model().objects.select_related("branch")
+            .filter(**{api_settings.USER_ID_FIELD: access[api_settings.USER_ID_CLAIM]})
+            .first()
+        )
+        if user is None:
+            raise AuthenticationFailed(self.error_messages["no_active_account"], "no_active_account")
+
+        data["access"] = str(add_user_claims(access, user))
+        if "refresh" in data:
+            data["refresh"] = str(add_user_claims(RefreshToken(data["refresh"]), user))
+        return data
+
+
+def build_claims_user(validated_token):
+    """
+    User instance populated from the token without a query. Built like a
+    deferred-field load, so any field the claims do not carry loads lazily
+    and save() only writes the claim fields. `branch` is pre-cached, so
+    request.user.branch never queries either.
+    """
+    User = get_user_model()
+    db = User.objects.db
+    branch_id = Branch._meta.pk.to_python(validated_token.get("branch_id"))
+    user = User.from_db(
+        db,
+        ["id", "email", "is_active", "is_staff", "is_superuser", "branch_id"],
+        [
+            User._meta.pk.to_python(validated_token[api_settings.USER_ID_CLAIM]),
+            validated_token.get("email", ""),
+            True,
+            validated_token.get("is_staff", False),
+            validated_token.get("is_superuser", False),
+            branch_id,
+        ],
+    )
+    branch = None
+    if branch_id:
+        branch = Branch.from_db(db, ["id", "is_main_branch"], [branch_id, validated_token.get("is_main_branch", False)])
+    User.branch.field.set_cached_value(user, branch)
+    user.group_ids = list(validated_token.get("groups", []))
+    user.from_token_claims = True
+    return user
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that trusts the token claims (see module docstring).
+    Tokens issued before the claims existed fall back to the database user.
+    """
+
+    def authenticate(self, request):
+        prefixes = tuple(getattr(settings, "JWT_FULL_USER_PATH_PREFIXES", ("/auth/",)))
+        if prefixes and request.path.startswith(prefixes):
+            return super().authenticate(request)
+
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        if STAMP_CLAIM not in validated_token:
+            return super().get_user(validated_token), validated_token
+        return self.get_claims_user(validated_token), validated_token
+
+    def get_claims_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        state = load_auth_state(user_id)
+        if state is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        if not state["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        if state["stamp"] != validated_token[STAMP_CLAIM]:
+            raise AuthenticationFailed(_("Token claims are out of date; refresh the token."), code="token_stale")
+
+        return build_claims_user(validated_token)
@@ -0,0 +1,53 @@
+"""
+Repointing helper for merging duplicate rows into a survivor.
+
+repoint_references moves every foreign key to `from_ids` onto `to_id` with
+one UPDATE per referencing column. One-to-one and many-to-many relations
+cannot be repointed blindly (the survivor may already hold the other side),
+so they are returned for the caller to resolve. Historical models' FKs are
+not constraints and are left alone. The updates send no signals and skip
+auto_now, so the versionedCache counter of every model touched is bumped and
+an `updated` stamp (the change feed cursor) is set here.
+"""
+
+from __future__ import annotations
+
+from django.core.exceptions import FieldDoesNotExist
+from django.utils import timezone
+
+from core.utils.versionedCache import bump_model_version_on_commit
+
+
+def _has_auto_now(model, name) -> bool:
+    try:
+        return bool(getattr(model._meta.get_field(name), "auto_now", False))
+    except FieldDoesNotExist:
+        return False
+
+
+def repoint_references(model, from_ids, to_id, using="default") -> list:
+    """
+    Repoints FKs to `model` rows in `from_ids` onto `to_id`; returns the skipped
+    (one-to-one / many-to-many) relations.
+    """
+    from_ids = [pk for pk in from_ids if pk != to_id]
+    skipped = []
+    if not from_ids:
+        return skipped
+    for relation in model._meta.related_objects:
+        # Reverse side of a ForeignKey: many rows of field.model point at one `model` row.
+        if not relation.one_to_many:
+            skipped.append(relation)
+            continue
+        field = relation.field
+        values = {field.name: to_id}
+        if _has_auto_now(field.model, "updated"):
+            values["updated"] = timezone.now()
+        updated = (
+            field.model._base_manager.using(using)
+            .filter(**{f"{field.name}__in": from_ids})
+            .update(**values)
+        )
+        if updated:
+            bump_model_version_on_commit(field.model, using=using)
+    return skipped
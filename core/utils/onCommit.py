@@ -0,0 +1,49 @@
+"""
+Per-transaction coalescing for on_commit work.
+
+coalesce_on_commit(key, callback) runs `callback` once when the current
+transaction commits, however many times the same key is scheduled before
+then; all keys share one on_commit flush. Outside a transaction the callback
+runs at once, as transaction.on_commit does. Callbacks should re-read their
+rows by pk, since the objects may have changed or gone by commit time.
+"""
+
+from __future__ import annotations
+
+from django.db import transaction
+
+_PENDING_ATTR = "_coalesced_on_commit"
+
+
+class _Pending(dict):
+    def __init__(self, connection):
+        super().__init__()
+        self.connection = connection
+
+    def flush(self):
+        if getattr(self.connection, _PENDING_ATTR, None) is self:
+            delattr(self.connection, _PENDING_ATTR)
+        for callback in self.values():
+            callback()
+
+    def is_scheduled(self) -> bool:
+        # Rolling back drops the flush from run_on_commit (savepoints included);
+        # the pending keys went with it.
+        return any(entry[1] == self.flush for entry in self.connection.run_on_commit)
+
+
+def coalesce_on_commit(key, callback, using=None) -> None:
+    """
+    Schedules `callback` to run once on commit for `key`; repeats of a pending key are dropped.
+    """
+    connection = transaction.get_connection(using)
+    if not connection.in_atomic_block:
+        callback()
+        return
+
+    pending = getattr(connection, _PENDING_ATTR, None)
+    if pending is None or not pending.is_scheduled():
+        pending = _Pending(connection)
+        setattr(connection, _PENDING_ATTR, pending)
+        transaction.on_commit(pending.flush, using=using)
+    pending.setdefault(key, callback)
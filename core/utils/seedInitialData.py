@@ -1,19 +1,16 @@
 from __future__ import annotations
 
 import os
-import threading
 from decimal import Decimal
 
 from django.contrib.auth import get_user_model
-from django.db import transaction, IntegrityError
+from django.db import DEFAULT_DB_ALIAS, transaction, IntegrityError
 from django.db.utils import OperationalError, ProgrammingError
+from django.utils import timezone
 
+from core.utils.versionedCache import bump_model_version_on_commit
 from master.models import Branch, Currency
 
-# Prevent re-running per request (per process)
-_SEEDED = False
-_LOCK = threading.Lock()
-
 
 # A practical currency set (not full ISO 4217 ~180+ codes).
 # If you truly want ALL ISO codes, use `pycountry` or import a JSON dataset.
@@ -65,34 +62,70 @@ CURRENCY_SEED = [
 ]
 
 
-def seed_initial_data() -> None:
+def _seed_currencies(base_code: str, user_add, using: str) -> None:
+    """
+    Upsert CURRENCY_SEED in a single statement.
+    Existing rows keep their rate_to_base / active flag; only descriptive fields are refreshed.
+    """
+    # Clear a different base first so the partial unique index never sees two bases.
+    Currency.objects.using(using).filter(is_base=True).exclude(code=base_code).update(is_base=False, updated=timezone.now())
+
+    rows = [
+        Currency(
+            code=c["code"].upper().strip(),
+            name=c["name"],
+            symbol=c.get("symbol", "") or "",
+            decimal_places=int(c.get("dp", 2)),
+            is_base=c["code"].upper().strip() == base_code,
+            # rate_to_base: keep default 1 unless you have a live FX source
+            rate_to_base=Decimal("1"),
+            active=True,
+            user_add=user_add,
+        )
+        for c in CURRENCY_SEED
+    ]
+    if base_code not in {r.code for r in rows}:
+        rows.append(Currency(code=base_code, name=base_code, symbol="", decimal_places=2, is_base=True, rate_to_base=Decimal("1"), active=True, user_add=user_add))
+
+    Currency.objects.using(using).bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["code"],
+        update_fields=["name", "symbol", "decimal_places", "is_base", "updated"],
+    )
+    # update() and bulk_create() send no signals, so cached currency data is dropped here.
+    bump_model_version_on_commit(Currency, using=using)
+
+
+def seed_initial_data(using: str = DEFAULT_DB_ALIAS) -> None:
     """
     Idempotent: safe to call multiple times.
+    Runs from the `seed_initial_data` management command and after `migrate`.
     """
     User = get_user_model()
 
     # If migrations haven't run yet, tables may not exist.
     # Just skip until DB is ready.
     try:
-        with transaction.atomic():
+        with transaction.atomic(using=using):
             # ------------------ 1) Main Branch ------------------
-            main_branch = Branch.objects.filter(is_main_branch=True).first()
+            main_branch = Branch.objects.using(using).filter(is_main_branch=True).first()
 
             if not main_branch:
                 branch_name = os.getenv("APP_MAIN_BRANCH_NAME", "Main Branch")
                 branch_code = os.getenv("APP_MAIN_BRANCH_CODE", "KTM")
 
                 # Prefer existing branch with that branch_id, else create
-                existing_by_branch_id = Branch.objects.filter(branch_id=branch_code).first()
+                existing_by_branch_id = Branch.objects.using(using).filter(branch_id=branch_code).first()
                 if existing_by_branch_id:
                     # Ensure no other main branch (shouldn't exist due constraint, but be safe)
-                    Branch.objects.filter(is_main_branch=True).update(is_main_branch=False)
+                    Branch.objects.using(using).filter(is_main_branch=True).update(is_main_branch=False)
                     existing_by_branch_id.is_main_branch = True
                     existing_by_branch_id.name = existing_by_branch_id.name or branch_name
                     existing_by_branch_id.save(update_fields=["is_main_branch", "name", "updated_at"])
                     main_branch = existing_by_branch_id
                 else:
-                    main_branch = Branch.objects.create(
+                    main_branch = Branch.objects.using(using).create(
                         branch_id=branch_code,
                         name=branch_name,
                         is_main_branch=True,
@@ -109,9 +142,9 @@ def seed_initial_data() -> None:
             su_username = os.getenv("APP_SUPERUSER_USERNAME", "admin")
             su_password = os.getenv("APP_SUPERUSER_PASSWORD", "Balkot11@")  # CHANGE THIS in production
 
-            superuser = User.objects.filter(is_superuser=True).first()
+            superuser = User.objects.using(using).filter(is_superuser=True).first()
             if not superuser:
-                by_email = User.objects.filter(email=su_email).first()
+                by_email = User.objects.using(using).filter(email=su_email).first()
                 if by_email:
                     # Upgrade existing user to superuser
                     by_email.is_staff = True
@@ -123,7 +156,7 @@ def seed_initial_data() -> None:
                     by_email.save()
                     superuser = by_email
                 else:
-                    superuser = User.objects.create_superuser(
+                    superuser = User.objects.db_manager(using).create_superuser(
                         username=su_username,
                         email=su_email,
                         password=su_password,
@@ -139,42 +172,7 @@ def seed_initial_data() -> None:
 
             # ------------------ 3) Currencies ------------------
             base_code = os.getenv("APP_BASE_CURRENCY", "NPR").upper().strip()
-
-            # Ensure only one base currency always
-            # We'll set base later; first upsert list.
-            for c in CURRENCY_SEED:
-                code = c["code"].upper().strip()
-                is_base = (code == base_code) or bool(c.get("base", False) and base_code == "NPR" and code == "NPR")
-
-                Currency.objects.update_or_create(
-                    code=code,
-                    defaults={
-                        "name": c["name"],
-                        "symbol": c.get("symbol", "") or "",
-                        "decimal_places": int(c.get("dp", 2)),
-                        "is_base": is_base,
-                        # rate_to_base: keep default 1 unless you have a live FX source
-                        "rate_to_base": Decimal("1"),
-                        "active": True,
-                        "user_add": superuser if hasattr(Currency, "user_add") else None,
-                    },
-                )
-
-            # If base currency not in seed list, at least create it
-            if not Currency.objects.filter(code=base_code).exists():
-                Currency.objects.create(
-                    name=base_code,
-                    code=base_code,
-                    symbol="",
-                    decimal_places=2,
-                    is_base=True,
-                    rate_to_base=Decimal("1"),
-                    active=True,
-                    user_add=superuser,
-                )
-
-            # Enforce single base (just in case)
-            Currency.objects.filter(is_base=True).exclude(code=base_code).update(is_base=False)
+            _seed_currencies(base_code, superuser, using)
 
     except (OperationalError, ProgrammingError):
         # DB tables not ready yet (before migrations). Ignore.
@@ -182,22 +180,3 @@ def seed_initial_data() -> None:
     except IntegrityError:
         # Concurrent create in multi-worker startup; safe to ignore.
         return
-
-
-class InitialSeederMiddleware:
-    """
-    Runs seeding once (per process) on the first request.
-    Safe with unique constraints + update_or_create.
-    """
-    print("-------------Middle ware executed---------------------")
-    def __init__(self, get_response):
-        self.get_response = get_response
-
-    def __call__(self, request):
-        global _SEEDED
-        if not _SEEDED:
-            with _LOCK:
-                if not _SEEDED:
-                    seed_initial_data()
-                    _SEEDED = True
-        return self.get_response(request)
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+
+class NoSeedTestRunner(DiscoverRunner):
+    """
+    Test databases start empty: initial data is not seeded after their migrate.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._no_seed = override_settings(SEED_INITIAL_DATA_ON_MIGRATE=False)
+        self._no_seed.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._no_seed.disable()
+        super().teardown_test_environment(**kwargs)
@@ -0,0 +1,81 @@
+"""
+Per-user capabilities cache: branch, groups and permissions in one entry.
+
+The entry backs /api/core/me/capabilities/, the group endpoints and
+CachedModelBackend (so user.has_perm stops reloading permissions on every
+request). core.signals drops it on group / permission membership changes,
+group permission changes and user or branch saves.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import caches
+
+CAPABILITIES_KEY_PREFIX = "caps"
+
+
+def _get_cache():
+    return caches[getattr(settings, "USER_CAPABILITIES_CACHE_ALIAS", "default")]
+
+
+def _key(user_id) -> str:
+    return f"{CAPABILITIES_KEY_PREFIX}:{user_id}"
+
+
+def _load_capabilities(user_id) -> dict | None:
+    User = get_user_model()
+    user = User.objects.select_related("branch").filter(pk=user_id).first()
+    if user is None:
+        return None
+
+    branch = user.branch if user.branch_id else None
+    return {
+        "user_id": user.pk,
+        "email": user.email,
+        "is_staff": user.is_staff,
+        "is_superuser": user.is_superuser,
+        "branch": {"id": str(branch.pk), "name": branch.name, "is_main_branch": branch.is_main_branch} if branch else None,
+        "groups": list(user.groups.order_by("name").values("id", "name")),
+        "permissions": sorted(ModelBackend().get_all_permissions(user)),
+    }
+
+
+def get_user_capabilities(user) -> dict | None:
+    """
+    Returns the cached capabilities for `user` (instance or id), loading them on a miss.
+    """
+    user_id = getattr(user, "pk", user)
+    if user_id is None:
+        return None
+
+    cache = _get_cache()
+    capabilities = cache.get(_key(user_id))
+    if capabilities is None:
+        capabilities = _load_capabilities(user_id)
+        if capabilities is None:
+            return None
+        cache.set(_key(user_id), capabilities, timeout=getattr(settings, "USER_CAPABILITIES_TIMEOUT", 300))
+    return capabilities
+
+
+def invalidate_user_capabilities(*user_ids) -> None:
+    if user_ids:
+        _get_cache().delete_many([_key(user_id) for user_id in user_ids])
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    ModelBackend whose permission lookups come from the capabilities cache.
+    Object-level checks and inactive users behave exactly as in ModelBackend.
+    """
+
+    def get_all_permissions(self, user_obj, obj=None):
+        if not user_obj.is_active or user_obj.is_anonymous or obj is not None:
+            return set()
+        if not hasattr(user_obj, "_perm_cache"):
+            capabilities = get_user_capabilities(user_obj)
+            user_obj._perm_cache = set(capabilities["permissions"]) if capabilities else set()
+        return user_obj._perm_cache
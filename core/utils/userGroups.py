@@ -3,6 +3,9 @@ from django.contrib.auth.models import Group
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+
+from core.utils.userCapabilities import get_user_capabilities, invalidate_user_capabilities
 
 User = get_user_model()
 
@@ -11,6 +14,7 @@ class AssignUserToGroupView(APIView):
     """
     Assign a user to a single group (replaces old group).
     """
+    permission_classes = [IsAdminUser]
 
     def post(self, request, user_id):
         group_id = request.data.get("group_id")
@@ -30,6 +34,8 @@ class AssignUserToGroupView(APIView):
         # Replace old groups → user only has one group at a time
         user.groups.clear()
         user.groups.add(group)
+        # m2m_changed already invalidates; this covers raw through-table writes elsewhere.
+        invalidate_user_capabilities(user.pk)
 
         return Response(
             {"success": f"User {user.username} assigned to group {group.name}"},
@@ -39,20 +45,25 @@ class AssignUserToGroupView(APIView):
 
 class GetUserFirstGroupView(APIView):
     """
-    Get the first group assigned to a user.
+    Get the first group assigned to a user, from the capabilities cache.
+    Users may read their own; staff may read anyone's.
     """
+    permission_classes = [IsAuthenticated]
 
     def get(self, request, user_id):
-        try:
-            user = User.objects.get(pk=user_id)
-        except User.DoesNotExist:
+        if request.user.pk != user_id and not request.user.is_staff:
+            return Response({"error": "Not allowed"}, status=status.HTTP_403_FORBIDDEN)
+
+        capabilities = get_user_capabilities(user_id)
+        if capabilities is None:
             return Response({"error": "User not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        first_group = user.groups.first()
+        # user.groups.first() orders by pk.
+        first_group = min(capabilities["groups"], key=lambda group: group["id"], default=None)
         if not first_group:
             return Response({"group": None}, status=status.HTTP_200_OK)
 
         return Response(
-            {"id": first_group.id, "name": first_group.name},
+            {"id": first_group["id"], "name": first_group["name"]},
             status=status.HTTP_200_OK,
         )
@@ -1,40 +1,88 @@
 import logging
-from threading import local
-from django.utils.deprecation import MiddlewareMixin
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 
 # Logger for debugging purposes
 logger = logging.getLogger(__name__)
 
-# Thread-local storage
-_user = local()
+# Request-scoped user. ContextVars follow the request across await points and
+# into sync_to_async thread pools, and never leak between concurrent requests.
+_current_user = ContextVar("current_user", default=None)
 
 
-class CurrentUserMiddleware(MiddlewareMixin):
-    def process_request(self, request):
-        try:
-            _user.id = getattr(request.user, 'id', None)
-            _user.branch = getattr(request.user, 'branch', None)
-            _user.branch_id = getattr(_user.branch, 'id', None)
-        except Exception as e:
-            logger.warning(f"CurrentUserMiddleware error: {e}")
+def set_current_user(user):
+    """
+    Binds `user` to the current context. Returns a token for `reset_current_user`.
+    """
+    return _current_user.set(user)
+
+
+def reset_current_user(token) -> None:
+    try:
+        _current_user.reset(token)
+    except ValueError as e:
+        # Token created in a different context (e.g. response finalized elsewhere).
+        logger.warning(f"reset_current_user error: {e}")
+
+
+def get_current_user_instance():
+    """
+    Returns the authenticated user bound to this request context, else None.
+    """
+    user = _current_user.get()
+    if user is None or not getattr(user, "is_authenticated", False):
+        return None
+    return user
 
 
 def get_current_user():
     """
-    Returns the current user's ID stored in thread-local storage.
+    Returns the current user's ID stored in the request context.
     """
-    return getattr(_user, 'id', None)
+    return getattr(get_current_user_instance(), "id", None)
 
 
 def get_current_user_branch():
     """
-    Returns the current user's branch object stored in thread-local storage.
+    Returns the current user's branch object stored in the request context.
     """
-    return getattr(_user, 'branch', None)
+    return getattr(get_current_user_instance(), "branch", None)
 
 
 def get_current_user_branch_id():
     """
-    Returns the current user's branch ID stored in thread-local storage.
+    Returns the current user's branch ID stored in the request context.
     """
-    return getattr(_user, 'branch_id', None)
+    return getattr(get_current_user_instance(), "branch_id", None)
+
+
+class CurrentUserMiddleware:
+    """
+    Binds request.user for the duration of the request (sync and async).
+    request.user stays lazy here; DRF views rebind it after token authentication.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = set_current_user(getattr(request, "user", None))
+        try:
+            return self.get_response(request)
+        finally:
+            reset_current_user(token)
+
+    async def __acall__(self, request):
+        token = set_current_user(getattr(request, "user", None))
+        try:
+            return await self.get_response(request)
+        finally:
+            reset_current_user(token)
@@ -1,3 +1,15 @@
-from django.shortcuts import render
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from core.utils.userCapabilities import get_user_capabilities
+
+
+class UserCapabilitiesView(APIView):
+    """
+    Branch, groups and permissions of the caller in one round trip (cached per user).
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        return Response(get_user_capabilities(request.user))
@@ -3,6 +3,11 @@ ASGI config for logidesk project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Run with e.g. ``uvicorn logidesk.asgi:application --workers 4``. The async
+list endpoints (``/api/*/async/...``) run on the event loop; DRF viewsets are
+served through sync_to_async, bounded by the ASGI_THREADS env var.
+Compare against WSGI with ``python -m benchmarks.loadtest``.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
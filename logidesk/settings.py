@@ -39,13 +39,14 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
-    "core.middleware.seed_middleware.InitialSeederMiddleware",   
     'django.middleware.security.SecurityMiddleware',
+    'core.utils.instrumentation.ServerTimingMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.utils.userSession.CurrentUserMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -68,18 +69,116 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'logidesk.wsgi.application'
+ASGI_APPLICATION = 'logidesk.asgi.application'
+
+# Initial data (main branch, superuser, currencies) is seeded after `migrate`
+# and by `manage.py seed_initial_data`. Test databases start empty: the test
+# runner turns this off; other runners (e.g. pytest) set APP_SEED_ON_MIGRATE=false.
+SEED_INITIAL_DATA_ON_MIGRATE = os.getenv("APP_SEED_ON_MIGRATE", "true").lower() == "true"
+TEST_RUNNER = "core.utils.testRunner.NoSeedTestRunner"
 
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
+# DJANGO_DB_ENGINE=sqlite (default) or postgres.
+
+DB_ENGINE = os.getenv("DJANGO_DB_ENGINE", "sqlite").lower()
+DB_CONN_MAX_AGE = int(os.getenv("DJANGO_DB_CONN_MAX_AGE", "60"))
+
+if DB_ENGINE == "postgres":
+    # DJANGO_DB_POOL=true uses psycopg's connection pool (psycopg[pool]); Django
+    # requires CONN_MAX_AGE=0 with it since the pool owns connection reuse.
+    DB_POOL = os.getenv("DJANGO_DB_POOL", "false").lower() == "true"
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.getenv("DJANGO_DB_NAME", "logidesk"),
+            'USER': os.getenv("DJANGO_DB_USER", "logidesk"),
+            'PASSWORD': os.getenv("DJANGO_DB_PASSWORD", ""),
+            'HOST': os.getenv("DJANGO_DB_HOST", "localhost"),
+            'PORT': os.getenv("DJANGO_DB_PORT", "5432"),
+            'CONN_MAX_AGE': 0 if DB_POOL else DB_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'pool': {
+                    'min_size': int(os.getenv("DJANGO_DB_POOL_MIN", "2")),
+                    'max_size': int(os.getenv("DJANGO_DB_POOL_MAX", "10")),
+                    'timeout': int(os.getenv("DJANGO_DB_POOL_TIMEOUT", "10")),
+                },
+            } if DB_POOL else {},
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.getenv("DJANGO_DB_NAME", str(BASE_DIR / 'db.sqlite3')),
+            'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                # Take the write lock at BEGIN so concurrent writers queue on
+                # busy_timeout instead of failing on lock upgrade.
+                'transaction_mode': 'IMMEDIATE',
+            },
+        }
+    }
+
+# Applied per connection by core.utils.dbTuning.configure_sqlite_connection.
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(128 * 1024 * 1024))),
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+}
+
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# Cache
+# Locmem by default; set DJANGO_CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+# and DJANGO_CACHE_LOCATION=redis://host:6379/0 to share versions across workers.
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("DJANGO_CACHE_LOCATION", "logidesk"),
+        "KEY_PREFIX": os.getenv("DJANGO_CACHE_KEY_PREFIX", "logidesk"),
     }
 }
 
+RESPONSE_CACHE_ALIAS = os.getenv("DJANGO_RESPONSE_CACHE_ALIAS", "default")
+RESPONSE_CACHE_TIMEOUT = int(os.getenv("DJANGO_RESPONSE_CACHE_TIMEOUT", "600"))
+
+
+# Instrumentation (see core.utils.instrumentation)
+# Server-Timing headers and /metrics aggregates; off unless enabled.
+INSTRUMENTATION_ENABLED = os.getenv("DJANGO_INSTRUMENTATION", "false").lower() == "true"
+# /metrics is served to staff users and to scrapers sending `Authorization: Bearer <METRICS_TOKEN>`.
+METRICS_TOKEN = os.getenv("DJANGO_METRICS_TOKEN", "")
+# Staff requests sending `X-Profile-Token: <PROFILING_TOKEN>` are cProfiled (at this rate).
+PROFILING_TOKEN = os.getenv("DJANGO_PROFILING_TOKEN", "")
+PROFILING_SAMPLE_RATE = float(os.getenv("DJANGO_PROFILING_SAMPLE_RATE", "1.0"))
+PROFILING_DIR = os.getenv("DJANGO_PROFILING_DIR", str(BASE_DIR / "profiles"))
+
+
+# History retention (see `manage.py prune_history`)
+# Days kept per historical table; None keeps forever. Per-model overrides are
+# keyed by model label, e.g. {"warehouse.handlingunit": 90}.
+HISTORY_RETENTION_DEFAULT_DAYS = (
+    int(os.environ["HISTORY_RETENTION_DAYS"]) if os.getenv("HISTORY_RETENTION_DAYS") else None
+)
+HISTORY_RETENTION_DAYS = {}
+HISTORY_ARCHIVE_DIR = os.getenv("HISTORY_ARCHIVE_DIR", str(BASE_DIR / "history_archive"))
+
+# ?since= change feed (core.utils.changeFeed): tombstones older than this are
+# pruned by prune_history, and cursors older than this must resync.
+CHANGE_FEED_RETENTION_DAYS = int(os.getenv("CHANGE_FEED_RETENTION_DAYS", "30"))
+# Changes younger than this are held back so slow writer transactions cannot be skipped.
+CHANGE_FEED_SETTLE_SECONDS = int(os.getenv("CHANGE_FEED_SETTLE_SECONDS", "30"))
+
+# Rows fetched per round trip by the streaming /export/ action (core.utils.exportStream).
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "2000"))
+
+# Seconds an AR/AP aging report stays cached per as-of date (core.utils.aging); edits invalidate it sooner.
+AGING_CACHE_TIMEOUT = int(os.getenv("AGING_CACHE_TIMEOUT", "600"))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -123,7 +222,7 @@ MEDIA_ROOT = BASE_DIR / "media"
 # Django REST Framework
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        os.getenv("DJANGO_JWT_AUTHENTICATION", "core.utils.jwtClaims.ClaimsJWTAuthentication"),
     ),
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.AllowAny",
@@ -146,8 +245,21 @@ SIMPLE_JWT = {
     "ROTATE_REFRESH_TOKENS": True,
     "BLACKLIST_AFTER_ROTATION": True,
     "UPDATE_LAST_LOGIN": True,
+    "TOKEN_OBTAIN_SERIALIZER": "core.utils.jwtClaims.ClaimsTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "core.utils.jwtClaims.ClaimsTokenRefreshSerializer",
 }
 
+# Claims fast path (see core.utils.jwtClaims). Set DJANGO_JWT_AUTHENTICATION to
+# rest_framework_simplejwt.authentication.JWTAuthentication to load the user per request.
+JWT_CLAIMS_CACHE_ALIAS = os.getenv("JWT_CLAIMS_CACHE_ALIAS", "default")
+JWT_CLAIMS_REVALIDATE_SECONDS = int(os.getenv("JWT_CLAIMS_REVALIDATE_SECONDS", "60"))
+JWT_FULL_USER_PATH_PREFIXES = ("/auth/", "/admin/")
+
+# Permission checks read the per-user capabilities cache (core.utils.userCapabilities).
+AUTHENTICATION_BACKENDS = ["core.utils.userCapabilities.CachedModelBackend"]
+USER_CAPABILITIES_CACHE_ALIAS = os.getenv("USER_CAPABILITIES_CACHE_ALIAS", "default")
+USER_CAPABILITIES_TIMEOUT = int(os.getenv("USER_CAPABILITIES_TIMEOUT", "300"))
+
 
 # Djoser
 DJOSER = {
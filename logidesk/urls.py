@@ -3,13 +3,17 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
 
+from core.utils.instrumentation import metrics_view
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path("api/accounting/",include('accounting.urls')),
      path("api/actors/",include('actors.urls')),
     path("api/master/", include("master.urls")),
+    path("api/core/", include("core.urls")),
     path("auth/", include("djoser.urls")),
     path("auth/", include("djoser.urls.jwt")),
+    path("metrics", metrics_view, name="metrics"),
 ]
 
 
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class MasterConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'master'
+
+    def ready(self):
+        from master.signals import register_master_cache_signals
+
+        register_master_cache_signals()
@@ -4,6 +4,7 @@ from master.models import (
     ApplicationSettings,
     Branch,
     Currency,
+    ExchangeRate,
     MasterData,
     Ports,
     ShipmentPrefixes,
@@ -129,3 +130,12 @@ class CurrencyFilter(django_filters.FilterSet):
     class Meta:
         model = Currency
         fields = ["active", "is_base", "code", "q"]
+
+
+class ExchangeRateFilter(django_filters.FilterSet):
+    effective_from = django_filters.DateFilter(field_name="effective_date", lookup_expr="gte")
+    effective_to = django_filters.DateFilter(field_name="effective_date", lookup_expr="lte")
+
+    class Meta:
+        model = ExchangeRate
+        fields = ["currency", "effective_from", "effective_to"]
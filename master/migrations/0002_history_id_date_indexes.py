@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('master', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='historicalbranch',
+            index=models.Index(fields=['id', 'history_date'], name='master_hist_id_bd8508_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalmasterdata',
+            index=models.Index(fields=['id', 'history_date'], name='master_hist_id_e8fbd9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalports',
+            index=models.Index(fields=['id', 'history_date'], name='master_hist_id_b4da7b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalunitofmeasurement',
+            index=models.Index(fields=['id', 'history_date'], name='master_hist_id_65a389_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='historicalunitofmeasurementlength',
+            index=models.Index(fields=['id', 'history_date'], name='master_hist_id_aa3718_idx'),
+        ),
+    ]
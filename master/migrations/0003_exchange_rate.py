@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:20
+
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('master', '0002_history_id_date_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExchangeRate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('effective_date', models.DateField()),
+                ('rate_to_base', models.DecimalField(decimal_places=6, max_digits=18, validators=[django.core.validators.MinValueValidator(0)])),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+                ('currency', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='exchange_rates', to='master.currency')),
+                ('user_add', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='settings_exchangerate_user_add', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['currency_id', '-effective_date'],
+                'constraints': [models.UniqueConstraint(fields=('currency', 'effective_date'), name='unique_exchange_rate_per_day')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('master', '0003_exchange_rate'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ports',
+            index=models.Index(fields=['symbol'], name='master_port_symbol_69731a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ports',
+            index=models.Index(fields=['edi'], name='master_port_edi_236390_idx'),
+        ),
+    ]
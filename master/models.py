@@ -7,7 +7,7 @@ from django.db.models import Q
 from django.db import models
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from simple_history.models import HistoricalRecords
+from core.utils.historyPolicy import PolicyHistoricalRecords
 import uuid
 import re
 
@@ -24,7 +24,7 @@ class UnitofMeasurement(models.Model):
     created = models.DateTimeField(auto_now_add=True, verbose_name='Created At')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='Updated At')
     add_by = models.ForeignKey(settings.AUTH_USER_MODEL, blank=True, null=True, on_delete=models.PROTECT, related_name="un_add")
-    history = HistoricalRecords()
+    history = PolicyHistoricalRecords()
 
     class Meta:
         verbose_name = "Unit of Measurement"
@@ -50,7 +50,7 @@ class UnitofMeasurementLength(models.Model):
     created = models.DateTimeField(auto_now_add=True, verbose_name='Created At')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='Updated At')
     added_by = models.ForeignKey(settings.AUTH_USER_MODEL, blank=True, null=True, on_delete=models.PROTECT, related_name="unl_add")
-    history = HistoricalRecords()
+    history = PolicyHistoricalRecords()
 
     class Meta:
         verbose_name = "Unit of Measurement (Length)"
@@ -85,11 +85,17 @@ class Ports(models.Model):
     created = models.DateTimeField(auto_now_add=True, verbose_name='Created At')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='Updated At')
     added_by = models.ForeignKey(settings.AUTH_USER_MODEL, blank=True, null=True, on_delete=models.PROTECT)
-    history = HistoricalRecords()
+    history = PolicyHistoricalRecords()
 
     class Meta:
         verbose_name = "Ports"
-        indexes = [models.Index(fields=["name"]), models.Index(fields=["iso"]), models.Index(fields=["iata"])]
+        indexes = [
+            models.Index(fields=["name"]),
+            models.Index(fields=["iso"]),
+            models.Index(fields=["iata"]),
+            models.Index(fields=["symbol"]),
+            models.Index(fields=["edi"]),
+        ]
 
     def __str__(self):
         return self.name
@@ -159,7 +165,7 @@ class Branch(models.Model):
     added_by = models.ForeignKey(settings.AUTH_USER_MODEL, blank=True, null=True, on_delete=models.PROTECT, related_name="user_branch_association")
     created = models.DateTimeField(auto_now_add=True, verbose_name='Created At')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='Updated At')
-    history = HistoricalRecords()
+    history = PolicyHistoricalRecords()
 
     def __str__(self):
         return f"{self.name} ({self.branch_id})"
@@ -195,7 +201,7 @@ class MasterData(models.Model):
     name = models.CharField(max_length=100)
     description = models.TextField(blank=True, null=True)
     active = models.BooleanField(default=True)
-    history = HistoricalRecords()
+    history = PolicyHistoricalRecords()
 
     class Meta:
         indexes = [models.Index(fields=["type_master", "name"])]
@@ -316,3 +322,40 @@ class Currency(models.Model):
         return f"{self.code} ({self.symbol})" if self.symbol else self.code
 
 
+# ---------------------------
+# Dated exchange rates
+# ---------------------------
+class ExchangeRate(models.Model):
+    """
+    Rate to the base currency from `effective_date` until the next dated rate.
+    Conversions go through master.rates; Currency.rate_to_base applies before a
+    currency's first dated rate.
+    """
+    currency = models.ForeignKey(Currency, on_delete=models.CASCADE, related_name="exchange_rates")
+    effective_date = models.DateField()
+    rate_to_base = models.DecimalField(max_digits=18, decimal_places=6, validators=[MinValueValidator(0)])
+
+    user_add = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="settings_exchangerate_user_add",
+    )
+
+    created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["currency_id", "-effective_date"]
+        constraints = [
+            models.UniqueConstraint(fields=["currency", "effective_date"], name="unique_exchange_rate_per_day"),
+        ]
+
+    def __str__(self):
+        return f"{self.currency_id} {self.effective_date}: {self.rate_to_base}"
+
+    def clean(self):
+        if self.rate_to_base is not None and self.rate_to_base <= 0:
+            raise ValidationError({"rate_to_base": "Rate must be greater than 0."})
@@ -0,0 +1,142 @@
+"""
+In-memory port lookup.
+
+Active ports are loaded once per process into a PortIndex and rebuilt when
+the Ports version counter moves (bumped when a save or delete commits, by master.signals).
+Lookups then make no query:
+
+- resolve() / resolve_many() map a code (UN-LOCODE symbol, IATA, EDI or ISO)
+  to one port, so imports can check thousands of codes at once;
+- autocomplete() ranks exact code matches first, then codes, names and city
+  words starting with the query (a prefix trie walked in sorted order), then
+  names and cities merely containing it.
+"""
+
+from __future__ import annotations
+
+import re
+
+from core.utils.versionedCache import ProcessLocalValue
+from master.models import Ports
+
+# Code columns, strongest first: when two ports share a code, the earlier column wins.
+CODE_FIELDS = ("symbol", "iata", "edi", "iso")
+PORT_FIELDS = ("id", "name", "symbol", "iata", "edi", "iso", "city", "country", "is_land", "is_air", "is_sea")
+MODES = {"land": "is_land", "air": "is_air", "sea": "is_sea"}
+
+RANK_EXACT, RANK_PREFIX, RANK_SUBSTRING = 0, 1, 2
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize(value) -> str:
+    return "".join((value or "").split()).upper()
+
+
+class _Node:
+    __slots__ = ("children", "ids")
+
+    def __init__(self):
+        self.children = {}
+        self.ids = []
+
+
+class PortIndex:
+    def __init__(self, rows):
+        self.ports = {}  # id -> port dict
+        self.codes = {}  # normalized code -> port ids, by CODE_FIELDS order then name
+        self.root = _Node()
+        self._haystack = []  # (id, normalized name, normalized city) for substring matches
+
+        rows = sorted(rows, key=lambda r: (r["name"] or "", str(r["id"])))
+        for row in rows:
+            self.ports[row["id"]] = row
+            for token in self._tokens(row):
+                self._insert(token, row["id"])
+            self._haystack.append((row["id"], normalize(row["name"]), normalize(row["city"])))
+        for code_field in CODE_FIELDS:
+            for row in rows:
+                code = normalize(row[code_field])
+                if code and row["id"] not in self.codes.get(code, ()):
+                    self.codes.setdefault(code, []).append(row["id"])
+
+    @staticmethod
+    def _tokens(row) -> set:
+        tokens = {normalize(row[f]) for f in CODE_FIELDS}
+        tokens.update(word.upper() for f in ("name", "city") for word in _WORD_RE.findall(row[f] or ""))
+        tokens.add(normalize(row["name"]))
+        return tokens - {""}
+
+    def _insert(self, token, port_id):
+        node = self.root
+        for char in token:
+            node = node.children.setdefault(char, _Node())
+        node.ids.append(port_id)
+
+    def _prefixed(self, prefix):
+        """
+        Port ids with a token starting with `prefix`, shortest and then alphabetical tokens first.
+        """
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return
+        level = [node]
+        while level:
+            for current in level:
+                yield from current.ids
+            level = [current.children[char] for current in level for char in sorted(current.children)]
+
+    def __len__(self):
+        return len(self.ports)
+
+    def resolve(self, code) -> dict | None:
+        port_ids = self.codes.get(normalize(code))
+        return self.ports[port_ids[0]] if port_ids else None
+
+    def resolve_many(self, codes) -> dict:
+        """
+        {code: port or None} for every distinct code given.
+        """
+        return {code: self.resolve(code) for code in dict.fromkeys(codes)}
+
+    def autocomplete(self, query, *, limit=10, mode=None) -> list[dict]:
+        query = normalize(query)
+        if not query:
+            return []
+        mode_field = MODES.get(mode)
+
+        results, seen = [], set()
+
+        def add(port_id, rank):
+            if port_id in seen:
+                return False
+            port = self.ports[port_id]
+            if mode_field and not port[mode_field]:
+                return False
+            seen.add(port_id)
+            results.append({**port, "rank": rank})
+            return len(results) >= limit
+
+        for port_id in self.codes.get(query, ()):
+            if add(port_id, RANK_EXACT):
+                return results
+        for port_id in self._prefixed(query):
+            if add(port_id, RANK_PREFIX):
+                return results
+        for port_id, name, city in self._haystack:
+            if (query in name or query in city) and add(port_id, RANK_SUBSTRING):
+                return results
+        return results
+
+
+def _load_index() -> PortIndex:
+    return PortIndex(Ports.objects.filter(active=True).order_by().values(*PORT_FIELDS))
+
+
+_INDEX = ProcessLocalValue(_load_index, Ports)
+
+
+def get_port_index() -> PortIndex:
+    return _INDEX.get()
@@ -0,0 +1,133 @@
+"""
+Currency conversion.
+
+Rates to the base currency are dated (master.ExchangeRate): a rate applies
+from its effective_date until the next one, and Currency.rate_to_base covers
+dates before a currency's first dated rate. The base currency is always 1.
+
+Every rate is held in a process-local table, loaded with two queries and
+rebuilt when the Currency or ExchangeRate version counter moves (bumped on
+commit of a save or delete, by master.signals). A conversion is then a bisect over
+in-memory dates, so repricing a shipment's charge lines or a report's rows
+costs no query per line.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.utils import timezone
+
+from core.utils.versionedCache import ProcessLocalValue
+from master.models import Currency, ExchangeRate
+
+ONE = Decimal("1")
+RATE_PLACES = Decimal("0.000001")  # ExchangeRate/ShipmentLineBase.exchange_rate precision
+
+
+@dataclass
+class RateTable:
+    base_id: object = None
+    ids_by_code: dict = field(default_factory=dict)
+    decimal_places: dict = field(default_factory=dict)
+    fallback: dict = field(default_factory=dict)  # currency id -> Currency.rate_to_base
+    dates: dict = field(default_factory=dict)  # currency id -> [effective_date, ...] ascending
+    rates: dict = field(default_factory=dict)  # currency id -> [rate_to_base, ...] aligned with dates
+
+    def currency_id(self, currency):
+        """
+        Id of `currency`, given as an instance, a pk or an ISO code.
+        """
+        if isinstance(currency, Currency):
+            return currency.pk
+        if isinstance(currency, str) and not currency.isdigit():
+            try:
+                return self.ids_by_code[currency.upper()]
+            except KeyError:
+                raise LookupError(f"Unknown currency: {currency}.")
+        return Currency._meta.pk.to_python(currency)
+
+    def rate_to_base(self, currency, on_date: date) -> Decimal:
+        currency_id = self.currency_id(currency)
+        if currency_id == self.base_id:
+            return ONE
+        if currency_id not in self.fallback:
+            raise LookupError(f"Unknown currency: {currency}.")
+        dates = self.dates.get(currency_id)
+        if dates:
+            index = bisect_right(dates, on_date)
+            if index:
+                return self.rates[currency_id][index - 1]
+        return self.fallback[currency_id]
+
+
+def _load_table() -> RateTable:
+    table = RateTable()
+    for pk, code, is_base, rate, places in Currency.objects.values_list(
+        "pk", "code", "is_base", "rate_to_base", "decimal_places"
+    ):
+        table.ids_by_code[code.upper()] = pk
+        table.decimal_places[pk] = places
+        table.fallback[pk] = rate
+        if is_base:
+            table.base_id = pk
+    for currency_id, effective_date, rate in ExchangeRate.objects.values_list(
+        "currency_id", "effective_date", "rate_to_base"
+    ).order_by("currency_id", "effective_date"):
+        table.dates.setdefault(currency_id, []).append(effective_date)
+        table.rates.setdefault(currency_id, []).append(rate)
+    return table
+
+
+_TABLE = ProcessLocalValue(_load_table, Currency, ExchangeRate)
+
+
+def get_rate_table() -> RateTable:
+    return _TABLE.get()
+
+
+def _ratio(table: RateTable, from_currency, to_currency, on_date) -> Decimal:
+    to_rate = table.rate_to_base(to_currency, on_date) if to_currency is not None else ONE
+    if not to_rate:
+        raise LookupError(f"No rate for {to_currency} on {on_date}.")
+    return table.rate_to_base(from_currency, on_date) / to_rate
+
+
+def exchange_rate(from_currency, to_currency=None, on_date: date | None = None) -> Decimal:
+    """
+    Units of `to_currency` (default: base) per unit of `from_currency` on `on_date` (default: today).
+    """
+    table = get_rate_table()
+    return _ratio(table, from_currency, to_currency, on_date or timezone.localdate()).quantize(RATE_PLACES)
+
+
+def convert(amount, from_currency, to_currency=None, on_date: date | None = None) -> Decimal:
+    return convert_many([amount], [from_currency], [on_date], to_currency=to_currency)[0]
+
+
+def convert_many(amounts, currencies, dates, to_currency=None) -> list[Decimal]:
+    """
+    Converts each amount from its currency on its date (None: today) into
+    `to_currency` (default: base), rounded to that currency's decimal places.
+    Reads the rate table once for the batch.
+    """
+    amounts, currencies, dates = list(amounts), list(currencies), list(dates)
+    if not len(amounts) == len(currencies) == len(dates):
+        raise ValueError("amounts, currencies and dates must be the same length.")
+
+    table = get_rate_table()
+    target_id = table.currency_id(to_currency) if to_currency is not None else table.base_id
+    places = Decimal(1).scaleb(-table.decimal_places.get(target_id, 2))
+    today = timezone.localdate()
+
+    ratios = {}
+    converted = []
+    for amount, currency, on_date in zip(amounts, currencies, dates):
+        key = (table.currency_id(currency), on_date or today)
+        if key not in ratios:
+            ratios[key] = _ratio(table, key[0], target_id, key[1])
+        converted.append((Decimal(amount or 0) * ratios[key]).quantize(places, rounding=ROUND_HALF_UP))
+    return converted
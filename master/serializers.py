@@ -3,6 +3,7 @@ from master.models import (
     ApplicationSettings,
     Branch,
     Currency,
+    ExchangeRate,
     MasterData,
     Ports,
     ShipmentPrefixes,
@@ -57,3 +58,9 @@ class CurrencySerializer(BulkModelSerializer):
     class Meta:
         model = Currency
         fields = "__all__"
+
+
+class ExchangeRateSerializer(BulkModelSerializer):
+    class Meta:
+        model = ExchangeRate
+        fields = "__all__"
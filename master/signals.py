@@ -0,0 +1,34 @@
+from django.db.models.signals import post_save, post_delete
+
+from core.utils.versionedCache import bump_model_version_on_commit
+from master.models import (
+    ApplicationSettings,
+    Currency,
+    ExchangeRate,
+    MasterData,
+    Ports,
+    ShipmentPrefixes,
+    UnitofMeasurement,
+    UnitofMeasurementLength,
+)
+
+
+CACHED_MASTER_MODELS = [
+    Currency,
+    ExchangeRate,
+    UnitofMeasurement,
+    UnitofMeasurementLength,
+    Ports,
+    MasterData,
+    ShipmentPrefixes,
+    ApplicationSettings,
+]
+
+
+def register_master_cache_signals():
+    def _bump_version(sender, using=None, **kwargs):
+        bump_model_version_on_commit(sender, using=using)
+
+    for model in CACHED_MASTER_MODELS:
+        post_save.connect(_bump_version, sender=model, dispatch_uid=f"mastercache_postsave_{model.__name__}")
+        post_delete.connect(_bump_version, sender=model, dispatch_uid=f"mastercache_postdelete_{model.__name__}")
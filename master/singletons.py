@@ -0,0 +1,59 @@
+"""
+In-process access to the singleton settings rows.
+
+ApplicationSettings and ShipmentPrefixes are read wherever a document number
+or a company header is produced. Each is loaded once per process and held
+until its version counter moves (bumped when a save or delete commits, by master.signals),
+so other workers pick up an edit on their next read without querying for it
+in between. Until a row exists the model's field defaults are returned.
+
+The returned instances are shared: read them, never modify or save them.
+"""
+
+from __future__ import annotations
+
+from core.utils.versionedCache import ProcessLocalValue
+from master.models import ApplicationSettings, ShipmentPrefixes
+
+
+def _loader(model):
+    return lambda: model.objects.order_by().first() or model()
+
+
+_APPLICATION_SETTINGS = ProcessLocalValue(_loader(ApplicationSettings), ApplicationSettings)
+_SHIPMENT_PREFIXES = ProcessLocalValue(_loader(ShipmentPrefixes), ShipmentPrefixes)
+
+
+def get_application_settings() -> ApplicationSettings:
+    return _APPLICATION_SETTINGS.get()
+
+
+def get_shipment_prefixes() -> ShipmentPrefixes:
+    return _SHIPMENT_PREFIXES.get()
+
+
+def document_prefix(field_name: str, default: str | None = None) -> str:
+    """
+    Configured prefix for a document type, e.g. document_prefix("sales_prefix").
+    Until a row sets it, `default`, else the field default.
+    """
+    prefixes = get_shipment_prefixes()
+    value = "" if prefixes._state.adding else getattr(prefixes, field_name)
+    return value or default or ShipmentPrefixes._meta.get_field(field_name).default
+
+
+def company_header() -> dict:
+    """
+    Company details printed at the top of documents and reports.
+    """
+    settings = get_application_settings()
+    return {
+        "name": settings.name,
+        "address": settings.address,
+        "state": settings.state,
+        "country": settings.country,
+        "phone": settings.phone,
+        "email": settings.email,
+        "pan": settings.PAN,
+        "logo": settings.logo.name or None,
+    }
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from master.models import Currency, ExchangeRate
+from master.rates import convert, convert_many, exchange_rate
+
+
+class ExchangeRateTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.npr = Currency.objects.create(code="NPR", name="Rupee", is_base=True)
+        self.usd = Currency.objects.create(code="USD", name="US Dollar", rate_to_base=Decimal("130"))
+        self.eur = Currency.objects.create(code="EUR", name="Euro", rate_to_base=Decimal("140"))
+        ExchangeRate.objects.create(currency=self.usd, effective_date=date(2024, 1, 1), rate_to_base=Decimal("133"))
+        ExchangeRate.objects.create(currency=self.usd, effective_date=date(2024, 6, 1), rate_to_base=Decimal("134"))
+
+    def test_dated_rate_applies_until_the_next_one(self):
+        self.assertEqual(exchange_rate(self.usd, on_date=date(2023, 12, 31)), Decimal("130"))
+        self.assertEqual(exchange_rate("usd", on_date=date(2024, 1, 1)), Decimal("133"))
+        self.assertEqual(exchange_rate(self.usd.pk, on_date=date(2024, 5, 31)), Decimal("133"))
+        self.assertEqual(exchange_rate(self.usd, on_date=date(2025, 1, 1)), Decimal("134"))
+        self.assertEqual(exchange_rate(self.npr, on_date=date(2025, 1, 1)), Decimal("1"))
+        self.assertEqual(exchange_rate(self.usd, self.eur, on_date=date(2025, 1, 1)), Decimal("0.957143"))
+
+    def test_convert_many_reads_the_table_once(self):
+        exchange_rate(self.usd)  # load
+
+        with self.assertNumQueries(0):
+            converted = convert_many(
+                [Decimal("10"), Decimal("10"), Decimal("10"), Decimal("1.005")],
+                [self.usd, self.usd, "EUR", self.npr],
+                [date(2023, 1, 1), date(2024, 7, 1), None, None],
+            )
+
+        self.assertEqual(converted, [Decimal("1300.00"), Decimal("1340.00"), Decimal("1400.00"), Decimal("1.01")])
+
+    def test_writes_reload_the_table(self):
+        self.assertEqual(convert(1, self.usd, on_date=date(2024, 7, 1)), Decimal("134.00"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ExchangeRate.objects.create(currency=self.usd, effective_date=date(2024, 7, 1), rate_to_base=Decimal("135"))
+
+        self.assertEqual(convert(1, self.usd, on_date=date(2024, 7, 1)), Decimal("135.00"))
+
+    def test_unknown_currency(self):
+        with self.assertRaises(LookupError):
+            convert(1, "XXX")
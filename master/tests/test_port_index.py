@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from master.models import Ports
+from master.ports import RANK_EXACT, RANK_PREFIX, RANK_SUBSTRING, get_port_index
+
+
+class PortIndexTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.ktm = Ports.objects.create(name="Tribhuvan International", symbol="NPKTM", iata="KTM", city="Kathmandu", is_sea=False)
+        self.kolkata = Ports.objects.create(name="Kolkata", symbol="INCCU", iata="CCU", edi="KTMX", city="Kolkata")
+        self.birgunj = Ports.objects.create(name="Birgunj ICD", symbol="NPBIR", city="Birgunj", is_air=False)
+        Ports.objects.create(name="Closed Port", symbol="NPCLO", active=False)
+        self.user = get_user_model().objects.create_user(username="ports", email="ports@example.com", password="x")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_autocomplete_ranks_exact_then_prefix_then_substring(self):
+        get_port_index()  # load
+
+        with self.assertNumQueries(0):
+            results = get_port_index().autocomplete("ktm")
+
+        self.assertEqual([(r["symbol"], r["rank"]) for r in results], [("NPKTM", RANK_EXACT), ("INCCU", RANK_PREFIX)])
+        kat = get_port_index().autocomplete("kat")
+        self.assertEqual([(r["symbol"], r["rank"]) for r in kat], [("NPKTM", RANK_PREFIX), ("INCCU", RANK_SUBSTRING)])
+        substring = get_port_index().autocomplete("gunj")
+        self.assertEqual([(r["symbol"], r["rank"]) for r in substring], [("NPBIR", RANK_SUBSTRING)])
+        self.assertEqual(get_port_index().autocomplete("birgunj", mode="air"), [])
+        self.assertEqual(get_port_index().autocomplete("closed"), [])
+
+    def test_resolve_prefers_the_strongest_code_column(self):
+        index = get_port_index()
+        self.assertEqual(index.resolve("ktm")["id"], self.ktm.pk)
+        self.assertEqual(index.resolve("KTMX")["id"], self.kolkata.pk)
+        self.assertIsNone(index.resolve("NPCLO"))
+
+    def test_index_rebuilt_after_save(self):
+        self.assertIsNone(get_port_index().resolve("NPBRT"))
+        with self.captureOnCommitCallbacks(execute=True):
+            Ports.objects.create(name="Biratnagar", symbol="NPBRT", iata="BIR")
+        self.assertEqual(get_port_index().resolve("BIR")["symbol"], "NPBRT")
+
+    def test_endpoints(self):
+        response = self.client.get("/api/master/ports/autocomplete/", {"q": "KTM", "limit": 1})
+        self.assertEqual([r["symbol"] for r in response.data["results"]], ["NPKTM"])
+
+        response = self.client.post("/api/master/ports/resolve/", {"codes": ["KTM", "npbir", "XXXXX"]}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data["resolved"]), {"KTM", "npbir"})
+        self.assertEqual(response.data["unresolved"], ["XXXXX"])
+        self.assertEqual(self.client.post("/api/master/ports/resolve/", {"codes": "KTM"}, format="json").status_code, 400)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from core.utils.versionedCache import get_model_version
+from master.models import Currency
+
+
+class MasterResponseCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username="cache", email="cache@example.com", password="x")
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        Currency.objects.create(code="USD", name="US Dollar")
+
+    def test_version_bumped_on_save_and_delete(self):
+        v1 = get_model_version(Currency)
+        with self.captureOnCommitCallbacks(execute=True):
+            cur = Currency.objects.create(code="EUR", name="Euro")
+            # Not before commit, or a reader could cache uncommitted rows under the new version.
+            self.assertEqual(get_model_version(Currency), v1)
+        v2 = get_model_version(Currency)
+        self.assertGreater(v2, v1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            cur.delete()
+        self.assertGreater(get_model_version(Currency), v2)
+
+    def test_etag_roundtrip_returns_304(self):
+        first = self.client.get("/api/master/currencies/")
+        self.assertEqual(first.status_code, 200)
+        etag = first["ETag"]
+
+        with self.assertNumQueries(0):
+            second = self.client.get("/api/master/currencies/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(second.status_code, 304)
+
+    def test_cached_list_invalidated_by_write(self):
+        first = self.client.get("/api/master/currencies/")
+        count = first.data["count"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Currency.objects.create(code="XAU", name="Gold")
+        second = self.client.get("/api/master/currencies/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.data["count"], count + 1)
+        self.assertNotEqual(second["ETag"], first["ETag"])
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from master.models import ApplicationSettings, ShipmentPrefixes
+from master.singletons import company_header, document_prefix, get_application_settings, get_shipment_prefixes
+
+
+class SingletonSettingsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_defaults_until_a_row_exists(self):
+        self.assertEqual(document_prefix("sales_prefix"), "SALE")
+        self.assertEqual(document_prefix("sales_prefix", default="INV"), "INV")
+        self.assertTrue(get_shipment_prefixes()._state.adding)
+        self.assertFalse(ShipmentPrefixes.objects.exists())
+
+    def test_loaded_once_and_reloaded_after_save(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            prefixes = ShipmentPrefixes.objects.create(sales_prefix="BILL")
+            ApplicationSettings.objects.create(name="Acme Logistics")
+        get_shipment_prefixes()
+        get_application_settings()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(document_prefix("sales_prefix", default="INV"), "BILL")
+            self.assertEqual(company_header()["name"], "Acme Logistics")
+
+        prefixes.sales_prefix = ""
+        with self.captureOnCommitCallbacks(execute=True):
+            prefixes.save()
+        self.assertEqual(document_prefix("sales_prefix"), "SALE")
+        self.assertEqual(document_prefix("sales_prefix", default="INV"), "INV")
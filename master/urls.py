@@ -4,10 +4,15 @@ from rest_framework_bulk.routes import BulkRouter
 from master.views import (
     ApplicationSettingsViewSet,
     BranchViewSet,
+    CurrencyAsyncListView,
     CurrencyViewSet,
+    ExchangeRateViewSet,
+    MasterDataAsyncListView,
     MasterDataViewSet,
+    PortsAsyncListView,
     PortsViewSet,
     ShipmentPrefixesViewSet,
+    UnitofMeasurementAsyncListView,
     UnitofMeasurementLengthViewSet,
     UnitofMeasurementViewSet,
 )
@@ -21,7 +26,12 @@ router.register(r"master-data", MasterDataViewSet, basename="master-data")
 router.register(r"application-settings", ApplicationSettingsViewSet, basename="application-settings")
 router.register(r"shipment-prefixes", ShipmentPrefixesViewSet, basename="shipment-prefixes")
 router.register(r"currencies", CurrencyViewSet, basename="currency")
+router.register(r"exchange-rates", ExchangeRateViewSet, basename="exchange-rate")
 
 urlpatterns = [
+    path("async/currencies/", CurrencyAsyncListView.as_view(), name="currency-async-list"),
+    path("async/ports/", PortsAsyncListView.as_view(), name="ports-async-list"),
+    path("async/master-data/", MasterDataAsyncListView.as_view(), name="master-data-async-list"),
+    path("async/units/", UnitofMeasurementAsyncListView.as_view(), name="unit-of-measurement-async-list"),
     path("", include(router.urls)),
 ]
@@ -1,12 +1,18 @@
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 from rest_framework_bulk.generics import BulkModelViewSet
 
+from core.utils.asyncViews import AsyncListView
+from core.utils.versionedCache import VersionedCacheMixin
 from master.filters import (
     ApplicationSettingsFilter,
     BranchFilter,
     CurrencyFilter,
+    ExchangeRateFilter,
     MasterDataFilter,
     PortsFilter,
     ShipmentPrefixesFilter,
@@ -17,16 +23,19 @@ from master.models import (
     ApplicationSettings,
     Branch,
     Currency,
+    ExchangeRate,
     MasterData,
     Ports,
     ShipmentPrefixes,
     UnitofMeasurement,
     UnitofMeasurementLength,
 )
+from master.ports import get_port_index
 from master.serializers import (
     ApplicationSettingsSerializer,
     BranchSerializer,
     CurrencySerializer,
+    ExchangeRateSerializer,
     MasterDataSerializer,
     PortsSerializer,
     ShipmentPrefixesSerializer,
@@ -40,7 +49,11 @@ class MasterBaseViewSet(BulkModelViewSet):
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
 
 
-class UnitofMeasurementViewSet(MasterBaseViewSet):
+class CachedMasterViewSet(VersionedCacheMixin, MasterBaseViewSet):
+    pass
+
+
+class UnitofMeasurementViewSet(CachedMasterViewSet):
     queryset = UnitofMeasurement.objects.all()
     serializer_class = UnitofMeasurementSerializer
     filterset_class = UnitofMeasurementFilter
@@ -48,7 +61,7 @@ class UnitofMeasurementViewSet(MasterBaseViewSet):
     ordering_fields = ["name", "symbol", "created", "updated_at"]
 
 
-class UnitofMeasurementLengthViewSet(MasterBaseViewSet):
+class UnitofMeasurementLengthViewSet(CachedMasterViewSet):
     queryset = UnitofMeasurementLength.objects.all()
     serializer_class = UnitofMeasurementLengthSerializer
     filterset_class = UnitofMeasurementLengthFilter
@@ -56,12 +69,46 @@ class UnitofMeasurementLengthViewSet(MasterBaseViewSet):
     ordering_fields = ["name", "symbol", "created", "updated_at"]
 
 
-class PortsViewSet(MasterBaseViewSet):
+class PortsViewSet(CachedMasterViewSet):
     queryset = Ports.objects.select_related("nearest_branch", "added_by").all()
     serializer_class = PortsSerializer
     filterset_class = PortsFilter
     search_fields = ["name", "symbol", "iso", "iata", "edi", "city", "country", "region"]
     ordering_fields = ["name", "symbol", "country", "city", "created", "updated_at"]
+    max_autocomplete = 50
+    max_resolve = 10000
+
+    @action(detail=False, methods=["get"], url_path="autocomplete")
+    def autocomplete(self, request):
+        """
+        GET ?q=<code or name>&mode=air|sea|land&limit=10
+        Active ports from the in-memory index: exact code, then prefix, then substring matches.
+        """
+        try:
+            limit = max(1, min(int(request.query_params.get("limit", 10)), self.max_autocomplete))
+        except ValueError:
+            raise ValidationError({"limit": "Must be an integer."})
+        results = get_port_index().autocomplete(
+            request.query_params.get("q", ""), limit=limit, mode=request.query_params.get("mode")
+        )
+        return Response({"results": results})
+
+    @action(detail=False, methods=["post"], url_path="resolve")
+    def resolve(self, request):
+        """
+        POST {"codes": ["NPKTM", "KTM", ...]}
+        The port for each code and the codes that match no active port.
+        """
+        codes = request.data.get("codes") if isinstance(request.data, dict) else None
+        if not isinstance(codes, list) or not all(isinstance(code, str) for code in codes):
+            raise ValidationError({"codes": "Expected a list of codes."})
+        if len(codes) > self.max_resolve:
+            raise ValidationError({"codes": f"At most {self.max_resolve} codes per request."})
+        resolved = get_port_index().resolve_many(codes)
+        return Response({
+            "resolved": {code: port for code, port in resolved.items() if port is not None},
+            "unresolved": [code for code, port in resolved.items() if port is None],
+        })
 
 
 class BranchViewSet(MasterBaseViewSet):
@@ -72,7 +119,7 @@ class BranchViewSet(MasterBaseViewSet):
     ordering_fields = ["name", "branch_id", "city", "country", "status", "created", "updated_at"]
 
 
-class MasterDataViewSet(MasterBaseViewSet):
+class MasterDataViewSet(CachedMasterViewSet):
     queryset = MasterData.objects.all()
     serializer_class = MasterDataSerializer
     filterset_class = MasterDataFilter
@@ -80,7 +127,7 @@ class MasterDataViewSet(MasterBaseViewSet):
     ordering_fields = ["type_master", "name"]
 
 
-class ApplicationSettingsViewSet(MasterBaseViewSet):
+class ApplicationSettingsViewSet(CachedMasterViewSet):
     queryset = ApplicationSettings.objects.all()
     serializer_class = ApplicationSettingsSerializer
     filterset_class = ApplicationSettingsFilter
@@ -88,7 +135,7 @@ class ApplicationSettingsViewSet(MasterBaseViewSet):
     ordering_fields = ["name", "country", "state"]
 
 
-class ShipmentPrefixesViewSet(MasterBaseViewSet):
+class ShipmentPrefixesViewSet(CachedMasterViewSet):
     queryset = ShipmentPrefixes.objects.all()
     serializer_class = ShipmentPrefixesSerializer
     filterset_class = ShipmentPrefixesFilter
@@ -103,9 +150,53 @@ class ShipmentPrefixesViewSet(MasterBaseViewSet):
     ordering_fields = ["shipment_prefix", "sales_prefix", "master_job_prefix", "booking_prefix"]
 
 
-class CurrencyViewSet(MasterBaseViewSet):
+class CurrencyViewSet(CachedMasterViewSet):
     queryset = Currency.objects.select_related("user_add").all()
     serializer_class = CurrencySerializer
     filterset_class = CurrencyFilter
     search_fields = ["name", "code", "symbol"]
     ordering_fields = ["name", "code", "rate_to_base", "created", "updated"]
+
+
+class ExchangeRateViewSet(CachedMasterViewSet):
+    queryset = ExchangeRate.objects.select_related("currency").all()
+    serializer_class = ExchangeRateSerializer
+    filterset_class = ExchangeRateFilter
+    search_fields = ["currency__code", "currency__name"]
+    ordering_fields = ["effective_date", "rate_to_base", "created", "updated"]
+
+
+class CurrencyAsyncListView(AsyncListView):
+    queryset = Currency.objects.all()
+    serializer_class = CurrencySerializer
+    filterset_class = CurrencyFilter
+    search_fields = ["name", "code", "symbol"]
+    ordering_fields = ["name", "code", "rate_to_base", "created", "updated"]
+    ordering = ["code"]
+
+
+class PortsAsyncListView(AsyncListView):
+    queryset = Ports.objects.all()
+    serializer_class = PortsSerializer
+    filterset_class = PortsFilter
+    search_fields = ["name", "symbol", "iso", "iata", "edi", "city", "country", "region"]
+    ordering_fields = ["name", "symbol", "country", "city", "created", "updated_at"]
+    ordering = ["name"]
+
+
+class MasterDataAsyncListView(AsyncListView):
+    queryset = MasterData.objects.all()
+    serializer_class = MasterDataSerializer
+    filterset_class = MasterDataFilter
+    search_fields = ["type_master", "name", "description"]
+    ordering_fields = ["type_master", "name"]
+    ordering = ["type_master", "name"]
+
+
+class UnitofMeasurementAsyncListView(AsyncListView):
+    queryset = UnitofMeasurement.objects.all()
+    serializer_class = UnitofMeasurementSerializer
+    filterset_class = UnitofMeasurementFilter
+    search_fields = ["name", "symbol"]
+    ordering_fields = ["name", "symbol", "created", "updated_at"]
+    ordering = ["name"]
@@ -1,12 +1,14 @@
 # operations/models.py
 from __future__ import annotations
 
+from collections import defaultdict
 from decimal import Decimal
 from django.db import models
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 
 from master.models import UnitofMeasurementLength, UnitofMeasurement
+from master.rates import convert_many, exchange_rate as dated_exchange_rate
 from core.utils.coreModels import BranchScopedStampedOwnedActive
 
 
@@ -115,7 +117,7 @@ class Shipment(BranchScopedStampedOwnedActive):
     incoterms = models.CharField(max_length=10, choices=Incoterms.choices, blank=True, null=True)
     payment_term = models.CharField(max_length=10, choices=PaymentTerm.choices, default=PaymentTerm.NONE)
 
-    class Meta:
+    class Meta(BranchScopedStampedOwnedActive.Meta):
         ordering = ["-created"]
 
     def __str__(self):
@@ -127,7 +129,7 @@ class ShipmentDocument(BranchScopedStampedOwnedActive):
     document = models.FileField(upload_to="shipment_documents/%Y/%m/")
     description = models.TextField(blank=True, null=True)
 
-    class Meta:
+    class Meta(BranchScopedStampedOwnedActive.Meta):
         ordering = ["-created"]
 
     def __str__(self):
@@ -139,7 +141,7 @@ class ShipmentNote(BranchScopedStampedOwnedActive):
     note = models.CharField(max_length=255)
     description = models.TextField(blank=True, null=True)
 
-    class Meta:
+    class Meta(BranchScopedStampedOwnedActive.Meta):
         ordering = ["-created"]
 
     def __str__(self):
@@ -194,7 +196,7 @@ class ShipmentTransportInfo(BranchScopedStampedOwnedActive):
     tracking_no = models.CharField(max_length=120, blank=True, null=True)
     ground_waybill_no = models.CharField(max_length=120, blank=True, null=True)
 
-    class Meta:
+    class Meta(BranchScopedStampedOwnedActive.Meta):
         ordering = ["-created"]
 
     def __str__(self):
@@ -229,7 +231,7 @@ class ShipmentPackages(BranchScopedStampedOwnedActive):
 
     remarks = models.TextField(blank=True, null=True)
 
-    class Meta:
+    class Meta(BranchScopedStampedOwnedActive.Meta):
         verbose_name = "Packages"
         verbose_name_plural = "Packages"
 
@@ -310,7 +312,10 @@ class PaymentSummary(BranchScopedStampedOwnedActive):
     currency = models.ForeignKey("master.Currency", on_delete=models.PROTECT, null=True, blank=True)
     payment_status = models.CharField(max_length=50, choices=PAYMENT_CHOICES, default="prepaid")
 
-    class Meta:
+    # Totals are recomputed from charges/costings/allocations on every change.
+    history_excluded_fields = ("total_amount", "paid_amount", "total_costings", "paid_costings", "profit_amount")
+
+    class Meta(BranchScopedStampedOwnedActive.Meta):
         verbose_name = "Payment Summary"
         verbose_name_plural = "Payment Summary"
 
@@ -335,6 +340,10 @@ class PaymentSummary(BranchScopedStampedOwnedActive):
         return {"total_amount": self.total_amount, "total_costings": self.total_costings, "profit_amount": self.profit_amount}
 
 
+# Charge-side amounts converted into invoice-side ones ("<name>_charge" -> "<name>_invoice").
+INVOICE_AMOUNT_FIELDS = ("unit_price", "subtotal", "tax_amount", "total_with_tax")
+
+
 class ShipmentLineBase(BranchScopedStampedOwnedActive):
     """
     IMPORTANT CHANGE:
@@ -372,7 +381,8 @@ class ShipmentLineBase(BranchScopedStampedOwnedActive):
 
     charge_currency = models.ForeignKey("master.Currency", on_delete=models.PROTECT, related_name="+", null=True, blank=True)
     invoice_currency = models.ForeignKey("master.Currency", on_delete=models.PROTECT, related_name="+", null=True, blank=True)
-    exchange_rate = models.DecimalField(max_digits=18, decimal_places=6, default=Decimal("1.000000"))
+    # None until set by the client or resolved from the dated rates on save.
+    exchange_rate = models.DecimalField(max_digits=18, decimal_places=6, null=True, blank=True, default=None)
 
     unit_price_charge = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal("0.00"))
     subtotal_charge = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal("0.00"))
@@ -384,7 +394,7 @@ class ShipmentLineBase(BranchScopedStampedOwnedActive):
     tax_amount_invoice = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal("0.00"))
     total_with_tax_invoice = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal("0.00"))
 
-    class Meta:
+    class Meta(BranchScopedStampedOwnedActive.Meta):
         abstract = True
 
     def clean(self):
@@ -394,10 +404,36 @@ class ShipmentLineBase(BranchScopedStampedOwnedActive):
 
         if self.qty is None or self.qty <= 0:
             raise ValidationError({"qty": "Quantity must be > 0."})
-        if self.exchange_rate is None or self.exchange_rate <= 0:
+        if self.exchange_rate is not None and self.exchange_rate <= 0:
             raise ValidationError({"exchange_rate": "Exchange rate must be > 0."})
 
-    def recompute(self):
+    def document_date(self):
+        """
+        Date the line is priced at: its invoice's date once invoiced, else the shipment's.
+        """
+        invoice = getattr(self, "invoice", None)
+        if invoice is not None and invoice.invoice_date:
+            return invoice.invoice_date
+        shipment = self.payment_summary.shipment
+        return shipment.created_date or timezone.localdate(shipment.created)
+
+    def resolve_exchange_rate(self, on_date=None, *, force=False):
+        """
+        Charge -> invoice rate from master.rates on `on_date` (default: the
+        document date; no query once the rate table is loaded). Fills it only
+        while unset, unless `force`; the same currency always converts at 1.
+        """
+        if not (self.charge_currency_id and self.invoice_currency_id):
+            return
+        if self.charge_currency_id == self.invoice_currency_id:
+            self.exchange_rate = Decimal("1.000000")
+        elif force or self.exchange_rate is None:
+            self.exchange_rate = dated_exchange_rate(
+                self.charge_currency_id, self.invoice_currency_id, on_date or self.document_date()
+            )
+
+    def recompute(self, on_date=None):
+        self.resolve_exchange_rate(on_date)
         qty = self.qty or Decimal("0.00")
         rate = self.unit_price_charge or Decimal("0.00")
         tax_rate = (self.tax_rate or Decimal("0.00")) / Decimal("100.00")
@@ -417,6 +453,42 @@ class ShipmentLineBase(BranchScopedStampedOwnedActive):
         self.recompute()
         return super().save(*args, **kwargs)
 
+    @classmethod
+    def reprice(cls, lines, on_date=None) -> list:
+        """
+        Re-reads every line's exchange rate for `on_date` (default: each line's
+        document date), converts the invoice amounts with one convert_many() per
+        invoice currency and writes them with one bulk_update.
+        """
+        lines = list(lines)
+        now = timezone.now()
+        by_currency = defaultdict(list)
+        for line in lines:
+            line_date = on_date or line.document_date()
+            line.resolve_exchange_rate(line_date, force=True)
+            line.recompute(line_date)
+            line.updated = now  # bulk_update skips auto_now
+            if line.charge_currency_id and line.invoice_currency_id:
+                by_currency[line.invoice_currency_id].append((line, line_date))
+
+        for currency_id, priced in by_currency.items():
+            amounts, currencies, dates = [], [], []
+            for line, line_date in priced:
+                for field in INVOICE_AMOUNT_FIELDS:
+                    amounts.append(getattr(line, f"{field}_charge"))
+                    currencies.append(line.charge_currency_id)
+                    dates.append(line_date)
+            converted = iter(convert_many(amounts, currencies, dates, to_currency=currency_id))
+            for line, _line_date in priced:
+                for field in INVOICE_AMOUNT_FIELDS:
+                    setattr(line, f"{field}_invoice", next(converted))
+
+        cls.objects.bulk_update(lines, [
+            "invoice_currency", "exchange_rate", "unit_price_invoice", "subtotal_invoice", "tax_amount_invoice",
+            "total_with_tax_invoice", "updated",
+        ])
+        return lines
+
 
 class ShipmentCharges(ShipmentLineBase):
     """
@@ -435,7 +507,7 @@ class ShipmentCharges(ShipmentLineBase):
     is_invoiced = models.BooleanField(default=False)
     invoiced_at = models.DateTimeField(null=True, blank=True)
 
-    class Meta:
+    class Meta(ShipmentLineBase.Meta):
         verbose_name = "Charges"
         verbose_name_plural = "Charges"
 
@@ -453,6 +525,6 @@ class ShipmentCostings(ShipmentLineBase):
     """
     payment_summary = models.ForeignKey(PaymentSummary, on_delete=models.CASCADE, related_name="shipment_costings")
 
-    class Meta:
+    class Meta(ShipmentLineBase.Meta):
         verbose_name = "Costing"
         verbose_name_plural = "Costing"
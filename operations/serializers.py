@@ -3,6 +3,7 @@
 from rest_framework import serializers
 from rest_framework_bulk.serializers import BulkSerializerMixin
 from core.utils.AdaptedBulkListSerializer import AdaptedBulkListSerializer
+from master.ports import get_port_index
 
 from .utils import READONLY_FIELDS
 from .models import (
@@ -27,6 +28,26 @@ class ShipmentSerializer(BulkSerializerMixin, serializers.ModelSerializer):
         read_only_fields = READONLY_FIELDS
         list_serializer_class = AdaptedBulkListSerializer
 
+    def _resolve_port(self, field_name, value):
+        # Checked against the in-memory port index, so bulk imports make no query per row.
+        index = get_port_index()
+        if not len(index):
+            return value
+        port = index.resolve(value)
+        if port is None:
+            raise serializers.ValidationError(f"Unknown port code: {value}.")
+        # Ports.symbol allows longer codes than the shipment column; keep the matched code then.
+        symbol = port["symbol"]
+        if len(symbol) > Shipment._meta.get_field(field_name).max_length:
+            return value
+        return symbol
+
+    def validate_origin_port(self, value):
+        return self._resolve_port("origin_port", value)
+
+    def validate_destination_port(self, value):
+        return self._resolve_port("destination_port", value)
+
 
 class ShipmentDocumentSerializer(BulkSerializerMixin, serializers.ModelSerializer):
     document_url = serializers.SerializerMethodField()
@@ -9,6 +9,8 @@ from django.core.exceptions import ValidationError
 from operations.models import Shipment, PaymentSummary, ShipmentCharges
 from sales.models import Sales, SalesItem
 from accounting.models import Currency
+from master.rates import exchange_rate
+from actors.exposure import ensure_credit_available
 from actors.models import Customer
 
 
@@ -48,14 +50,23 @@ def generate_invoice_from_shipment(
     if not charges:
         raise ValidationError("No uninvoiced shipment charges found.")
 
+    invoice_date = invoice_date or timezone.localdate()
+    # Bill every line in the invoice currency at the invoice date's rates.
+    repriced = [ch for ch in charges if ch.invoice_currency_id != currency.pk]
+    for ch in repriced:
+        ch.invoice_currency = currency
+    if repriced:
+        ShipmentCharges.reprice(repriced, invoice_date)
+
     inv = Sales.objects.create(
         branch=shipment.branch,
         customer=customer,
         currency=currency,
         reference=reference,
         shipment=shipment,
-        invoice_date=invoice_date or timezone.localdate(),
+        invoice_date=invoice_date,
         due_date=due_date,
+        exchange_rate=exchange_rate(currency, on_date=invoice_date),
         status="draft",
         po_date=timezone.localdate(),
     )
@@ -77,11 +88,12 @@ def generate_invoice_from_shipment(
         ch.mark_invoiced(inv, item)
 
     inv.refresh_from_db()
+    ensure_credit_available(customer, amount=inv.total)
 
     # keep profitability updated (sell/buy/profit)
     ps.recompute_from_lines(save=True)
 
     if auto_finalize_no:
-        inv.finalize_number_if_needed("INV")
+        inv.finalize_number_if_needed()
 
     return inv
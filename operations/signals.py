@@ -4,6 +4,7 @@ from django.db import transaction
 from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
+from core.utils.instrumentation import timed, timed_function
 from operations.models import ShipmentPackages
 from warehouse.models import HandlingUnit
 
@@ -29,6 +30,7 @@ def _get_existing_units(package: ShipmentPackages) -> list[HandlingUnit]:
     )
 
 
+@timed_function("signal.operations.sync_handling_units")
 def _sync_handling_units(package: ShipmentPackages) -> None:
     desired_quantity = int(package.quantity or 0)
     if desired_quantity < 0:
@@ -53,6 +55,7 @@ def _sync_handling_units(package: ShipmentPackages) -> None:
 
 
 @receiver(pre_save, sender=ShipmentPackages)
+@timed_function("signal.operations.pre_save")
 def _cache_old_package_quantity(sender, instance: ShipmentPackages, **kwargs) -> None:
     if not instance.pk:
         instance._previous_quantity = 0
@@ -69,7 +72,8 @@ def _sync_package_handling_units(sender, instance: ShipmentPackages, created: bo
 
 @receiver(post_delete, sender=ShipmentPackages)
 def _delete_package_handling_units(sender, instance: ShipmentPackages, **kwargs) -> None:
-    HandlingUnit.objects.filter(packages=instance).delete()
+    with timed("signal.operations.delete_handling_units"):
+        HandlingUnit.objects.filter(packages=instance).delete()
 
 
 def register_operations_signals() -> None:
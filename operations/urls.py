@@ -4,6 +4,7 @@ from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 
 from .views import (
+    ShipmentAsyncListView,
     ShipmentViewSet,
     ShipmentDocumentViewSet,
     ShipmentNoteViewSet,
@@ -34,5 +35,6 @@ router.register(r"shipment-charges", ShipmentChargesViewSet, basename="shipment-
 router.register(r"shipment-costings", ShipmentCostingsViewSet, basename="shipment-costings")
 
 urlpatterns = [
+    path("async/shipments/", ShipmentAsyncListView.as_view(), name="shipments-async-list"),
     path("", include(router.urls)),
 ]
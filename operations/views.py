@@ -44,6 +44,9 @@ from .filters import (
 )
 
 from core.utils.BaseModelViewSet import BaseModelViewSet
+from core.utils.asyncViews import AsyncListView
+
+
 class ShipmentViewSet(BaseModelViewSet):
     queryset = Shipment.objects.all()
     serializer_class = ShipmentSerializer
@@ -122,3 +125,11 @@ class ShipmentCostingsViewSet(BaseModelViewSet):
     serializer_class = ShipmentCostingsSerializer
     filterset_class = ShipmentCostingsFilter
     search_fields = ["charge_name", "reference_no", "remarks"]
+
+
+class ShipmentAsyncListView(AsyncListView):
+    queryset = Shipment.objects.all()
+    serializer_class = ShipmentSerializer
+    filter_fields = ["branch", "shipment_main_type", "transportation_mode", "direction", "shipment_type", "active"]
+    search_fields = ["doc_ref_no", "origin_port", "destination_port", "shipper", "consignee"]
+    ordering_fields = ["created", "created_date", "scheduled_start_date", "scheduled_end_date"]
@@ -25,7 +25,7 @@ class Vehicle(BranchScopedStampedOwnedActive):
     model = models.CharField(max_length=50, blank=True, null=True)
     capacity = models.PositiveIntegerField(blank=True, null=True, help_text="Load capacity in kg")
     remarks = models.TextField(blank=True, null=True)
-    class Meta: verbose_name="Vehicle"; verbose_name_plural="Vehicles"; indexes=[models.Index(fields=["number_plate"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
+    class Meta(BranchScopedStampedOwnedActive.Meta): verbose_name="Vehicle"; verbose_name_plural="Vehicles"; indexes=[*BranchScopedStampedOwnedActive.Meta.indexes, models.Index(fields=["number_plate"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
     def __str__(self): return f"{self.number_plate} ({self.vehicle_type})"
 
 
@@ -39,7 +39,7 @@ class Rider(BranchScopedStampedOwnedActive):
     address = models.TextField(blank=True, null=True)
     license_number = models.CharField(max_length=50, blank=True, null=True)
     remarks = models.TextField(blank=True, null=True)
-    class Meta: verbose_name="Rider"; verbose_name_plural="Riders"; indexes=[models.Index(fields=["full_name"]), models.Index(fields=["phone"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
+    class Meta(BranchScopedStampedOwnedActive.Meta): verbose_name="Rider"; verbose_name_plural="Riders"; indexes=[*BranchScopedStampedOwnedActive.Meta.indexes, models.Index(fields=["full_name"]), models.Index(fields=["phone"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
     def __str__(self): return f"{self.full_name} - {self.phone}"
 
 
@@ -52,7 +52,7 @@ class PickupRequest(BranchScopedStampedOwnedActive):
     expected_packages = models.PositiveIntegerField()
     remarks = models.TextField(blank=True, null=True)
     status = models.CharField(max_length=50, choices=PICKUP_REQUEST_STATUS, default="PENDING")
-    class Meta: verbose_name="Pickup Request"; verbose_name_plural="Pickup Requests"; ordering=["-created"]; indexes=[models.Index(fields=["status"]), models.Index(fields=["requested_date"]), models.Index(fields=["Customer"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
+    class Meta(BranchScopedStampedOwnedActive.Meta): verbose_name="Pickup Request"; verbose_name_plural="Pickup Requests"; ordering=["-created"]; indexes=[*BranchScopedStampedOwnedActive.Meta.indexes, models.Index(fields=["status"]), models.Index(fields=["requested_date"]), models.Index(fields=["Customer"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
     def __str__(self): return f"PickupRequest {self.code} - {self.Customer}"
 
 
@@ -79,7 +79,7 @@ class PickupOrder(BranchScopedStampedOwnedActive):
     instruction = models.TextField(blank=True, null=True)
     remarks = models.TextField(blank=True, null=True)
     status = models.CharField(max_length=50, choices=PICKUP_REQUEST_STATUS, default="PENDING")
-    class Meta: verbose_name="Pickup Order"; verbose_name_plural="Pickup Orders"; ordering=["-created"]; indexes=[models.Index(fields=["status"]), models.Index(fields=["vendor"]), models.Index(fields=["sender_Customer"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
+    class Meta(BranchScopedStampedOwnedActive.Meta): verbose_name="Pickup Order"; verbose_name_plural="Pickup Orders"; ordering=["-created"]; indexes=[*BranchScopedStampedOwnedActive.Meta.indexes, models.Index(fields=["status"]), models.Index(fields=["vendor"]), models.Index(fields=["sender_Customer"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
     def __str__(self): return f"PickupOrder {self.code} - {self.sender_Customer} → {self.receiver_name}"
 
 
@@ -95,7 +95,7 @@ class PickupPackage(BranchScopedStampedOwnedActive):
     bredth = models.DecimalField(max_digits=10, decimal_places=2)  # keeping your original field name
     width = models.DecimalField(max_digits=10, decimal_places=2)
     length_unit = models.ForeignKey(UnitofMeasurementLength, on_delete=models.PROTECT)
-    class Meta: verbose_name="Pickup Package"; verbose_name_plural="Pickup Packages"; ordering=["-created"]; indexes=[models.Index(fields=["pickup_order"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
+    class Meta(BranchScopedStampedOwnedActive.Meta): verbose_name="Pickup Package"; verbose_name_plural="Pickup Packages"; ordering=["-created"]; indexes=[*BranchScopedStampedOwnedActive.Meta.indexes, models.Index(fields=["pickup_order"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
     def __str__(self): return f"Pkg {self.code} for {self.pickup_order_id} ({self.weight} {self.weight_unit})"
 
 
@@ -105,7 +105,7 @@ class PickupRunsheet(BranchScopedStampedOwnedActive):
     rider = models.ForeignKey(Rider, on_delete=models.PROTECT, blank=True, null=True)
     pickup_orders = models.ManyToManyField(PickupOrder, related_name="pickup_runsheets", blank=True)
     status = models.CharField(max_length=50, choices=PICKUP_REQUEST_STATUS, default="DRAFT")  # FIXED: valid default
-    class Meta: verbose_name="Pickup Runsheet"; verbose_name_plural="Pickup Runsheets"; ordering=["-created"]; indexes=[models.Index(fields=["status"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
+    class Meta(BranchScopedStampedOwnedActive.Meta): verbose_name="Pickup Runsheet"; verbose_name_plural="Pickup Runsheets"; ordering=["-created"]; indexes=[*BranchScopedStampedOwnedActive.Meta.indexes, models.Index(fields=["status"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
     def __str__(self): return f"PickupRunsheet {self.code} - Rider: {self.rider.full_name if self.rider else 'N/A'}"
 
 
@@ -117,7 +117,7 @@ class DeliveryOrder(BranchScopedStampedOwnedActive):
     delivery_date = models.DateField(blank=True, null=True)
     delivered_by = models.ForeignKey(Rider, on_delete=models.SET_NULL, null=True, blank=True)
     remarks = models.TextField(blank=True, null=True)
-    class Meta: verbose_name="Delivery Order"; verbose_name_plural="Delivery Orders"; ordering=["-created"]; indexes=[models.Index(fields=["delivery_status"]), models.Index(fields=["delivery_date"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
+    class Meta(BranchScopedStampedOwnedActive.Meta): verbose_name="Delivery Order"; verbose_name_plural="Delivery Orders"; ordering=["-created"]; indexes=[*BranchScopedStampedOwnedActive.Meta.indexes, models.Index(fields=["delivery_status"]), models.Index(fields=["delivery_date"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
     def __str__(self): return f"Delivery {self.code} - {self.delivery_status}"
 
 
@@ -127,7 +127,7 @@ class DeliveryAttempt(BranchScopedStampedOwnedActive):
     status = models.CharField(max_length=50, default="ATTEMPTED")
     remarks = models.TextField(blank=True, null=True)
     attempt_date = models.DateTimeField(auto_now_add=True)
-    class Meta: verbose_name="Delivery Attempt"; verbose_name_plural="Delivery Attempts"; ordering=["-attempt_date"]; indexes=[models.Index(fields=["delivery_order"]), models.Index(fields=["attempt_number"])]
+    class Meta(BranchScopedStampedOwnedActive.Meta): verbose_name="Delivery Attempt"; verbose_name_plural="Delivery Attempts"; ordering=["-attempt_date"]; indexes=[*BranchScopedStampedOwnedActive.Meta.indexes, models.Index(fields=["delivery_order"]), models.Index(fields=["attempt_number"])]
     def __str__(self): return f"Attempt #{self.attempt_number} - Delivery {self.delivery_order_id}"
 
 
@@ -137,7 +137,7 @@ class ProofOfDelivery(BranchScopedStampedOwnedActive):
     signature = models.ImageField(upload_to="signatures/", blank=True, null=True)
     photo = models.ImageField(upload_to="delivery_photos/", blank=True, null=True)
     delivery_time = models.DateTimeField(auto_now_add=True)
-    class Meta: verbose_name="Proof of Delivery"; verbose_name_plural="Proofs of Delivery"
+    class Meta(BranchScopedStampedOwnedActive.Meta): verbose_name="Proof of Delivery"; verbose_name_plural="Proofs of Delivery"
     def __str__(self): return f"POD for Delivery {self.delivery_order_id}"
 
 
@@ -149,7 +149,7 @@ class DeliveryRunsheet(BranchScopedStampedOwnedActive):
     run_date = models.DateField()
     status = models.CharField(max_length=50, default="CREATED")
     remarks = models.TextField(blank=True, null=True)
-    class Meta: verbose_name="Delivery Runsheet"; verbose_name_plural="Delivery Runsheets"; ordering=["-created"]; indexes=[models.Index(fields=["run_date"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
+    class Meta(BranchScopedStampedOwnedActive.Meta): verbose_name="Delivery Runsheet"; verbose_name_plural="Delivery Runsheets"; ordering=["-created"]; indexes=[*BranchScopedStampedOwnedActive.Meta.indexes, models.Index(fields=["run_date"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
     def __str__(self): return f"DeliveryRunsheet {self.code} - Rider: {self.rider.full_name if self.rider else 'N/A'}"
 
 
@@ -160,7 +160,7 @@ class ReturnToVendor(BranchScopedStampedOwnedActive):
     reason = models.TextField()
     status = models.CharField(max_length=50, default="INITIATED")
     processed_date = models.DateField(blank=True, null=True)
-    class Meta: verbose_name="Return To Vendor"; verbose_name_plural="Returns To Vendor"; ordering=["-created"]; indexes=[models.Index(fields=["vendor"]), models.Index(fields=["status"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
+    class Meta(BranchScopedStampedOwnedActive.Meta): verbose_name="Return To Vendor"; verbose_name_plural="Returns To Vendor"; ordering=["-created"]; indexes=[*BranchScopedStampedOwnedActive.Meta.indexes, models.Index(fields=["vendor"]), models.Index(fields=["status"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
     def __str__(self): return f"RTV {self.code} - {self.vendor}"
 
 
@@ -171,7 +171,7 @@ class RtvBranchReturn(BranchScopedStampedOwnedActive):
     to_branch = models.ForeignKey("master.Branch", on_delete=models.PROTECT, related_name="rtv_to")
     reason = models.TextField()
     status = models.CharField(max_length=50, default="PENDING")
-    class Meta: verbose_name="RTV Branch Return"; verbose_name_plural="RTV Branch Returns"; ordering=["-created"]; indexes=[models.Index(fields=["status"]), models.Index(fields=["from_branch"]), models.Index(fields=["to_branch"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
+    class Meta(BranchScopedStampedOwnedActive.Meta): verbose_name="RTV Branch Return"; verbose_name_plural="RTV Branch Returns"; ordering=["-created"]; indexes=[*BranchScopedStampedOwnedActive.Meta.indexes, models.Index(fields=["status"]), models.Index(fields=["from_branch"]), models.Index(fields=["to_branch"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
     def __str__(self): return f"RTVBranchReturn {self.code} ({self.from_branch} → {self.to_branch})"
 
 
@@ -182,7 +182,7 @@ class DispatchManifest(BranchScopedStampedOwnedActive):
     orders = models.ManyToManyField(PickupOrder, related_name="dispatch_manifests", blank=True)
     dispatch_date = models.DateField()
     status = models.CharField(max_length=50, default="DISPATCHED")
-    class Meta: verbose_name="Dispatch Manifest"; verbose_name_plural="Dispatch Manifests"; ordering=["-created"]; indexes=[models.Index(fields=["dispatch_date"]), models.Index(fields=["status"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
+    class Meta(BranchScopedStampedOwnedActive.Meta): verbose_name="Dispatch Manifest"; verbose_name_plural="Dispatch Manifests"; ordering=["-created"]; indexes=[*BranchScopedStampedOwnedActive.Meta.indexes, models.Index(fields=["dispatch_date"]), models.Index(fields=["status"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
     def __str__(self): return f"DispatchManifest {self.code}"
 
 
@@ -193,5 +193,5 @@ class ReceiveManifest(BranchScopedStampedOwnedActive):
     orders = models.ManyToManyField(PickupOrder, related_name="receive_manifests", blank=True)
     receive_date = models.DateField()
     status = models.CharField(max_length=50, default="RECEIVED")
-    class Meta: verbose_name="Receive Manifest"; verbose_name_plural="Receive Manifests"; ordering=["-created"]; indexes=[models.Index(fields=["receive_date"]), models.Index(fields=["status"]), models.Index(fields=["from_branch"]), models.Index(fields=["to_branch"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
+    class Meta(BranchScopedStampedOwnedActive.Meta): verbose_name="Receive Manifest"; verbose_name_plural="Receive Manifests"; ordering=["-created"]; indexes=[*BranchScopedStampedOwnedActive.Meta.indexes, models.Index(fields=["receive_date"]), models.Index(fields=["status"]), models.Index(fields=["from_branch"]), models.Index(fields=["to_branch"]), models.Index(fields=["branch"]), models.Index(fields=["active"])]
     def __str__(self): return f"ReceiveManifest {self.code}"
@@ -0,0 +1,15 @@
+from django.db.models import Q
+
+from core.utils.aging import AgingSource
+from .models import VendorBills
+
+# Unpaid bills; also the vendor exposure source (purchase.signals).
+# Served at purchase/aging/ once the purchase app is installed and routed.
+VENDOR_BILLS_AGING = AgingSource(
+    VendorBills,
+    party_field="vendor",
+    amount_field="remaining_amount",
+    due_field="due_date",
+    party_name_field="vendor__main_actor__display_name",
+    open_filter=Q(active=True) & ~Q(bill_status__in=["draft", "rejected", "cancelled"]),
+)
@@ -138,7 +138,7 @@ class VendorBillsGroup(BranchScopedStampedOwnedActive):
     status = models.CharField(max_length=50, choices=STATUS_CHOICES, default="pending")
     total_amount = models.DecimalField(default=D0, max_digits=18, decimal_places=2)
 
-    class Meta:
+    class Meta(BranchScopedStampedOwnedActive.Meta):
         ordering = ["-created", "-id"]
         constraints = [
             models.UniqueConstraint(fields=["no"], name="uniq_vendorbillsgroup_no_when_final", condition=~Q(no__startswith="#")),
@@ -210,7 +210,7 @@ class Expenses(BranchScopedStampedOwnedActive):
 
     paid_from = models.ForeignKey("accounting.ChartofAccounts", on_delete=models.PROTECT, related_name="expenses_paid_from", verbose_name="Paid From (Bank Account)")
 
-    class Meta:
+    class Meta(BranchScopedStampedOwnedActive.Meta):
         verbose_name = "Expense"
         verbose_name_plural = "Expenses"
         ordering = ("-date", "-id")
@@ -364,7 +364,7 @@ class VendorBills(TransactionBasedBranchScopedStampedOwnedActive):
     bill_status = models.CharField(choices=BILL_STATUS, default="due", max_length=20, verbose_name="Bill Status")
     remarks = models.TextField(blank=True, null=True, verbose_name="Remarks")
 
-    class Meta:
+    class Meta(TransactionBasedBranchScopedStampedOwnedActive.Meta):
         verbose_name = "Vendor Bill"
         verbose_name_plural = "Vendor Bills"
         ordering = ("-date", "-id")
@@ -374,6 +374,11 @@ class VendorBills(TransactionBasedBranchScopedStampedOwnedActive):
             models.CheckConstraint(check=Q(paid_amount__gte=0), name="vendorbills_paid_non_negative"),
             models.CheckConstraint(check=Q(remaining_amount__gte=0), name="vendorbills_remaining_non_negative"),
         ]
+        indexes = [
+            *TransactionBasedBranchScopedStampedOwnedActive.Meta.indexes,
+            # Open items only: what the aging report and exposure refreshes scan.
+            models.Index(fields=["branch", "due_date"], condition=Q(remaining_amount__gt=0), name="vendorbills_open_due_idx"),
+        ]
 
     def __str__(self):
         return self.no or str(self.pk)
@@ -5,6 +5,9 @@ from django.db import transaction
 from django.db.models.signals import post_save, pre_save
 
 from accounting.models import Accounts
+from actors.exposure import register_exposure_source
+from core.utils.aging import register_aging_source
+from core.utils.instrumentation import timed_function
 from purchase.models import VendorBills, VendorPayments
 
 
@@ -51,6 +54,7 @@ def _snapshot_approval_state(instance) -> None:
     instance._was_applied = _should_apply(old)
 
 
+@timed_function("signal.purchase.account_balance")
 def _adjust_vendor_account_balance(vendor, delta: Decimal) -> None:
     if not vendor or not getattr(vendor, "main_actor", None):
         return
@@ -90,27 +94,44 @@ def _apply_if_approved(instance, vendor, delta: Decimal) -> None:
 
 
 def register_purchase_signals() -> None:
+    @timed_function("signal.purchase.pre_save")
     def _pre_save(sender, instance, **kwargs):
         _snapshot_approval_state(instance)
 
+    @timed_function("signal.purchase.post_save")
     def _vendor_bill_post_save(sender, instance, created, **kwargs):
         _apply_if_approved(instance, instance.vendor, Decimal(instance.total_amount or 0))
 
+    @timed_function("signal.purchase.post_save")
     def _vendor_payment_post_save(sender, instance, created, **kwargs):
         _apply_if_approved(instance, instance.vendor, Decimal(instance.amount or 0) * Decimal("-1"))
 
-    pre_save.connect(_pre_save, sender=VendorBills, dispatch_uid="vendorbills_presave_snapshot")
-    pre_save.connect(_pre_save, sender=VendorPayments, dispatch_uid="vendorpayments_presave_snapshot")
+    pre_save.connect(_pre_save, sender=VendorBills, weak=False, dispatch_uid="vendorbills_presave_snapshot")
+    pre_save.connect(_pre_save, sender=VendorPayments, weak=False, dispatch_uid="vendorpayments_presave_snapshot")
 
-    post_save.connect(_vendor_bill_post_save, sender=VendorBills, dispatch_uid="vendorbills_postsave_account_update")
-    post_save.connect(_vendor_payment_post_save, sender=VendorPayments, dispatch_uid="vendorpayments_postsave_account_update")
+    post_save.connect(_vendor_bill_post_save, sender=VendorBills, weak=False, dispatch_uid="vendorbills_postsave_account_update")
+    post_save.connect(_vendor_payment_post_save, sender=VendorPayments, weak=False, dispatch_uid="vendorpayments_postsave_account_update")
+
+    # Unpaid bills feed the vendor's exposure (what we owe them) and the AP aging report.
+    from purchase.aging import VENDOR_BILLS_AGING
+
+    register_exposure_source(
+        VendorBills,
+        actor_field="vendor",
+        amount_field="remaining_amount",
+        date_field="date",
+        due_field="due_date",
+        open_filter=VENDOR_BILLS_AGING.open_filter,
+    )
+    register_aging_source(VENDOR_BILLS_AGING)
 
     # Optional model hookup (won't crash if missing)
     PurchaseReturn = apps.get_model("purchase", "PurchaseReturn", require_ready=False) if apps.ready else None
     if PurchaseReturn:
+        @timed_function("signal.purchase.post_save")
         def _purchase_return_post_save(sender, instance, created, **kwargs):
             # adjust this field if your model uses supplier instead of vendor
             _apply_if_approved(instance, instance.vendor, Decimal(instance.total or 0) * Decimal("-1"))
 
-        pre_save.connect(_pre_save, sender=PurchaseReturn, dispatch_uid="purchasereturn_presave_snapshot")
-        post_save.connect(_purchase_return_post_save, sender=PurchaseReturn, dispatch_uid="purchasereturn_postsave_account_update")
+        pre_save.connect(_pre_save, sender=PurchaseReturn, weak=False, dispatch_uid="purchasereturn_presave_snapshot")
+        post_save.connect(_purchase_return_post_save, sender=PurchaseReturn, weak=False, dispatch_uid="purchasereturn_postsave_account_update")
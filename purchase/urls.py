@@ -6,7 +6,7 @@ from .views import (
     VendorBillsGroupViewSet, ExpenseCategoryViewSet,
     ExpensesViewSet, ExpensesItemsViewSet,
     VendorBillsViewSet, VendorBillItemsViewSet,
-    VendorPaymentsViewSet, VendorPaymentEntriesViewSet,
+    VendorPaymentsViewSet, VendorPaymentEntriesViewSet, VendorBillsAgingView,
 )
 
 router = DefaultRouter()
@@ -20,5 +20,6 @@ router.register(r"vendor-payments", VendorPaymentsViewSet, basename="vendor-paym
 router.register(r"vendor-payment-entries", VendorPaymentEntriesViewSet, basename="vendor-payment-entries")
 
 urlpatterns = [
+    path("aging/", VendorBillsAgingView.as_view(), name="purchase-aging"),
     path("api/", include(router.urls)),
 ]
@@ -8,6 +8,9 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework.permissions import IsAuthenticated
 
+from core.utils.aging import AgingView
+
+from .aging import VENDOR_BILLS_AGING
 from .models import (
     VendorBillsGroup, ExpenseCategory, Expenses, ExpensesItems,
     VendorBills, VendorBillItems,
@@ -191,3 +194,10 @@ class VendorPaymentEntriesViewSet(BaseModelViewSet):
     serializer_class = VendorPaymentEntriesSerializer
     filterset_class = VendorPaymentEntriesFilter
     ordering_fields = ["id"]
+
+
+class VendorBillsAgingView(AgingView):
+    """
+    Payables aging per vendor (remaining_amount by due date).
+    """
+    aging_source = VENDOR_BILLS_AGING
@@ -0,0 +1,16 @@
+from django.db.models import Q
+
+from core.utils.aging import AgingSource
+from .models import Sales
+
+# Posted invoices with a balance; also the customer exposure source (sales.signals).
+# Served at sales/aging/ once the sales app is installed and routed.
+SALES_AGING = AgingSource(
+    Sales,
+    party_field="customer",
+    amount_field="balance_due",
+    due_field="due_date",
+    date_field="invoice_date",
+    party_name_field="customer__main_actor__display_name",
+    open_filter=Q(active=True) & ~Q(status__in=["draft", "void"]),
+)
@@ -11,8 +11,11 @@ from django.core.exceptions import ValidationError
 from django.utils import timezone
 
 from accounting.models import BankAccounts, ChequeRegister, Currency
+from actors.exposure import schedule_exposure_refresh
 from actors.models import Customer
 from operations.models import Shipment, ShipmentTransportInfo, PaymentSummary
+from core.utils.versionedCache import bump_model_version_on_commit
+from master.singletons import document_prefix
 from core.utils.coreModels import BranchScopedStampedOwnedActive, TransactionBasedBranchScopedStampedOwnedActive
 
 
@@ -81,7 +84,7 @@ class Sales(TransactionBasedBranchScopedStampedOwnedActive):
     paid_amount = models.DecimalField(max_digits=20, decimal_places=2, default=0)
     balance_due = models.DecimalField(max_digits=20, decimal_places=2, default=0)
 
-    class Meta:
+    class Meta(TransactionBasedBranchScopedStampedOwnedActive.Meta):
         ordering = ["-created", "-id"]
         constraints = [
             models.UniqueConstraint(fields=["no"], name="uniq_sales_no_when_final", condition=~Q(no__startswith="#")),
@@ -89,15 +92,23 @@ class Sales(TransactionBasedBranchScopedStampedOwnedActive):
             models.CheckConstraint(check=Q(paid_amount__gte=0), name="sales_paid_non_negative"),
             models.CheckConstraint(check=Q(balance_due__gte=0), name="sales_balance_non_negative"),
         ]
-        indexes = [models.Index(fields=["no"]), models.Index(fields=["customer"])]
+        indexes = [
+            *TransactionBasedBranchScopedStampedOwnedActive.Meta.indexes,
+            models.Index(fields=["no"]),
+            models.Index(fields=["customer"]),
+            # Open items only: what the aging report and exposure refreshes scan.
+            models.Index(fields=["branch", "due_date"], condition=Q(balance_due__gt=0), name="sales_open_due_idx"),
+        ]
 
     def __str__(self):
         return f"Invoice {self.no or self.id} - {self.customer}"
 
     @transaction.atomic
-    def finalize_number_if_needed(self, prefix="INV"):
+    def finalize_number_if_needed(self, prefix=None):
         if self.no and not self.no.startswith("#"):
             return
+        # "INV" numbered invoices before prefixes were configurable; keep it until one is set.
+        prefix = prefix or document_prefix("sales_prefix", default="INV")
         self.no = generate_unique_no(prefix, type(self), date_field="created")
         self.save(update_fields=["no"])
 
@@ -125,11 +136,15 @@ class Sales(TransactionBasedBranchScopedStampedOwnedActive):
 
         if save_self:
             type(self).objects.filter(pk=self.pk).update(
+                updated=timezone.now(),
                 total=self.total,
                 paid_amount=self.paid_amount,
                 balance_due=self.balance_due,
                 status=self.status,
             )
+            # queryset.update() sends no post_save.
+            schedule_exposure_refresh(self)
+            bump_model_version_on_commit(type(self))
         return {"total": self.total, "paid_amount": self.paid_amount, "balance_due": self.balance_due, "status": self.status}
 
 
@@ -1,6 +1,9 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction
 from rest_framework import serializers
 
+from actors.exposure import ensure_credit_available
+
 from .models import Sales, SalesItem, CustomerPayment, CustomerPaymentItems
 
 
@@ -34,6 +37,10 @@ class SalesSerializer(serializers.ModelSerializer):
         for item in items:
             SalesItem.objects.create(sales=sale, **item)
         sale.recompute_totals(save_self=True)
+        try:
+            ensure_credit_available(sale.customer, amount=sale.total)
+        except DjangoValidationError as e:
+            raise serializers.ValidationError(e.message_dict)
         return sale
 
     @transaction.atomic
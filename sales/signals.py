@@ -5,6 +5,9 @@ from django.db import transaction
 from django.db.models.signals import post_save, pre_save
 
 from accounting.models import Accounts
+from actors.exposure import register_exposure_source
+from core.utils.aging import register_aging_source
+from core.utils.instrumentation import timed_function
 
 
 def _norm(s) -> str:
@@ -44,6 +47,7 @@ def _snapshot_approval_state(instance) -> None:
     instance._was_applied = _should_apply(old)
 
 
+@timed_function("signal.sales.account_balance")
 def _adjust_customer_account_balance(customer, delta: Decimal) -> None:
     if not customer or not getattr(customer, "main_actor", None):
         return
@@ -96,24 +100,41 @@ def register_sales_signals() -> None:
     except LookupError:
         SalesReturn = None
 
+    @timed_function("signal.sales.pre_save")
     def _pre_save(sender, instance, **kwargs):
         _snapshot_approval_state(instance)
 
+    @timed_function("signal.sales.post_save")
     def _sales_post_save(sender, instance, created, **kwargs):
         _apply_if_approved(instance, Decimal(getattr(instance, "total", 0) or 0))
 
+    @timed_function("signal.sales.post_save")
     def _payment_post_save(sender, instance, created, **kwargs):
         _apply_if_approved(instance, Decimal(getattr(instance, "amount", 0) or 0) * Decimal("-1"))
 
-    pre_save.connect(_pre_save, sender=Sales, dispatch_uid="sales_presave_snapshot")
-    pre_save.connect(_pre_save, sender=CustomerPayment, dispatch_uid="custpay_presave_snapshot")
+    pre_save.connect(_pre_save, sender=Sales, weak=False, dispatch_uid="sales_presave_snapshot")
+    pre_save.connect(_pre_save, sender=CustomerPayment, weak=False, dispatch_uid="custpay_presave_snapshot")
 
-    post_save.connect(_sales_post_save, sender=Sales, dispatch_uid="sales_postsave_account_update")
-    post_save.connect(_payment_post_save, sender=CustomerPayment, dispatch_uid="custpay_postsave_account_update")
+    post_save.connect(_sales_post_save, sender=Sales, weak=False, dispatch_uid="sales_postsave_account_update")
+    post_save.connect(_payment_post_save, sender=CustomerPayment, weak=False, dispatch_uid="custpay_postsave_account_update")
+
+    # Open invoices feed the customer's credit exposure and the AR aging report.
+    from .aging import SALES_AGING
+
+    register_exposure_source(
+        Sales,
+        actor_field="customer",
+        amount_field="balance_due",
+        date_field="invoice_date",
+        due_field="due_date",
+        open_filter=SALES_AGING.open_filter,
+    )
+    register_aging_source(SALES_AGING)
 
     if SalesReturn:
+        @timed_function("signal.sales.post_save")
         def _sales_return_post_save(sender, instance, created, **kwargs):
             _apply_if_approved(instance, Decimal(getattr(instance, "total", 0) or 0) * Decimal("-1"))
 
-        pre_save.connect(_pre_save, sender=SalesReturn, dispatch_uid="salesreturn_presave_snapshot")
-        post_save.connect(_sales_return_post_save, sender=SalesReturn, dispatch_uid="salesreturn_postsave_account_update")
+        pre_save.connect(_pre_save, sender=SalesReturn, weak=False, dispatch_uid="salesreturn_presave_snapshot")
+        post_save.connect(_sales_return_post_save, sender=SalesReturn, weak=False, dispatch_uid="salesreturn_postsave_account_update")
@@ -1,7 +1,7 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import SalesViewSet, SalesItemViewSet, CustomerPaymentViewSet, CustomerPaymentItemsViewSet
+from .views import SalesViewSet, SalesItemViewSet, CustomerPaymentViewSet, CustomerPaymentItemsViewSet, SalesAgingView
 
 router = DefaultRouter()
 router.register(r"sales", SalesViewSet, basename="sales")
@@ -10,5 +10,6 @@ router.register(r"customer-payments", CustomerPaymentViewSet, basename="customer
 router.register(r"customer-payment-items", CustomerPaymentItemsViewSet, basename="customer-payment-items")
 
 urlpatterns = [
+    path("aging/", SalesAgingView.as_view(), name="sales-aging"),
     path("", include(router.urls)),
 ]
@@ -6,6 +6,9 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 
+from core.utils.aging import AgingView
+
+from .aging import SALES_AGING
 from .models import Sales, SalesItem, CustomerPayment, CustomerPaymentItems
 from .serializers import (
     SalesSerializer,
@@ -116,3 +119,10 @@ class CustomerPaymentItemsViewSet(BaseModelViewSet):
     serializer_class = CustomerPaymentItemsSerializer
     filterset_class = CustomerPaymentItemsFilter
     ordering_fields = ["id", "created", "updated"]
+
+
+class SalesAgingView(AgingView):
+    """
+    Receivables aging per customer (balance_due by due date).
+    """
+    aging_source = SALES_AGING
@@ -101,6 +101,10 @@ class HandlingUnit(BranchScopedStampedOwnedActive):
     barcode = models.CharField(max_length=80, null=True, blank=True)
     user_add = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.PROTECT, null=True, blank=True, editable=False, default=get_current_user, related_name="hu_user_add")
 
+    # Status transitions are logged as InventoryMove rows by log_move().
+    history_skip_when_only = ("status",)
+    history_retention_days = 180
+
     def __str__(self):
         return self.hu_code
 
@@ -205,6 +209,10 @@ class Inventory(BranchScopedStampedOwnedActive):
     last_moved_at = models.DateTimeField(null=True, blank=True)
     user_add = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.PROTECT, null=True, blank=True, editable=False, default=get_current_user, related_name="inventory_user_add")
 
+    # Relocations are logged as InventoryMove rows by log_move().
+    history_skip_when_only = ("location", "last_moved_at", "branch", "user_add")
+    history_retention_days = 180
+
     def __str__(self):
         return f"{self.handling_unit_id} @ {self.location_id}"
 